@@ -0,0 +1,204 @@
+"""
+Typed per-session state and per-session memory accounting.
+
+The form, the user profile and the last generated document are `__slots__` dataclasses:
+one instance per session, no per-instance `__dict__`, and a fixed set of attributes that a
+typo cannot silently extend. `SessionState` is the single accessor the app goes through:
+
+    state = SessionState(st.session_state, form_defaults)
+    state.form                       # FormState snapshot of the form widgets
+    state.form = FormState(...)      # writes every field back to its widget
+    state.profile.email              # ProfileState, stored in the session
+    state.output.text                # OutputState, stored in the session
+
+The form fields stay individual session keys because Streamlit binds each widget to its
+key; `form` reads and writes them together. Profile and output live in the session as one
+object each.
+
+`session_memory` walks a session's values and reports its size in bytes and its largest
+keys, so the memory cost of N concurrent users can be estimated from real sessions. If the
+interpreter traces allocations (`PYTHONTRACEMALLOC=1` or `python -X tracemalloc`), the
+process-wide traced heap is reported too.
+"""
+import sys
+import tracemalloc
+import types
+from collections import deque
+from dataclasses import dataclass, field, fields
+from typing import Any, MutableMapping, Optional
+
+TOP_KEYS = 10
+
+
+@dataclass(slots=True)
+class FormState:
+    """Values of the main form's widgets, keyed like the widgets themselves."""
+    name_input: str = ""
+    job_title_input: str = ""
+    company_input: str = ""
+    skills_input: str = ""
+    experience_input: str = ""
+    doc_type: str = ""
+    tone_select: str = ""
+    language_select: str = ""
+    resume_length_select: str = ""
+    cl_length_select: str = ""
+    career_level_select: str = ""
+    industry_select: str = ""
+    education_input: str = ""
+    projects_input: str = ""
+    achievements_input: str = ""
+    certifications_input: str = ""
+    portfolio_link_input: str = ""
+
+    def as_dict(self) -> dict:
+        return {name: getattr(self, name) for name in FORM_FIELDS}
+
+
+FORM_FIELDS = tuple(f.name for f in fields(FormState))
+
+
+@dataclass(slots=True)
+class ProfileState:
+    """The user's contact details, used to pre-fill the form."""
+    full_name: str = ""
+    email: str = ""
+    phone: str = ""
+    linkedin: str = ""
+    portfolio: str = ""
+
+
+@dataclass(slots=True)
+class OutputState:
+    """The last generated document."""
+    text: str = ""             # A `GenerationResult` after a generation, a plain str when loaded from history
+    doc_type: str = ""
+    html_preview: str = ""
+
+    def clear(self) -> None:
+        self.text = ""
+        self.doc_type = ""
+        self.html_preview = ""
+
+
+class SessionState:
+    """Typed accessor over a Streamlit session state (or any mutable mapping)."""
+
+    __slots__ = ("_session", "_form_defaults")
+
+    PROFILE_KEY = "profile"
+    OUTPUT_KEY = "output"
+
+    def __init__(self, session: MutableMapping, form_defaults: FormState):
+        """
+        Args:
+            session (MutableMapping): `st.session_state`.
+            form_defaults (FormState): Values of fields that have no session key yet.
+        """
+        self._session = session
+        self._form_defaults = form_defaults
+
+    @property
+    def form(self) -> FormState:
+        defaults = self._form_defaults
+        return FormState(*(self._session.get(name, getattr(defaults, name)) for name in FORM_FIELDS))
+
+    @form.setter
+    def form(self, value: FormState) -> None:
+        for name in FORM_FIELDS:
+            self._session[name] = getattr(value, name)
+
+    def _stored(self, key: str, factory) -> Any:
+        if key not in self._session:
+            self._session[key] = factory()
+        return self._session[key]
+
+    @property
+    def profile(self) -> ProfileState:
+        return self._stored(self.PROFILE_KEY, ProfileState)
+
+    @property
+    def output(self) -> OutputState:
+        return self._stored(self.OUTPUT_KEY, OutputState)
+
+
+# --- Memory accounting ---
+
+_SHARED_TYPES = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.MethodType)
+
+
+def _slot_names(cls: type) -> list:
+    names = []
+    for klass in cls.__mro__:
+        slots = klass.__dict__.get("__slots__", ())
+        names.extend([slots] if isinstance(slots, str) else slots)
+    return names
+
+
+def deep_sizeof(obj: Any, seen: Optional[set] = None) -> int:
+    """
+    Bytes held by an object and everything it references, each object counted once.
+
+    Containers, instance `__dict__`s and `__slots__` are followed; classes, modules and
+    functions (shared by every session) are not.
+
+    Args:
+        obj: Any object.
+        seen (set): Ids already counted; pass the same set to size several objects without
+            double-counting what they share.
+    """
+    seen = set() if seen is None else seen
+    total, stack = 0, [obj]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen or isinstance(item, _SHARED_TYPES):
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item)
+        if isinstance(item, (str, bytes, int, float, bool)) or item is None:
+            continue
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset, deque)):
+            stack.extend(item)
+        else:
+            if hasattr(item, "__dict__"):
+                stack.append(item.__dict__)
+            for name in _slot_names(type(item)):
+                value = getattr(item, name, None)
+                if value is not None:
+                    stack.append(value)
+    return total
+
+
+@dataclass
+class MemoryReport:
+    """Size of one session's state."""
+    total_bytes: int
+    top_keys: list = field(default_factory=list)   # (key, bytes), largest first
+    traced_bytes: Optional[int] = None              # Process-wide heap, if tracemalloc is tracing
+
+    def rows(self) -> list:
+        """The largest keys as flat dicts, ready for `st.dataframe`."""
+        return [{"Key": key, "KB": round(size / 1024, 1)} for key, size in self.top_keys]
+
+
+def session_memory(session: MutableMapping, top: int = TOP_KEYS) -> MemoryReport:
+    """
+    Measures a session's state.
+
+    Objects shared by several keys are counted once, under the first key that reaches them.
+
+    Args:
+        session (MutableMapping): `st.session_state`.
+        top (int): Number of keys to list.
+
+    Returns:
+        MemoryReport: Total bytes, the `top` largest keys, and the traced process heap if available.
+    """
+    seen: set = set()
+    sizes = [(str(key), deep_sizeof(value, seen)) for key, value in list(session.items())]
+    sizes.sort(key=lambda item: item[1], reverse=True)
+    traced = tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None
+    return MemoryReport(sum(size for _, size in sizes), sizes[:top], traced)
@@ -0,0 +1,289 @@
+"""
+ATS (Applicant Tracking System) match scoring of a resume against job keywords.
+
+Both sides go through the same pipeline: Unicode/case normalization, tokenization that
+keeps terms like "c++", "ci/cd" and "node.js" intact, removal of bare version numbers
+("Python 3" -> "python"), light suffix stemming ("APIs" -> "api", "managing" -> "manag")
+and canonicalization through the skills alias table of `gemini_api.keywords`
+("ML" -> Machine Learning, "k8s" -> Kubernetes).
+
+A resume is analyzed once into a `ResumeProfile`: known skills are found with a
+token-level Aho-Corasick automaton over every alias in a single pass over the full text.
+A list of job keywords is compiled once into a `KeywordSet`, whose other phrases (of any
+length) get an Aho-Corasick automaton of their own. Scoring a profile against a keyword
+set looks skills up in the profile and scans the resume tokens with the phrase automaton,
+only when every token of some phrase occurs in the resume, so one resume can be scored
+against many thousands of keyword sets per second:
+
+    profile = analyze_resume(resume_text)
+    keyword_set = compile_keywords(required="Python, ML, AWS", nice_to_have="Kafka")
+    result = score(profile, keyword_set)
+    result.score, result.missing_required
+"""
+import re
+import unicodedata
+from functools import lru_cache
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, Optional, Union
+
+from gemini_api.keywords import SKILL_LEXICON, AMBIGUOUS_NAMES, tokenize
+
+REQUIRED_WEIGHT = 2.0
+NICE_TO_HAVE_WEIGHT = 1.0
+
+_VERSION = re.compile(r"^v?\d+(?:\.\d+)*[x+]?$")
+_TERM_SEPARATORS = re.compile(r"[,;\n|•]+")
+_BULLET = re.compile(r"^\s*(?:[-*▪●]|\d+[.)])\s+")
+
+
+# --- Normalization ---
+
+@lru_cache(maxsize=65536)
+def stem(token: str) -> str:
+    """
+    Light, deterministic suffix stripper (plurals, -ing, -ed, trailing -e).
+
+    Aggressive stemmers conflate too much for skill names; this one only has to make
+    "APIs"/"API", "managing"/"managed"/"manage" and "databases"/"database" agree.
+    """
+    if len(token) <= 3 or not token.isalpha():
+        return token
+    if token.endswith("ies") and len(token) > 4:
+        token = token[:-3] + "y"
+    elif token.endswith(("sses", "xes", "ches", "shes", "zes")):
+        token = token[:-2]
+    elif token.endswith("s") and not token.endswith(("ss", "us")) and not (token.endswith("is") and len(token) > 4):
+        token = token[:-1]
+    for suffix in ("ing", "ed"):
+        if token.endswith(suffix) and len(token) - len(suffix) >= 3:
+            base = token[:-len(suffix)]
+            if any(vowel in base for vowel in "aeiouy"):
+                token = base
+                if len(token) > 3 and token[-1] == token[-2] and token[-1] not in "lsz":
+                    token = token[:-1]  # running -> run
+                break
+    if token.endswith("e") and len(token) > 4:
+        token = token[:-1]
+    return token
+
+
+def normalize_tokens(text: str) -> list:
+    """Normalized, stemmed token sequence of a text, shared by resumes and keywords."""
+    if not text.isascii():
+        text = unicodedata.normalize("NFKD", text)
+        text = "".join(c for c in text if not unicodedata.combining(c))
+    tokens = []
+    for token in tokenize(text.replace("-", " ")):
+        if _VERSION.match(token):
+            continue  # "Python 3", "Java 17", "5+" years
+        tokens.append(stem(token))
+    return tokens
+
+
+# --- Aho-Corasick over token sequences ---
+
+class AhoCorasick:
+    """
+    Token-level Aho-Corasick automaton: finds every occurrence of many token-sequence
+    patterns in one left-to-right pass, in time linear in the text plus the matches.
+    """
+
+    def __init__(self, patterns: Iterable[tuple]):
+        """
+        Args:
+            patterns: (token_tuple, payload) pairs. Payloads of duplicate patterns are kept together.
+        """
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+        for tokens, payload in patterns:
+            if not tokens:
+                continue
+            state = 0
+            for token in tokens:
+                next_state = self._goto[state].get(token)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][token] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                state = next_state
+            self._output[state].append((len(tokens), payload))
+        self._build_failure_links()
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(token, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def iter_matches(self, tokens: list) -> Iterator[tuple]:
+        """Yields (start_index, length, payload) for every pattern occurrence, overlaps included."""
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for index, token in enumerate(tokens):
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            for length, payload in output[state]:
+                yield index - length + 1, length, payload
+
+
+def _build_lexicon() -> tuple:
+    alias_to_skill = {}
+    for canonical, aliases in SKILL_LEXICON.items():
+        names = aliases if canonical in AMBIGUOUS_NAMES else (canonical, *aliases)
+        for alias in names:
+            key = tuple(normalize_tokens(alias))
+            if key:
+                alias_to_skill.setdefault(key, canonical)
+    return alias_to_skill, AhoCorasick(alias_to_skill.items())
+
+
+ALIAS_TO_SKILL, SKILL_AUTOMATON = _build_lexicon()
+
+
+# --- Resumes and keyword sets ---
+
+@dataclass
+class ResumeProfile:
+    """Pre-analyzed resume: canonical skills found and the normalized token sequence."""
+    skills: frozenset
+    tokens: tuple
+    vocabulary: frozenset    # Distinct tokens, to skip phrase scans that cannot match
+
+    @property
+    def token_count(self) -> int:
+        return len(self.tokens)
+
+
+def analyze_resume(text: str) -> ResumeProfile:
+    """Analyzes a resume (or any candidate text) once for repeated scoring."""
+    tokens = tuple(normalize_tokens(text))
+    skills = frozenset(payload for _, _, payload in SKILL_AUTOMATON.iter_matches(tokens))
+    return ResumeProfile(skills, tokens, frozenset(tokens))
+
+
+@dataclass(frozen=True)
+class Term:
+    """One job keyword: the text shown to the user and the key it is matched by."""
+    display: str
+    key: Union[str, tuple]   # Canonical skill name, or a normalized token tuple
+    weight: float
+    required: bool
+
+
+@dataclass
+class KeywordSet:
+    """Compiled job keywords, ready to be scored against many resumes."""
+    terms: list
+    total_weight: float
+    phrase_automaton: Optional[AhoCorasick] = None   # Over the keys of the non-skill terms
+
+
+def parse_terms(text: Union[str, Iterable[str], None]) -> list:
+    """Splits a comma/semicolon/line separated keyword list, dropping bullets and blanks."""
+    if not text:
+        return []
+    items = _TERM_SEPARATORS.split(text) if isinstance(text, str) else text
+    terms = []
+    for item in items:
+        item = _BULLET.sub("", item).strip().strip(".")
+        if item:
+            terms.append(item)
+    return terms
+
+
+def _term_key(term: str) -> Optional[Union[str, tuple]]:
+    tokens = tuple(normalize_tokens(term))
+    if not tokens:
+        return None
+    return ALIAS_TO_SKILL.get(tokens, tokens)
+
+
+def compile_keywords(required: Union[str, Iterable[str], None], nice_to_have: Union[str, Iterable[str], None] = None,
+                     required_weight: float = REQUIRED_WEIGHT, nice_to_have_weight: float = NICE_TO_HAVE_WEIGHT) -> KeywordSet:
+    """
+    Compiles required and nice-to-have keywords into a `KeywordSet`.
+
+    Duplicates (after normalization and alias resolution, e.g. "ML" and "machine learning")
+    count once; a term listed as both required and nice-to-have counts as required.
+
+    Args:
+        required: Required keywords, as a comma/line separated string or an iterable.
+        nice_to_have: Optional keywords, same format.
+        required_weight (float): Weight of each required keyword.
+        nice_to_have_weight (float): Weight of each nice-to-have keyword.
+
+    Returns:
+        KeywordSet: The compiled keyword set.
+    """
+    terms, seen = [], set()
+    for raw_terms, weight, is_required in ((parse_terms(required), required_weight, True),
+                                           (parse_terms(nice_to_have), nice_to_have_weight, False)):
+        for raw in raw_terms:
+            key = _term_key(raw)
+            if key is None or key in seen:
+                continue
+            seen.add(key)
+            terms.append(Term(raw, key, weight, is_required))
+    phrases = [(term.key, term.key) for term in terms if isinstance(term.key, tuple)]
+    return KeywordSet(terms, sum(term.weight for term in terms), AhoCorasick(phrases) if phrases else None)
+
+
+@dataclass
+class ATSResult:
+    """Outcome of scoring one resume against one keyword set."""
+    score: float                      # Weighted match, 0-100
+    required_coverage: float          # Share of required keywords found, 0-100
+    matched_required: list = field(default_factory=list)
+    missing_required: list = field(default_factory=list)
+    matched_optional: list = field(default_factory=list)
+    missing_optional: list = field(default_factory=list)
+
+
+def phrase_matches(profile: ResumeProfile, keyword_set: KeywordSet) -> frozenset:
+    """Keys of the keyword set's phrase terms that occur in the resume."""
+    automaton = keyword_set.phrase_automaton
+    if automaton is None:
+        return frozenset()
+    if not any(isinstance(term.key, tuple) and profile.vocabulary.issuperset(term.key) for term in keyword_set.terms):
+        return frozenset()
+    return frozenset(payload for _, _, payload in automaton.iter_matches(profile.tokens))
+
+
+def score(profile: ResumeProfile, keyword_set: KeywordSet) -> ATSResult:
+    """Scores a pre-analyzed resume against a compiled keyword set."""
+    result = ATSResult(0.0, 0.0)
+    matched_weight = 0.0
+    required_total = required_found = 0
+    phrases = phrase_matches(profile, keyword_set)
+    for term in keyword_set.terms:
+        key = term.key
+        found = key in profile.skills if isinstance(key, str) else key in phrases
+        if term.required:
+            required_total += 1
+            required_found += found
+            (result.matched_required if found else result.missing_required).append(term.display)
+        else:
+            (result.matched_optional if found else result.missing_optional).append(term.display)
+        if found:
+            matched_weight += term.weight
+    if keyword_set.total_weight:
+        result.score = round(100.0 * matched_weight / keyword_set.total_weight, 2)
+    if required_total:
+        result.required_coverage = round(100.0 * required_found / required_total, 2)
+    return result
+
+
+def score_text(resume_text: str, required: Union[str, Iterable[str]], nice_to_have: Union[str, Iterable[str], None] = None) -> ATSResult:
+    """One-shot convenience wrapper: analyze, compile and score."""
+    return score(analyze_resume(resume_text), compile_keywords(required, nice_to_have))
@@ -0,0 +1,203 @@
+"""
+`app.py` rerun time and payload through Streamlit's AppTest, against the offline fake backend.
+
+Measures full reruns of the login page, the main page, the page with a generated document,
+and the page with each entry of the `ai_tool_select` menu open; then, on the page with a
+generated document, the rerun of each `st.fragment` alone (what a widget inside that
+fragment triggers).
+
+The time reported is the script run itself. The compiled script is shared between runs, as
+it is by a Streamlit server; AppTest would otherwise recompile `app.py` on every run.
+
+Each page also reports what the browser receives:
+    first_paint_ms   Time from the start of a new session's first run to its first element.
+    first_run_kb     Messages sent by that first run.
+    rerun_kb         Messages sent by a rerun, to a browser that kept the previous run's
+                     messages: Streamlit then replaces each cacheable message it already
+                     sent (see `global.minCachedMessageSize`) with a reference to its hash.
+"""
+import argparse
+import dataclasses
+import inspect
+import os
+import time
+from typing import Optional
+
+from common import REPO_ROOT, summarize, use_fake_backend, write_results
+
+use_fake_backend()
+
+from streamlit.runtime.forward_msg_cache import create_reference_msg  # noqa: E402
+from streamlit.runtime.scriptrunner import ScriptRunnerEvent  # noqa: E402
+from streamlit.runtime.scriptrunner.script_cache import ScriptCache  # noqa: E402
+from streamlit.testing.v1 import AppTest, app_test, local_script_runner  # noqa: E402
+
+from app_state import OutputState  # noqa: E402
+
+AI_TOOLS = [
+    "Resume: Generate Keywords from Job Description",
+    "Resume: Critique Section",
+    "Resume: Convert Experience to Bullet Points",
+    "Resume: Achievement Statement Builder",
+    "Resume: Power Verb Suggester",
+    "Resume: Section Expander",
+    "Resume: Section Summarizer",
+    "Cover Letter: Opening/Closing Suggester",
+    "Interview: Generate Interview Questions",
+    "Interview: Behavioral Question Prompter (STAR)",
+    "Interview: Interview Answer Evaluator",
+    "Interview: Post-Interview Thank You Note",
+    "Networking: LinkedIn Profile Summary Suggestions",
+    "Networking: Message Composer",
+    "Career: Skill Gap Analyzer",
+    "Career: Career Path Explorer",
+    "Career: Learning Resource Recommender",
+    "Career: Salary Negotiation Script Generator",
+    "Job Search: Job Description Analyzer (Upload)",
+    "Job Search: Job Matcher (Local Corpus)",
+    "Job Search: Batch Resume Screening",
+    "Job Search: Resume/CL Checklist",
+]
+
+SAMPLE_OUTPUT = "Results-driven engineer with 8 years of experience building scalable systems. " * 6
+
+
+@dataclasses.dataclass
+class _Run:
+    """One script run as seen by the browser."""
+    seconds: float = 0.0
+    first_paint: Optional[float] = None     # Seconds until the first element was sent
+    payload_bytes: int = 0                  # Sent to a browser with nothing cached
+    cached_payload_bytes: int = 0           # Sent to a browser that kept the session's earlier messages
+
+
+class _TimedScriptRunner(local_script_runner.LocalScriptRunner):
+    """AppTest's script runner with a shared bytecode cache, optional fragment-only runs and run statistics."""
+
+    script_cache = ScriptCache()
+    fragment_ids: list = []     # Non-empty: the next runs only execute these fragments
+    runs: list = []             # `_Run` per script run
+    browser_cache: set = set()  # Hashes of the cacheable messages the current session's browser received
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._script_cache = self.script_cache
+        if self.fragment_ids:
+            # The initial request would otherwise coalesce any fragment run into a full run
+            self._requests._rerun_data = dataclasses.replace(self._requests._rerun_data, fragment_id_queue=list(self.fragment_ids))
+        self.on_event.connect(self._record_message, weak=False)
+
+    def _record_message(self, sender, event, **kwargs):
+        if event != ScriptRunnerEvent.ENQUEUE_FORWARD_MSG:
+            return
+        run, msg = _TimedScriptRunner.runs[-1], kwargs["forward_msg"]
+        if run.first_paint is None and msg.WhichOneof("type") == "delta" and msg.delta.WhichOneof("type") == "new_element":
+            run.first_paint = time.perf_counter() - self._run_started
+        size = msg.ByteSize()
+        run.payload_bytes += size
+        if msg.metadata.cacheable and msg.hash in self.browser_cache:
+            run.cached_payload_bytes += create_reference_msg(msg).ByteSize()
+        else:
+            run.cached_payload_bytes += size
+            if msg.metadata.cacheable:
+                self.browser_cache.add(msg.hash)
+
+    def request_rerun(self, rerun_data):
+        if self.fragment_ids:
+            rerun_data = dataclasses.replace(rerun_data, fragment_id_queue=list(self.fragment_ids))
+        return super().request_rerun(rerun_data)
+
+    def _run_script(self, rerun_data):
+        run = _Run()
+        _TimedScriptRunner.runs.append(run)
+        self._run_started = time.perf_counter()
+        try:
+            return super()._run_script(rerun_data)
+        finally:
+            run.seconds = time.perf_counter() - self._run_started
+
+
+app_test.LocalScriptRunner = _TimedScriptRunner
+
+
+def _app(state: dict) -> AppTest:
+    """A new session of the app after its first full run with the given session state."""
+    _TimedScriptRunner.browser_cache = set()
+    at = AppTest.from_file(os.path.join(REPO_ROOT, "app.py"), default_timeout=60)
+    for key, value in state.items():
+        at.session_state[key] = value
+    at.run()
+    if at.exception:
+        raise RuntimeError(f"app.py raised: {at.exception}")
+    return at
+
+
+def _timed_run(at: AppTest, fragment_ids: list) -> _Run:
+    _TimedScriptRunner.fragment_ids = fragment_ids
+    try:
+        at.run()
+    finally:
+        _TimedScriptRunner.fragment_ids = []
+    if at.exception:
+        raise RuntimeError(f"app.py raised: {at.exception}")
+    return _TimedScriptRunner.runs[-1]
+
+
+def _time_reruns(state: dict, reruns: int) -> dict:
+    """Times `reruns` full reruns with the given session state, plus the first run's paint time and payloads."""
+    at = _app(state)
+    first_run = _TimedScriptRunner.runs[-1]
+    reruns_done = [_timed_run(at, []) for _ in range(reruns)]
+    return dict(
+        summarize([run.seconds for run in reruns_done]),
+        first_paint_ms=round((first_run.first_paint or 0.0) * 1000, 4),
+        first_run_kb=round(first_run.payload_bytes / 1024, 2),
+        rerun_kb=round(reruns_done[-1].cached_payload_bytes / 1024, 2),
+    )
+
+
+def _time_fragment_reruns(state: dict, reruns: int) -> dict:
+    """Times `reruns` reruns of each fragment alone, keyed by the fragment function's name."""
+    at = _app(state)
+    fragments = {}
+    for fragment_id, fragment in at._fragment_storage._fragments.items():
+        function = inspect.getclosurevars(fragment).nonlocals.get("non_optional_func")
+        fragments[getattr(function, "__name__", fragment_id)] = fragment_id
+    results = {}
+    for name, fragment_id in fragments.items():
+        samples = []
+        for _ in range(reruns):
+            # AppTest keeps only the elements of the last run: redraw the page before each
+            # fragment run so the widgets outside the fragment still exist, as in a browser
+            _timed_run(at, [])
+            samples.append(_timed_run(at, [fragment_id]).seconds)
+        results[f"fragment: {name}"] = summarize(samples)
+    return results
+
+
+def run(reruns: int = 10) -> dict:
+    _app({})  # Compiles app.py into the shared cache, so no page's first run pays for it
+    logged_in = {"current_user": "vmduser"}
+    with_output = dict(logged_in, output=OutputState(SAMPLE_OUTPUT, "Resume"), doc_type="Resume")
+    results = {
+        "page_login": _time_reruns({}, reruns),
+        "page_main": _time_reruns(logged_in, reruns),
+        "page_output": _time_reruns(with_output, reruns),
+    }
+    for tool in AI_TOOLS:
+        results[f"tool: {tool}"] = _time_reruns(dict(with_output, ai_tool_select=tool), reruns)
+    results.update(_time_fragment_reruns(with_output, reruns))
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--reruns", type=int, default=10)
+    parser.add_argument("--json", default="benchmarks/results/app.json")
+    args = parser.parse_args()
+    results = run(args.reruns)
+    for name, stats in results.items():
+        print(f"{name:60s} p50 {stats['p50_ms']:8.1f} ms" + (
+            f"  first paint {stats['first_paint_ms']:6.1f} ms  first run {stats['first_run_kb']:6.1f} KB"
+            f"  rerun {stats['rerun_kb']:6.1f} KB" if "rerun_kb" in stats else ""))
+    write_results(args.json, {"app": results})
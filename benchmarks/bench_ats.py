@@ -0,0 +1,52 @@
+"""Throughput of the ATS scorer: resume analysis, keyword compilation and scoring."""
+import argparse
+import random
+import time
+
+from common import summarize, time_call, use_fake_backend, write_results
+
+use_fake_backend()
+
+import ats_scoring  # noqa: E402
+
+RESUME = """
+Senior Software Engineer with 8 years of experience building machine-learning platforms in Python 3 and Go.
+Designed RESTful APIs and event-driven microservices on Amazon Web Services (Lambda, DynamoDB, S3) and k8s.
+Led a team of six engineers, mentoring junior developers and driving CI/CD adoption with GitHub Actions.
+Built data pipelines with Airflow and Spark; tuned PostgreSQL queries and Redis caching for a 40% latency cut.
+Strong communication and stakeholder management; agile/scrum delivery; test-driven development.
+""" * 4
+
+VOCABULARY = [
+    "Python", "Java", "ML", "machine learning", "AWS", "GCP", "Kafka", "SQL", "Docker", "Kubernetes",
+    "React", "team leadership", "data pipelines", "REST APIs", "Golang", "Rust", "Terraform", "Airflow",
+    "PostgreSQL", "Redis", "CI/CD", "stakeholder management", "TDD", "microservices", "Spark", "Scala",
+]
+
+
+def run(keyword_sets: int = 5000, repeat: int = 200) -> dict:
+    rng = random.Random(0)
+    sets = [ats_scoring.compile_keywords(rng.sample(VOCABULARY, 8), rng.sample(VOCABULARY, 4))
+            for _ in range(keyword_sets)]
+    profile = ats_scoring.analyze_resume(RESUME)
+    started = time.perf_counter()
+    for keyword_set in sets:
+        ats_scoring.score(profile, keyword_set)
+    elapsed = time.perf_counter() - started
+    return {
+        "analyze_resume": time_call(lambda: ats_scoring.analyze_resume(RESUME), repeat=repeat),
+        "compile_keywords": time_call(lambda: ats_scoring.compile_keywords(VOCABULARY[:12], VOCABULARY[12:]), repeat=repeat),
+        "score": summarize([elapsed / keyword_sets]),
+        "keyword_sets_per_second": round(keyword_sets / elapsed),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--keyword-sets", type=int, default=5000)
+    parser.add_argument("--json", default="benchmarks/results/ats.json")
+    args = parser.parse_args()
+    results = run(args.keyword_sets)
+    print(f"analyze_resume p50 {results['analyze_resume']['p50_ms']:.3f} ms, "
+          f"{results['keyword_sets_per_second']} keyword sets/s")
+    write_results(args.json, {"ats": results})
@@ -0,0 +1,68 @@
+"""End-to-end latency of `_safe_generate_content` through the cache, limiter and retry layers."""
+import argparse
+import itertools
+
+from common import time_call, use_fake_backend, write_results
+
+use_fake_backend()
+
+import gemini_api  # noqa: E402
+from gemini_api.backends import FakeBackend  # noqa: E402
+from gemini_api.cache import ResponseCache  # noqa: E402
+from gemini_api.resilience import CircuitBreaker  # noqa: E402
+
+PROMPT = gemini_api._generate_cover_letter_prompt(
+    "Jane Doe", "Senior Software Engineer", "Acme", "Python, SQL, AWS",
+    "Designed and shipped scalable services. " * 20,
+)
+
+
+def _unique_prompts():
+    counter = itertools.count()
+    return lambda: gemini_api._safe_generate_content(f"{PROMPT}\n#{next(counter)}")
+
+
+def run(repeat: int = 500) -> dict:
+    fast = FakeBackend(latency="constant:0")
+    gemini_api.set_backend(fast)
+    gemini_api.retry_policy.base_delay = 0.0
+    gemini_api.circuit_breaker = CircuitBreaker(failure_threshold=10**9)
+    results = {}
+
+    # Every call misses the cache: lookup + limiter + backend + store in both tiers
+    results["cache_miss"] = time_call(_unique_prompts(), repeat=repeat)
+
+    # Same prompt every time: served from the in-process LRU tier
+    results["memory_hit"] = time_call(lambda: gemini_api._safe_generate_content(PROMPT), repeat=repeat)
+
+    # Memory tier disabled: every call is answered by SQLite
+    original_cache = gemini_api.response_cache
+    gemini_api.response_cache = ResponseCache(max_entries=0, db_path=original_cache.db_path)
+    results["disk_hit"] = time_call(lambda: gemini_api._safe_generate_content(PROMPT), repeat=repeat)
+
+    # No cache at all: limiter + retry wrapper + backend only
+    gemini_api.response_cache = None
+    results["no_cache"] = time_call(lambda: gemini_api._safe_generate_content(PROMPT), repeat=repeat)
+
+    # 30% transient failures: cost of the retry path (backoff disabled)
+    gemini_api.set_backend(FakeBackend(latency="constant:0", failure_rate=0.3, failure_kinds={"transient": 1.0}))
+    results["retry_30pct_failures"] = time_call(_unique_prompts(), repeat=repeat)
+
+    # Realistic-ish latency: 10 ms backend, cache miss every time
+    gemini_api.set_backend(FakeBackend(latency="constant:10"))
+    results["backend_10ms"] = time_call(_unique_prompts(), repeat=max(20, repeat // 10))
+
+    gemini_api.response_cache = original_cache
+    gemini_api.set_backend(fast)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=500)
+    parser.add_argument("--json", default="benchmarks/results/generate.json")
+    args = parser.parse_args()
+    results = run(args.repeat)
+    for name, stats in results.items():
+        print(f"{name:24s} p50 {stats['p50_ms']:8.3f} ms  p99 {stats['p99_ms']:8.3f} ms")
+    write_results(args.json, {"generate": results})
@@ -0,0 +1,70 @@
+"""BM25 job description index: build, top-k query latency, incremental updates and save/load."""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from common import summarize, time_call, use_fake_backend, write_results
+
+use_fake_backend()
+
+import jd_index  # noqa: E402
+
+VOCABULARY = (
+    "python java golang rust typescript react node aws gcp azure kubernetes docker terraform kafka spark "
+    "airflow sql postgresql redis machine learning data pipelines microservices rest apis ci/cd agile scrum "
+    "stakeholder management team leadership mentoring product analytics testing security compliance design "
+    "customer experience budget forecasting operations logistics marketing sales negotiation reporting"
+).split()
+FILLER = "we are looking for a motivated engineer to join our team and work on challenging problems with".split()
+QUERY = "Python, AWS, k8s, machine learning, data pipelines. Led a team of six engineers building REST APIs."
+
+
+def _corpus(documents: int, rng: random.Random) -> list:
+    corpus = []
+    for number in range(documents):
+        words = rng.choices(VOCABULARY, k=rng.randint(40, 120)) + rng.choices(FILLER, k=rng.randint(150, 400))
+        rng.shuffle(words)
+        corpus.append((f"jd-{number}", f"Job {number}\n" + " ".join(words)))
+    return corpus
+
+
+def run(documents: int = 5000, repeat: int = 200) -> dict:
+    rng = random.Random(0)
+    corpus = _corpus(documents, rng)
+    index = jd_index.JDIndex()
+    started = time.perf_counter()
+    for doc_id, text in corpus:
+        index.add(doc_id, text)
+    build_seconds = time.perf_counter() - started
+
+    path = os.path.join(tempfile.mkdtemp(prefix="vmd_bench_"), "jd_index.bm25")
+    save = time_call(lambda: index.save(path), repeat=5)
+    load = time_call(lambda: jd_index.JDIndex.load(path), repeat=5)
+    updates = corpus[:100]
+    started = time.perf_counter()
+    for doc_id, text in updates:
+        index.remove(doc_id)
+        index.add(doc_id, text)
+    update_seconds = time.perf_counter() - started
+    return {
+        "documents": documents,
+        "build_docs_per_second": round(documents / build_seconds),
+        "search_top10": time_call(lambda: index.search(QUERY, 10), repeat=repeat),
+        "replace_document": summarize([update_seconds / len(updates)]),
+        "save": save,
+        "load": load,
+        "bytes_on_disk": os.path.getsize(path),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--documents", type=int, default=5000)
+    parser.add_argument("--json", default="benchmarks/results/jd_index.json")
+    args = parser.parse_args()
+    results = run(args.documents)
+    print(f"{results['documents']} documents, search p50 {results['search_top10']['p50_ms']:.3f} ms, "
+          f"{results['bytes_on_disk']} bytes on disk")
+    write_results(args.json, {"jd_index": results})
@@ -0,0 +1,52 @@
+"""Prompt construction cost of every gemini_api generator (no model calls)."""
+import argparse
+
+from common import time_call, use_fake_backend, write_results
+
+use_fake_backend()
+
+import gemini_api  # noqa: E402
+
+LONG_TEXT = ("Designed and shipped scalable services in Python and Go. Led a team of five engineers. " * 40).strip()
+
+SAMPLE_ARGS = {
+    "generate_resume_summary": ("Jane Doe", "Senior Software Engineer", "Python, SQL, AWS", LONG_TEXT, "Formal", "English", "Standard"),
+    "generate_cover_letter": ("Jane Doe", "Senior Software Engineer", "Acme", "Python, SQL, AWS", LONG_TEXT, "Formal", "English", "Standard"),
+    "generate_keywords": (LONG_TEXT, "software engineering role"),
+    "generate_interview_questions": (LONG_TEXT, "Python, Kubernetes, leadership", "Behavioral"),
+    "critique_resume_section": (LONG_TEXT, "Experience", "Senior Software Engineer"),
+    "generate_bullet_points_from_experience": (LONG_TEXT, "Senior Software Engineer", 5),
+    "generate_achievement_statement": ("Maintained the CI pipeline", "Cut build times by 40%"),
+    "generate_linkedin_summary": ("Python, Cloud, Leadership", LONG_TEXT),
+    "analyze_job_description": (LONG_TEXT, "ATS Alignment Advice", "Senior Software Engineer", LONG_TEXT, "Python, SQL"),
+    "generate_power_verbs": ("Senior Software Engineer",),
+    "expand_resume_section": ("Managed team projects", "Experience Bullet Point", "Engineering Manager"),
+    "summarize_resume_section": (LONG_TEXT, "Experience", 3),
+    "generate_thank_you_note": ("Alex", "Acme", "Senior Software Engineer", "2025-01-15", "Team culture, Kubernetes migration"),
+    "generate_networking_message": ("Data Scientist", "Head of ML", "Informational interview", "Same university"),
+    "generate_career_path_suggestions": ("Python, SQL, Statistics", LONG_TEXT, "Data Analyst"),
+    "generate_learning_resources": ("Kubernetes", "DevOps Engineer"),
+    "generate_salary_negotiation_script": ("Engineer", "Acme", "$80,000", "$90,000 - $100,000", "Led migration, cut costs 20%"),
+    "generate_interview_answer_critique": ("Tell me about a conflict.", LONG_TEXT, "Engineering Manager"),
+}
+
+
+def run(repeat: int = 2000) -> dict:
+    results = {}
+    for name, args in SAMPLE_ARGS.items():
+        builder = getattr(gemini_api, f"_{name}_prompt")
+        stats = time_call(lambda: builder(*args), repeat=repeat, warmup=50)
+        stats["prompt_chars"] = len(builder(*args))
+        results[name] = stats
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=2000)
+    parser.add_argument("--json", default="benchmarks/results/prompts.json")
+    args = parser.parse_args()
+    results = run(args.repeat)
+    for name, stats in results.items():
+        print(f"{name:42s} p50 {stats['p50_ms'] * 1000:8.2f} us  ({stats['prompt_chars']} chars)")
+    write_results(args.json, {"prompts": results})
@@ -0,0 +1,53 @@
+"""Batch screening of many resumes against one job description, versus one ATS estimate per resume."""
+import argparse
+import random
+import time
+
+from common import use_fake_backend, write_results
+
+use_fake_backend()
+
+import ats_scoring  # noqa: E402
+from bench_ats import RESUME, VOCABULARY  # noqa: E402
+
+REQUIRED = "Python, AWS, k8s, Kafka, data pipelines, team leadership"
+NICE_TO_HAVE = "Terraform, Rust, REST APIs"
+JOB_DESCRIPTION = "Senior data engineer: Python, AWS, Kafka and Airflow pipelines; lead a small team; Terraform a plus."
+
+
+def _resumes(candidates: int) -> dict:
+    rng = random.Random(0)
+    words = RESUME.split()
+    return {f"candidate-{number}.txt": " ".join(rng.sample(words, 150) + rng.sample(VOCABULARY, 6))
+            for number in range(candidates)}
+
+
+def run(candidates: int = 3000) -> dict:
+    try:
+        import screening
+    except ImportError as e:
+        return {"skipped": str(e)}
+    resumes = _resumes(candidates)
+    started = time.perf_counter()
+    screening.screen(resumes, REQUIRED, NICE_TO_HAVE, job_description=JOB_DESCRIPTION)
+    batch_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    for text in resumes.values():
+        ats_scoring.score_text(text, REQUIRED, NICE_TO_HAVE)
+    loop_seconds = time.perf_counter() - started
+    return {
+        "candidates": candidates,
+        "batch_seconds": round(batch_seconds, 4),
+        "per_resume_loop_seconds": round(loop_seconds, 4),
+        "speedup": round(loop_seconds / batch_seconds, 2),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--candidates", type=int, default=3000)
+    parser.add_argument("--json", default="benchmarks/results/screening.json")
+    args = parser.parse_args()
+    results = run(args.candidates)
+    print(results)
+    write_results(args.json, {"screening": results})
@@ -0,0 +1,61 @@
+"""Hashed n-gram embedding speed, and open/search/add latency of a memory-mapped vector store."""
+import argparse
+import itertools
+import os
+import tempfile
+import time
+
+from common import time_call, use_fake_backend, write_results
+
+use_fake_backend()
+
+from bench_ats import RESUME  # noqa: E402
+
+
+def run(rows: int = 50000, repeat: int = 50) -> dict:
+    try:
+        import numpy as np
+        import vector_store
+    except ImportError as e:
+        return {"skipped": str(e)}
+    path = os.path.join(tempfile.mkdtemp(prefix="vmd_bench_"), "store")
+    store = vector_store.VectorStore(path)
+    store.add("seed", RESUME)
+    # Bulk-fill with random unit vectors; embedding each row would only measure `embed` again
+    rng = np.random.default_rng(0)
+    with open(f"{path}.f32", "r+b") as f, open(f"{path}.jsonl", "a", encoding="utf-8") as meta:
+        f.seek(0, os.SEEK_END)
+        for start in range(1, rows, 10000):
+            block = rng.standard_normal((min(10000, rows - start), vector_store.DIMENSIONS)).astype(np.float32)
+            block /= np.linalg.norm(block, axis=1, keepdims=True)
+            f.write(block.tobytes())
+            meta.writelines(f'{{"id": "row-{row}", "row": {row}}}\n' for row in range(start, start + len(block)))
+        f.seek(0)
+        f.write(vector_store._HEADER.pack(vector_store._MAGIC, vector_store.DIMENSIONS, rows, 0))
+
+    started = time.perf_counter()
+    opened = vector_store.VectorStore(path)
+    open_seconds = time.perf_counter() - started
+    search = time_call(lambda: opened.search("python data pipelines on aws", k=5), repeat=repeat)
+    filtered = time_call(lambda: opened.search("python data pipelines on aws", k=5, where=lambda meta: True), repeat=repeat)
+    counter = itertools.count(rows)
+    add = time_call(lambda: opened.add(f"row-{next(counter)}", RESUME), repeat=repeat)
+    return {
+        "rows": rows,
+        "bytes_on_disk": os.path.getsize(f"{path}.f32"),
+        "embed_resume": time_call(lambda: vector_store.embed(RESUME), repeat=repeat),
+        "open_seconds": round(open_seconds, 4),
+        "search_top5": search,
+        "search_top5_filtered": filtered,
+        "add": add,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--json", default="benchmarks/results/vector_store.json")
+    args = parser.parse_args()
+    results = run(args.rows)
+    print(results)
+    write_results(args.json, {"vector_store": results})
@@ -0,0 +1,83 @@
+"""Shared helpers for the offline benchmark suite."""
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def use_fake_backend(latency: str = "constant:0", failure_rate: float = 0.0) -> None:
+    """
+    Points gemini_api at the deterministic offline backend with a throwaway cache.
+
+    Must run before gemini_api is imported: the settings are read from the environment.
+    """
+    os.environ["VMD_LLM_BACKEND"] = "fake"
+    os.environ["VMD_FAKE_LATENCY"] = latency
+    os.environ["VMD_FAKE_FAILURE_RATE"] = str(failure_rate)
+    os.environ["VMD_CACHE_PATH"] = os.path.join(tempfile.mkdtemp(prefix="vmd_bench_"), "responses.sqlite3")
+    os.environ["VMD_RATE_LIMIT_RPM"] = "1000000000"
+    os.environ["VMD_RATE_LIMIT_TPM"] = "1000000000000"
+    os.environ["VMD_MAX_CONCURRENCY"] = "1024"
+    if REPO_ROOT not in sys.path:
+        sys.path.insert(0, REPO_ROOT)
+
+
+def summarize(samples: list) -> dict:
+    """Latency summary (milliseconds) of a list of durations in seconds."""
+    ordered = sorted(samples)
+
+    def pct(p):
+        return ordered[min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))] * 1000
+
+    return {
+        "n": len(ordered),
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 4),
+        "p50_ms": round(pct(50), 4),
+        "p95_ms": round(pct(95), 4),
+        "p99_ms": round(pct(99), 4),
+        "min_ms": round(ordered[0] * 1000, 4),
+        "max_ms": round(ordered[-1] * 1000, 4),
+    }
+
+
+def time_call(fn, repeat: int = 200, warmup: int = 5) -> dict:
+    """Times `fn()` `repeat` times after `warmup` untimed calls."""
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return summarize(samples)
+
+
+def run_metadata() -> dict:
+    """Identifies the code and machine a result file was produced with."""
+    try:
+        revision = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                                  text=True, cwd=REPO_ROOT).stdout.strip()
+    except OSError:
+        revision = ""
+    return {
+        "git_revision": revision or None,
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+    }
+
+
+def write_results(path: str, results: dict) -> None:
+    """Writes benchmark results plus run metadata as JSON."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"meta": run_metadata(), "results": results}, f, indent=2)
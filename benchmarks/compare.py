@@ -0,0 +1,41 @@
+"""
+Compares two benchmark reports written by the suite and prints the p50 change per benchmark.
+
+    python benchmarks/compare.py benchmarks/results/before.json benchmarks/results/after.json
+"""
+import argparse
+import json
+
+
+def _flatten(results: dict, prefix: str = "") -> dict:
+    flat = {}
+    for name, value in results.items():
+        if isinstance(value, dict) and "p50_ms" in value:
+            flat[prefix + name] = value
+        elif isinstance(value, dict):
+            flat.update(_flatten(value, f"{prefix}{name}/"))
+    return flat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("before")
+    parser.add_argument("after")
+    parser.add_argument("--metric", default="p50_ms", help="Summary field to compare (p50_ms, p95_ms, mean_ms, ...).")
+    args = parser.parse_args()
+
+    with open(args.before, encoding="utf-8") as f:
+        before = _flatten(json.load(f)["results"])
+    with open(args.after, encoding="utf-8") as f:
+        after = _flatten(json.load(f)["results"])
+
+    for name in sorted(before.keys() & after.keys()):
+        old, new = before[name][args.metric], after[name][args.metric]
+        change = (new - old) / old * 100 if old else 0.0
+        print(f"{name:70s} {old:10.3f} -> {new:10.3f} ms  {change:+7.1f}%")
+    for name in sorted(before.keys() ^ after.keys()):
+        print(f"{name:70s} only in {'before' if name in before else 'after'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Import-time benchmark (a summarized `python -X importtime` report).
+
+Usage:
+    python benchmarks/import_time.py                      # report for `import gemini_api`
+    python benchmarks/import_time.py app --top 25         # any importable module
+    python benchmarks/import_time.py --max-ms 150 --json import_time.json
+
+Each module is imported in a fresh interpreter, so the numbers are cold-start costs.
+With --max-ms the script exits non-zero when the median total exceeds the budget, which
+makes startup regressions visible in CI.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure(module: str) -> list:
+    """
+    Imports `module` in a fresh interpreter with -X importtime.
+
+    Returns:
+        list: (self_us, cumulative_us, depth, name) for every imported module, in import order.
+    """
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, env=env, cwd=REPO_ROOT,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{proc.stderr[-2000:]}")
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((int(self_us), int(cumulative_us), depth, name.strip()))
+    return rows
+
+
+def summarize(module: str, repeat: int = 5, top: int = 15) -> dict:
+    """Runs `measure` `repeat` times and reports the median total plus the most expensive imports."""
+    runs = [measure(module) for _ in range(repeat)]
+    totals = [next(cum for _, cum, _, name in reversed(rows) if name == module) for rows in runs]
+    last = runs[-1]
+    heaviest = sorted(last, key=lambda row: row[1], reverse=True)
+    return {
+        "module": module,
+        "python": sys.version.split()[0],
+        "repeat": repeat,
+        "total_ms_median": round(statistics.median(totals) / 1000, 2),
+        "total_ms_min": round(min(totals) / 1000, 2),
+        "modules_imported": len(last),
+        "top_cumulative": [
+            {"module": name, "cumulative_ms": round(cum / 1000, 2), "self_ms": round(self_us / 1000, 2)}
+            for self_us, cum, _, name in heaviest[:top]
+        ],
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("module", nargs="?", default="gemini_api")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--json", help="Write the report to this JSON file.")
+    parser.add_argument("--max-ms", type=float, help="Fail if the median import time exceeds this budget.")
+    args = parser.parse_args(argv)
+
+    report = summarize(args.module, args.repeat, args.top)
+    print(f"import {report['module']}: {report['total_ms_median']:.1f} ms median "
+          f"({report['modules_imported']} modules, {args.repeat} runs)")
+    for row in report["top_cumulative"]:
+        print(f"  {row['cumulative_ms']:9.2f} ms  {row['self_ms']:8.2f} ms self  {row['module']}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    if args.max_ms is not None and report["total_ms_median"] > args.max_ms:
+        print(f"FAIL: exceeds budget of {args.max_ms:.1f} ms", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,51 @@
+"""
+Runs the whole offline benchmark suite and writes one JSON report.
+
+    python benchmarks/run_all.py --json benchmarks/results/baseline.json
+
+No API key or network is needed: every model call goes to `FakeBackend`. The Streamlit
+rerun benchmarks are skipped (and reported as such) when streamlit is not installed.
+"""
+import argparse
+
+from common import use_fake_backend, write_results
+
+use_fake_backend()
+
+import bench_ats  # noqa: E402
+import bench_generate  # noqa: E402
+import bench_jd_index  # noqa: E402
+import bench_prompts  # noqa: E402
+import bench_screening  # noqa: E402
+import bench_vector_store  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=500, help="Iterations per prompt/generation benchmark.")
+    parser.add_argument("--reruns", type=int, default=10, help="Timed reruns per app page.")
+    parser.add_argument("--skip-app", action="store_true", help="Skip the Streamlit rerun benchmarks.")
+    parser.add_argument("--json", default="benchmarks/results/all.json")
+    args = parser.parse_args()
+
+    results = {
+        "prompts": bench_prompts.run(args.repeat),
+        "generate": bench_generate.run(args.repeat),
+        "ats": bench_ats.run(),
+        "jd_index": bench_jd_index.run(),
+        "screening": bench_screening.run(),
+        "vector_store": bench_vector_store.run(),
+    }
+    if not args.skip_app:
+        try:
+            import bench_app
+        except ImportError as e:
+            results["app"] = {"skipped": str(e)}
+        else:
+            results["app"] = bench_app.run(args.reruns)
+    write_results(args.json, results)
+    print(f"Wrote {args.json}")
+
+
+if __name__ == "__main__":
+    main()
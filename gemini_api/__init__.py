@@ -0,0 +1,629 @@
+import os
+import threading
+from typing import Optional
+
+from dotenv import load_dotenv
+
+from .backends import Backend, create_backend
+from .cache import ResponseCache, make_cache_key
+from . import chunking, keywords, metrics, prompts
+from .errors import (
+    CircuitOpenError,
+    DeadlineExceededError,
+    EmptyResponseError,
+    GenerationError,
+    GenerationResult,
+    InvalidRequestError,
+    RateLimitedError,
+    TransientGenerationError,
+)
+from .metrics import CallRecord, instrumented
+from .ratelimit import ModelRateLimiter, estimate_tokens
+from .resilience import CircuitBreaker, RetryPolicy, call_with_retry, call_with_retry_async
+
+# Load environment variables from .env file
+load_dotenv()
+
+# Select the LLM backend (VMD_LLM_BACKEND=gemini|fake|http, see gemini_api.backends).
+# The Gemini backend uses 'gemini-2.0-flash' for free tier access and reads GEMINI_API_KEY
+# from your .env file or environment; 'fake' and 'http' run without network access or a key.
+# The backend (and with it google.generativeai) is built lazily on first use and memoized,
+# so importing this module does no network setup and app cold starts stay fast.
+GENERATION_CONFIG = {}
+_backend: Optional[Backend] = None
+_backend_lock = threading.Lock()
+
+def get_backend() -> Backend:
+    """Returns the backend serving every generator in this module, creating it on first use."""
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                _backend = create_backend(generation_config=GENERATION_CONFIG)
+    return _backend
+
+def set_backend(new_backend: Backend) -> None:
+    """Replaces the backend at runtime (e.g. with a FakeBackend in benchmarks)."""
+    global _backend
+    _backend = new_backend
+
+def __getattr__(name: str):
+    # Keep `gemini_api.backend` / `gemini_api.model` working without constructing them at import time
+    if name == "backend":
+        return get_backend()
+    if name == "model":
+        return get_backend().model
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Response cache shared by every generator in this module.
+# Identical requests (same model, prompt and config) are served without a model round trip.
+# Set VMD_CACHE_DISABLED=1 to turn it off, or VMD_CACHE_PATH="" to keep it in memory only.
+response_cache = None
+if os.getenv("VMD_CACHE_DISABLED", "").lower() not in ("1", "true", "yes"):
+    response_cache = ResponseCache(
+        max_entries=int(os.getenv("VMD_CACHE_SIZE", "256")),
+        ttl_seconds=float(os.getenv("VMD_CACHE_TTL", "3600")),
+        db_path=os.getenv("VMD_CACHE_PATH", os.path.join(".vmd_cache", "responses.sqlite3")),
+        max_disk_entries=int(os.getenv("VMD_CACHE_DISK_ENTRIES", "20000")),
+        max_disk_bytes=int(os.getenv("VMD_CACHE_DISK_BYTES", str(64 * 1024 * 1024))),
+    )
+
+# Client-side rate limiter shared by every caller of the backend.
+# Defaults match the gemini-2.0-flash free tier (15 requests/min, 1M tokens/min).
+# Callers over the quota queue for a slot; on 429/RESOURCE_EXHAUSTED the adaptive concurrency
+# limit backs off and the request is retried by the retry policy below.
+rate_limiter = ModelRateLimiter(
+    requests_per_minute=float(os.getenv("VMD_RATE_LIMIT_RPM", "15")),
+    tokens_per_minute=float(os.getenv("VMD_RATE_LIMIT_TPM", "1000000")),
+    max_concurrency=int(os.getenv("VMD_MAX_CONCURRENCY", "8")),
+)
+
+# Per-call deadline, jittered retries for transient errors, and a circuit breaker that fails
+# fast while the backend is unhealthy, so one slow upstream call cannot hold a script thread.
+retry_policy = RetryPolicy(
+    max_attempts=int(os.getenv("VMD_RETRY_ATTEMPTS", "3")),
+    deadline=float(os.getenv("VMD_DEADLINE_SECONDS", "30")),
+)
+circuit_breaker = CircuitBreaker(
+    failure_threshold=int(os.getenv("VMD_BREAKER_THRESHOLD", "5")),
+    reset_timeout=float(os.getenv("VMD_BREAKER_RESET_SECONDS", "30")),
+)
+
+# Per-call latency/token metrics (see gemini_api.metrics); VMD_METRICS_PORT serves them for scraping
+if os.getenv("VMD_METRICS_PORT"):
+    metrics.start_http_server(int(os.getenv("VMD_METRICS_PORT")))
+
+# Inputs longer than VMD_CHUNK_TOKENS (estimated) are analyzed map-reduce style, in chunks
+# sent concurrently (see gemini_api.chunking)
+CHUNK_TOKENS = int(os.getenv("VMD_CHUNK_TOKENS", "3000"))
+CHUNK_CONCURRENCY = int(os.getenv("VMD_CHUNK_CONCURRENCY", "8"))
+
+def _cache_lookup(prompt: str) -> tuple[Optional[str], Optional[str]]:
+    """Returns (cache_key, cached_text) for a prompt; both are None when caching is disabled."""
+    if response_cache is None:
+        return None, None
+    cache_key = make_cache_key(get_backend().name, prompt, GENERATION_CONFIG)
+    return cache_key, response_cache.get(cache_key)
+
+def _response_text(response, cache_key: Optional[str]) -> str:
+    """Extracts text from a backend response and caches it; raises EmptyResponseError if there is none."""
+    text = response.text
+    # An empty response usually indicates content filtering or an upstream issue
+    if not text:
+        raise EmptyResponseError("the model returned an empty response")
+    if cache_key is not None:
+        response_cache.set(cache_key, text)
+    return text
+
+def _cache_status(cache_key: Optional[str], cached: Optional[str]) -> str:
+    if cache_key is None:
+        return "disabled"
+    return "miss" if cached is None else "hit"
+
+def _call_model(prompt: str, timeout: float, record: Optional[CallRecord] = None):
+    """Performs one model call through the rate limiter, bounded by `timeout` seconds."""
+    if record is not None:
+        record.attempts += 1
+    with rate_limiter.slot(prompt, timeout) as slot:
+        response = get_backend().generate(prompt, slot.timeout)
+        slot.record_usage(response)
+        return response
+
+async def _call_model_async(prompt: str, timeout: float, record: Optional[CallRecord] = None):
+    """Async counterpart of `_call_model`."""
+    if record is not None:
+        record.attempts += 1
+    async with rate_limiter.slot_async(prompt, timeout) as slot:
+        response = await get_backend().generate_async(prompt, slot.timeout)
+        slot.record_usage(response)
+        return response
+
+def generate_content(prompt: str) -> str:
+    """
+    Sends a prompt to the model and returns the generated text, raising on failure.
+    Args:
+        prompt (str): The prompt string to send to the model.
+    Returns:
+        str: The generated text content.
+    Raises:
+        GenerationError: A typed error (RateLimitedError, DeadlineExceededError, CircuitOpenError, ...).
+    """
+    with metrics.track_call() as record:
+        cache_key, cached = _cache_lookup(prompt)
+        record.cache = _cache_status(cache_key, cached)
+        if cached is not None:
+            return cached
+        response = call_with_retry(lambda timeout: _call_model(prompt, timeout, record), retry_policy, circuit_breaker)
+        record.record_usage(response, prompt)
+        return _response_text(response, cache_key)
+
+async def generate_content_async(prompt: str) -> str:
+    """Async counterpart of `generate_content`."""
+    with metrics.track_call() as record:
+        cache_key, cached = _cache_lookup(prompt)
+        record.cache = _cache_status(cache_key, cached)
+        if cached is not None:
+            return cached
+        response = await call_with_retry_async(lambda timeout: _call_model_async(prompt, timeout, record),
+                                               retry_policy, circuit_breaker)
+        record.record_usage(response, prompt)
+        return _response_text(response, cache_key)
+
+def _error_result(error: GenerationError) -> GenerationResult:
+    print(f"Error during AI generation: {error!r}") # Log error for debugging
+    return GenerationResult(error.user_message, error=error)
+
+def _safe_generate_content(prompt: str) -> GenerationResult:
+    """
+    Internal helper function to safely call the model and handle potential errors.
+    Successful responses are served from and stored in the response cache; errors are
+    never cached.
+    Args:
+        prompt (str): The prompt string to send to the model.
+    Returns:
+        GenerationResult: The generated text content, or a user-friendly error message
+        with the typed error attached (check `result.ok`).
+    """
+    try:
+        return GenerationResult(generate_content(prompt))
+    except GenerationError as e:
+        # Return a user-friendly error message if generation fails
+        return _error_result(e)
+
+async def _safe_generate_content_async(prompt: str) -> GenerationResult:
+    """
+    Async counterpart of `_safe_generate_content` built on the SDK's native async path.
+    Args:
+        prompt (str): The prompt string to send to the model.
+    Returns:
+        GenerationResult: The generated text content or an error message.
+    """
+    try:
+        return GenerationResult(await generate_content_async(prompt))
+    except GenerationError as e:
+        return _error_result(e)
+
+def get_cache_stats() -> dict:
+    """Returns hit/miss/eviction counters of the response cache (empty if disabled)."""
+    return response_cache.stats.as_dict() if response_cache is not None else {}
+
+def get_call_metrics() -> list:
+    """Returns per-function call counts, token usage and latency, most expensive first."""
+    return metrics.registry.summary()
+
+def get_prompt_costs() -> list:
+    """Returns the estimated token cost and input budget of every prompt template."""
+    return prompts.registry.report()
+
+def _generate_resume_summary_prompt(name: str, title: str, skills: str, experience: str,
+                                    tone: str = "Formal", language: str = "English", length: str = "Concise") -> str:
+    """Builds the prompt sent by `generate_resume_summary`."""
+    length_description = ""
+    if length == "Concise":
+        length_description = " (3-5 sentences)"
+    elif length == "Standard":
+        length_description = " (5-8 sentences)"
+    elif length == "Detailed":
+        length_description = " (8-12 sentences)"
+
+    return prompts.render("generate_resume_summary", name=name, title=title, skills=skills, experience=experience,
+                          tone=tone, language=language, length=length, length_description=length_description)
+
+@instrumented
+def generate_resume_summary(name: str, title: str, skills: str, experience: str,
+                            tone: str = "Formal", language: str = "English", length: str = "Concise") -> str:
+    """
+    Generates a professional resume summary using the VMD AI model.
+
+    Args:
+        name (str): The candidate's full name.
+        title (str): The target job title.
+        skills (str): A comma-separated list of the candidate's skills.
+        experience (str): A brief summary of the candidate's experience.
+        tone (str): Desired tone for the summary (e.g., "Formal", "Creative", "Concise").
+        language (str): Desired language for the output (e.g., "English", "Spanish", "French").
+        length (str): Desired length for the summary (e.g., "Concise", "Standard", "Detailed").
+
+    Returns:
+        str: The AI-generated resume summary.
+    """
+    return _safe_generate_content(_generate_resume_summary_prompt(name, title, skills, experience, tone, language, length))
+
+def _generate_cover_letter_prompt(name: str, title: str, company: str, skills: str, experience: str,
+                                  tone: str = "Formal", language: str = "English", length: str = "Standard") -> str:
+    """Builds the prompt sent by `generate_cover_letter`."""
+    length_description = ""
+    if length == "Brief":
+        length_description = " (2-3 paragraphs)"
+    elif length == "Standard":
+        length_description = " (3-4 paragraphs)"
+    elif length == "Detailed":
+        length_description = " (4-5 paragraphs)"
+
+    return prompts.render("generate_cover_letter", name=name, title=title, company=company, skills=skills,
+                          experience=experience, tone=tone, language=language, length_description=length_description)
+
+@instrumented
+def generate_cover_letter(name: str, title: str, company: str, skills: str, experience: str,
+                          tone: str = "Formal", language: str = "English", length: str = "Standard") -> str:
+    """
+    Generates a professional cover letter using the VMD AI model.
+
+    Args:
+        name (str): The candidate's full name.
+        title (str): The target job title.
+        company (str): The target company for the application.
+        skills (str): A comma-separated list of the candidate's skills.
+        experience (str): A brief summary of the candidate's experience.
+        tone (str): Desired tone for the cover letter (e.g., "Formal", "Friendly", "Persuasive").
+        language (str): Desired language for the output (e.g., "English", "Spanish", "French").
+        length (str): Desired length for the cover letter (e.g., "Standard", "Brief", "Detailed").
+
+    Returns:
+        str: The AI-generated cover letter.
+    """
+    return _safe_generate_content(_generate_cover_letter_prompt(name, title, company, skills, experience, tone, language, length))
+
+def _chunks_for(text: str, chunked: Optional[bool]) -> Optional[list]:
+    """
+    Returns the chunks to map over, or None to send `text` in a single prompt.
+
+    `chunked=None` chunks automatically once the text exceeds CHUNK_TOKENS; True/False force
+    the mode (a text that fits into one chunk is always sent as-is).
+    """
+    if chunked is False or (chunked is None and estimate_tokens(text) <= CHUNK_TOKENS):
+        return None
+    chunks = chunking.split_text(text, CHUNK_TOKENS)
+    return chunks if len(chunks) > 1 else None
+
+def _invalid_request(message: str) -> GenerationResult:
+    return GenerationResult(message, error=InvalidRequestError(message))
+
+# Generators with more than one model call (engines, chunked map-reduce) are written once, as
+# "plans": generator functions that yield a prompt (one call) or a list of prompts (a concurrent
+# map step), receive the result(s) back, and return the final GenerationResult. `_run_plan`
+# drives a plan with blocking calls and `aio._run_plan` with awaited ones, so the sync and
+# async generators share every branch.
+
+def _run_plan(plan) -> GenerationResult:
+    """Executes a plan's model calls on the calling thread (map steps on CHUNK_CONCURRENCY threads)."""
+    try:
+        step = next(plan)
+        while True:
+            if isinstance(step, list):
+                step = plan.send(chunking.map_chunks(step, _safe_generate_content, CHUNK_CONCURRENCY))
+            else:
+                step = plan.send(_safe_generate_content(step))
+    except StopIteration as done:
+        return done.value
+
+# Keyword engines: "llm" (one model call), "local" (offline extractor in gemini_api.keywords,
+# no model call) and "refine" (local draft, then one model call to clean it up)
+KEYWORD_ENGINES = ("llm", "local", "refine")
+
+def _local_keywords(text: str) -> GenerationResult:
+    return GenerationResult(keywords.format_keywords(keywords.extract_keywords(text)))
+
+def _refine_keywords_prompt(text: str, context: str) -> str:
+    """Builds the prompt of the "refine" keyword engine: the local draft plus the source text."""
+    draft = keywords.format_keywords(keywords.extract_keywords(text, top_k=40))
+    return prompts.render("refine_keywords", text=text, context=context, draft=draft)
+
+def _generate_keywords_prompt(text: str, context: str) -> str:
+    """Builds the prompt sent by `generate_keywords`."""
+    return prompts.render("generate_keywords", text=text, context=context)
+
+@instrumented
+def generate_keywords(text: str, context: str, chunked: Optional[bool] = None, engine: str = "llm") -> str:
+    """
+    Extracts relevant keywords from a given text (e.g., resume or job description).
+
+    Args:
+        text (str): The input text (e.g., resume content or job description).
+        context (str): The context for keyword extraction (e.g., "resume for software engineer", "job description for marketing manager").
+        chunked (bool): Extract per chunk and merge the lists; None decides by the length of `text`.
+        engine (str): "llm", "local" (offline, no model call) or "refine" (local draft cleaned up by the model).
+
+    Returns:
+        str: A comma-separated list of extracted keywords.
+    """
+    return _run_plan(_generate_keywords_plan(text, context, chunked, engine))
+
+def _generate_keywords_plan(text: str, context: str, chunked: Optional[bool], engine: str):
+    """Plan of `generate_keywords` (see `_run_plan`)."""
+    if engine not in KEYWORD_ENGINES:
+        return _invalid_request(f"Unknown keyword engine: {engine!r}.")
+    if engine == "local":
+        return _local_keywords(text)
+    if engine == "refine":
+        return (yield _refine_keywords_prompt(text, context))
+    chunks = _chunks_for(text, chunked)
+    if chunks is None:
+        return (yield _generate_keywords_prompt(text, context))
+    partials = yield [_generate_keywords_prompt(chunk, context) for chunk in chunks]
+    failed = chunking.first_error(partials)
+    if failed is not None:
+        return failed
+    return GenerationResult(chunking.merge_keyword_lists(partials))
+
+def _generate_interview_questions_prompt(resume_summary: str, job_description_keywords: str, question_type: str = "Behavioral") -> str:
+    """Builds the prompt sent by `generate_interview_questions`."""
+    return prompts.render("generate_interview_questions", resume_summary=resume_summary,
+                          job_description_keywords=job_description_keywords, question_type=question_type)
+
+@instrumented
+def generate_interview_questions(resume_summary: str, job_description_keywords: str, question_type: str = "Behavioral") -> str:
+    """
+    Generates potential interview questions based on a resume summary and job description keywords.
+
+    Args:
+        resume_summary (str): The candidate's resume summary.
+        job_description_keywords (str): Key skills/requirements from the job description.
+        question_type (str): Type of questions (e.g., "Behavioral", "Technical", "Situational").
+
+    Returns:
+        str: A list of 5-7 potential interview questions.
+    """
+    return _safe_generate_content(_generate_interview_questions_prompt(resume_summary, job_description_keywords, question_type))
+
+def _critique_resume_section_prompt(section_text: str, section_type: str, job_title: str) -> str:
+    """Builds the prompt sent by `critique_resume_section`."""
+    return prompts.render("critique_resume_section", section_text=section_text, section_type=section_type, job_title=job_title)
+
+@instrumented
+def critique_resume_section(section_text: str, section_type: str, job_title: str) -> str:
+    """
+    Provides a constructive critique of a specific resume section.
+
+    Args:
+        section_text (str): The content of the resume section to critique.
+        section_type (str): The type of section (e.g., "Resume Summary", "Skills", "Experience").
+        job_title (str): The target job title for context.
+
+    Returns:
+        str: A critique with suggestions for improvement.
+    """
+    return _safe_generate_content(_critique_resume_section_prompt(section_text, section_type, job_title))
+
+def _generate_bullet_points_from_experience_prompt(experience_description: str, job_title: str, num_bullets: int = 5) -> str:
+    """Builds the prompt sent by `generate_bullet_points_from_experience`."""
+    return prompts.render("generate_bullet_points_from_experience", experience_description=experience_description,
+                          job_title=job_title, num_bullets=num_bullets)
+
+@instrumented
+def generate_bullet_points_from_experience(experience_description: str, job_title: str, num_bullets: int = 5) -> str:
+    """
+    Converts a free-form experience description into concise, action-oriented bullet points.
+
+    Args:
+        experience_description (str): A detailed description of work experience.
+        job_title (str): The target job title to tailor bullet points.
+        num_bullets (int): Desired number of bullet points.
+
+    Returns:
+        str: A list of action-oriented bullet points.
+    """
+    return _safe_generate_content(_generate_bullet_points_from_experience_prompt(experience_description, job_title, num_bullets))
+
+def _generate_achievement_statement_prompt(responsibility: str, impact_details: str) -> str:
+    """Builds the prompt sent by `generate_achievement_statement`."""
+    return prompts.render("generate_achievement_statement", responsibility=responsibility, impact_details=impact_details)
+
+@instrumented
+def generate_achievement_statement(responsibility: str, impact_details: str) -> str:
+    """
+    Converts a responsibility and its impact into a concise, action-oriented achievement statement.
+
+    Args:
+        responsibility (str): A description of a task or responsibility.
+        impact_details (str): Details about the impact, result, or metric of the responsibility.
+
+    Returns:
+        str: A 1-2 sentence achievement statement.
+    """
+    return _safe_generate_content(_generate_achievement_statement_prompt(responsibility, impact_details))
+
+def _generate_linkedin_summary_prompt(keywords: str, career_overview: str) -> str:
+    """Builds the prompt sent by `generate_linkedin_summary`."""
+    return prompts.render("generate_linkedin_summary", keywords=keywords, career_overview=career_overview)
+
+@instrumented
+def generate_linkedin_summary(keywords: str, career_overview: str) -> str:
+    """
+    Generates a compelling professional summary for a LinkedIn profile.
+
+    Args:
+        keywords (str): Key skills/roles for the LinkedIn summary (comma-separated).
+        career_overview (str): A brief summary of the user's professional journey and aspirations.
+
+    Returns:
+        str: A 3-5 sentence LinkedIn professional summary.
+    """
+    return _safe_generate_content(_generate_linkedin_summary_prompt(keywords, career_overview))
+
+# analysis_type (as offered in the UI) -> prompt template
+_JD_ANALYSIS_TEMPLATES = {
+    "Key Skills and Requirements": "analyze_job_description.key_skills",
+    "Potential Interview Questions": "analyze_job_description.interview_questions",
+    "ATS Alignment Advice": "analyze_job_description.ats_advice",
+    "Skill Gap Analysis": "analyze_job_description.skill_gap",
+}
+
+def _analyze_job_description_prompt(jd_content: str, analysis_type: str, job_title_context: str = "", user_experience_summary: str = "", user_skills: str = "") -> Optional[str]:
+    """Builds the prompt sent by `analyze_job_description`."""
+    template = _JD_ANALYSIS_TEMPLATES.get(analysis_type)
+    if template is None:
+        return None
+    # Each template only uses the fields relevant to its analysis type (e.g. the user's
+    # experience summary personalizes the interview questions)
+    values = {"jd_content": jd_content, "job_title_context": job_title_context,
+              "user_experience_summary": user_experience_summary, "user_skills": user_skills}
+    template = prompts.registry.get(template)
+    return template.render(**{field: values[field] for field in template.fields})
+
+def _reduce_job_analysis_prompt(analysis_type: str, partials: list) -> str:
+    """Builds the prompt that merges per-chunk results of `analyze_job_description`."""
+    return prompts.render("analyze_job_description.reduce", analysis_type=analysis_type,
+                          format_hint=_JD_REDUCE_FORMAT_HINTS.get(analysis_type, ""),
+                          num_parts=len(partials), partials=chunking.format_partials(partials))
+
+def _jd_keyword_context(job_title_context: str) -> str:
+    return f"job description for a '{job_title_context}' role" if job_title_context else "job description"
+
+_JD_REDUCE_FORMAT_HINTS = {
+    "Potential Interview Questions": " (5-7 questions in total, listed numerically)",
+    "Skill Gap Analysis": " (the skill gaps first, then 3-5 learning resources or areas of focus)",
+}
+
+@instrumented
+def analyze_job_description(jd_content: str, analysis_type: str, job_title_context: str = "", user_experience_summary: str = "", user_skills: str = "",
+                            chunked: Optional[bool] = None, engine: str = "llm") -> str:
+    """
+    Analyzes a job description for different purposes (keywords, interview questions, ATS advice).
+
+    Args:
+        jd_content (str): The full content of the job description.
+        analysis_type (str): The type of analysis requested ("Key Skills and Requirements", "Potential Interview Questions", "ATS Alignment Advice", "Skill Gap Analysis").
+        job_title_context (str): The target job title for better context.
+        user_experience_summary (str): The user's experience summary, relevant for interview questions.
+        user_skills (str): The user's skills, relevant for skill gap analysis.
+        chunked (bool): Analyze a long description in chunks concurrently and merge the results;
+            None decides by the length of `jd_content`.
+        engine (str): Keyword engine for "Key Skills and Requirements" ("llm", "local" or "refine",
+            see `generate_keywords`); every other analysis type needs "llm".
+
+    Returns:
+        str: The result of the analysis.
+    """
+    return _run_plan(_analyze_job_description_plan(jd_content, analysis_type, job_title_context, user_experience_summary,
+                                                   user_skills, chunked, engine))
+
+def _analyze_job_description_plan(jd_content: str, analysis_type: str, job_title_context: str, user_experience_summary: str,
+                                  user_skills: str, chunked: Optional[bool], engine: str):
+    """Plan of `analyze_job_description` (see `_run_plan`)."""
+    prompt = _analyze_job_description_prompt(jd_content, analysis_type, job_title_context, user_experience_summary, user_skills)
+    if prompt is None:
+        return _invalid_request("Invalid analysis type specified for job description.")
+    if engine != "llm":
+        if analysis_type != "Key Skills and Requirements" or engine not in KEYWORD_ENGINES:
+            return _invalid_request(f"The {engine!r} engine only supports the Key Skills and Requirements analysis.")
+        if engine == "local":
+            return _local_keywords(jd_content)
+        return (yield _refine_keywords_prompt(jd_content, _jd_keyword_context(job_title_context)))
+    chunks = _chunks_for(jd_content, chunked)
+    if chunks is None:
+        return (yield prompt)
+    partials = yield [_analyze_job_description_prompt(chunk, analysis_type, job_title_context, user_experience_summary, user_skills)
+                      for chunk in chunks]
+    failed = chunking.first_error(partials)
+    if failed is not None:
+        return failed
+    if analysis_type == "Key Skills and Requirements":
+        return GenerationResult(chunking.merge_keyword_lists(partials))  # Lists merge locally, no reduce call
+    return (yield _reduce_job_analysis_prompt(analysis_type, partials))
+
+def _generate_power_verbs_prompt(job_title: str) -> str:
+    """Builds the prompt sent by `generate_power_verbs`."""
+    return prompts.render("generate_power_verbs", job_title=job_title)
+
+@instrumented
+def generate_power_verbs(job_title: str) -> str:
+    """Generates a list of powerful action verbs relevant to a given job title."""
+    return _safe_generate_content(_generate_power_verbs_prompt(job_title))
+
+def _expand_resume_section_prompt(brief_text: str, section_type: str, job_title: str) -> str:
+    """Builds the prompt sent by `expand_resume_section`."""
+    return prompts.render("expand_resume_section", brief_text=brief_text, section_type=section_type, job_title=job_title)
+
+@instrumented
+def expand_resume_section(brief_text: str, section_type: str, job_title: str) -> str:
+    """Expands brief text into a more detailed resume section."""
+    return _safe_generate_content(_expand_resume_section_prompt(brief_text, section_type, job_title))
+
+def _summarize_resume_section_prompt(detailed_text: str, section_type: str, target_length_sentences: int = 3) -> str:
+    """Builds the prompt sent by `summarize_resume_section`."""
+    return prompts.render("summarize_resume_section", detailed_text=detailed_text, section_type=section_type,
+                          target_length_sentences=target_length_sentences)
+
+@instrumented
+def summarize_resume_section(detailed_text: str, section_type: str, target_length_sentences: int = 3) -> str:
+    """Summarizes a detailed resume section into a shorter, concise version."""
+    return _safe_generate_content(_summarize_resume_section_prompt(detailed_text, section_type, target_length_sentences))
+
+def _generate_thank_you_note_prompt(name: str, company: str, job_title: str, interview_date: str, key_discussion_points: str) -> str:
+    """Builds the prompt sent by `generate_thank_you_note`."""
+    return prompts.render("generate_thank_you_note", name=name, company=company, job_title=job_title,
+                          interview_date=interview_date, key_discussion_points=key_discussion_points)
+
+@instrumented
+def generate_thank_you_note(name: str, company: str, job_title: str, interview_date: str, key_discussion_points: str) -> str:
+    """Generates a professional post-interview thank you note."""
+    return _safe_generate_content(_generate_thank_you_note_prompt(name, company, job_title, interview_date, key_discussion_points))
+
+def _generate_networking_message_prompt(my_role: str, target_person_role: str, purpose: str, common_ground: str = "") -> str:
+    """Builds the prompt sent by `generate_networking_message`."""
+    return prompts.render("generate_networking_message", my_role=my_role, target_person_role=target_person_role,
+                          purpose=purpose, common_ground=common_ground)
+
+@instrumented
+def generate_networking_message(my_role: str, target_person_role: str, purpose: str, common_ground: str = "") -> str:
+    """Generates a professional networking message."""
+    return _safe_generate_content(_generate_networking_message_prompt(my_role, target_person_role, purpose, common_ground))
+
+def _generate_career_path_suggestions_prompt(skills: str, experience: str, current_role: str = "") -> str:
+    """Builds the prompt sent by `generate_career_path_suggestions`."""
+    return prompts.render("generate_career_path_suggestions", skills=skills, experience=experience, current_role=current_role)
+
+@instrumented
+def generate_career_path_suggestions(skills: str, experience: str, current_role: str = "") -> str:
+    """Suggests potential career paths based on skills and experience."""
+    return _safe_generate_content(_generate_career_path_suggestions_prompt(skills, experience, current_role))
+
+def _generate_learning_resources_prompt(skill_gap: str, current_role: str) -> str:
+    """Builds the prompt sent by `generate_learning_resources`."""
+    return prompts.render("generate_learning_resources", skill_gap=skill_gap, current_role=current_role)
+
+@instrumented
+def generate_learning_resources(skill_gap: str, current_role: str) -> str:
+    """Recommends learning resources for a specific skill gap."""
+    return _safe_generate_content(_generate_learning_resources_prompt(skill_gap, current_role))
+
+def _generate_salary_negotiation_script_prompt(job_title: str, company: str, initial_offer: str, desired_range: str, key_achievements: str) -> str:
+    """Builds the prompt sent by `generate_salary_negotiation_script`."""
+    return prompts.render("generate_salary_negotiation_script", job_title=job_title, company=company, initial_offer=initial_offer,
+                          desired_range=desired_range, key_achievements=key_achievements)
+
+@instrumented
+def generate_salary_negotiation_script(job_title: str, company: str, initial_offer: str, desired_range: str, key_achievements: str) -> str:
+    """Generates a script for salary negotiation."""
+    return _safe_generate_content(_generate_salary_negotiation_script_prompt(job_title, company, initial_offer, desired_range, key_achievements))
+
+def _generate_interview_answer_critique_prompt(question: str, user_answer: str, job_title_context: str) -> str:
+    """Builds the prompt sent by `generate_interview_answer_critique`."""
+    return prompts.render("generate_interview_answer_critique", question=question, user_answer=user_answer,
+                          job_title_context=job_title_context)
+
+@instrumented
+def generate_interview_answer_critique(question: str, user_answer: str, job_title_context: str) -> str:
+    """Critiques a user's mock interview answer."""
+    return _safe_generate_content(_generate_interview_answer_critique_prompt(question, user_answer, job_title_context))
\ No newline at end of file
@@ -0,0 +1,143 @@
+"""
+Native asyncio variants of every generator in `gemini_api`.
+
+Each coroutine builds the exact same prompt as its synchronous counterpart and awaits the
+SDK's async generation path, so many requests can be multiplexed over a single event loop:
+
+    import asyncio
+    from gemini_api import aio
+
+    letters = await asyncio.gather(*(aio.generate_cover_letter(**row) for row in rows))
+"""
+from typing import Optional
+
+from . import (
+    GenerationResult,
+    _analyze_job_description_plan,
+    _generate_keywords_plan,
+    _safe_generate_content_async,
+    _generate_resume_summary_prompt,
+    _generate_cover_letter_prompt,
+    _generate_interview_questions_prompt,
+    _critique_resume_section_prompt,
+    _generate_bullet_points_from_experience_prompt,
+    _generate_achievement_statement_prompt,
+    _generate_linkedin_summary_prompt,
+    _generate_power_verbs_prompt,
+    _expand_resume_section_prompt,
+    _summarize_resume_section_prompt,
+    _generate_thank_you_note_prompt,
+    _generate_networking_message_prompt,
+    _generate_career_path_suggestions_prompt,
+    _generate_learning_resources_prompt,
+    _generate_salary_negotiation_script_prompt,
+    _generate_interview_answer_critique_prompt,
+)
+from . import chunking
+from .metrics import instrumented
+
+async def _run_plan(plan) -> GenerationResult:
+    """Async counterpart of `gemini_api._run_plan`: map steps run concurrently on the event loop."""
+    try:
+        step = next(plan)
+        while True:
+            if isinstance(step, list):
+                step = plan.send(await chunking.map_chunks_async(step, _safe_generate_content_async))
+            else:
+                step = plan.send(await _safe_generate_content_async(step))
+    except StopIteration as done:
+        return done.value
+
+@instrumented
+async def generate_resume_summary(name: str, title: str, skills: str, experience: str,
+                                  tone: str = "Formal", language: str = "English", length: str = "Concise") -> str:
+    """Async variant of `gemini_api.generate_resume_summary`."""
+    return await _safe_generate_content_async(_generate_resume_summary_prompt(name, title, skills, experience, tone, language, length))
+
+@instrumented
+async def generate_cover_letter(name: str, title: str, company: str, skills: str, experience: str,
+                                tone: str = "Formal", language: str = "English", length: str = "Standard") -> str:
+    """Async variant of `gemini_api.generate_cover_letter`."""
+    return await _safe_generate_content_async(_generate_cover_letter_prompt(name, title, company, skills, experience, tone, language, length))
+
+@instrumented
+async def generate_keywords(text: str, context: str, chunked: Optional[bool] = None, engine: str = "llm") -> str:
+    """Async variant of `gemini_api.generate_keywords`."""
+    return await _run_plan(_generate_keywords_plan(text, context, chunked, engine))
+
+@instrumented
+async def generate_interview_questions(resume_summary: str, job_description_keywords: str, question_type: str = "Behavioral") -> str:
+    """Async variant of `gemini_api.generate_interview_questions`."""
+    return await _safe_generate_content_async(_generate_interview_questions_prompt(resume_summary, job_description_keywords, question_type))
+
+@instrumented
+async def critique_resume_section(section_text: str, section_type: str, job_title: str) -> str:
+    """Async variant of `gemini_api.critique_resume_section`."""
+    return await _safe_generate_content_async(_critique_resume_section_prompt(section_text, section_type, job_title))
+
+@instrumented
+async def generate_bullet_points_from_experience(experience_description: str, job_title: str, num_bullets: int = 5) -> str:
+    """Async variant of `gemini_api.generate_bullet_points_from_experience`."""
+    return await _safe_generate_content_async(_generate_bullet_points_from_experience_prompt(experience_description, job_title, num_bullets))
+
+@instrumented
+async def generate_achievement_statement(responsibility: str, impact_details: str) -> str:
+    """Async variant of `gemini_api.generate_achievement_statement`."""
+    return await _safe_generate_content_async(_generate_achievement_statement_prompt(responsibility, impact_details))
+
+@instrumented
+async def generate_linkedin_summary(keywords: str, career_overview: str) -> str:
+    """Async variant of `gemini_api.generate_linkedin_summary`."""
+    return await _safe_generate_content_async(_generate_linkedin_summary_prompt(keywords, career_overview))
+
+@instrumented
+async def analyze_job_description(jd_content: str, analysis_type: str, job_title_context: str = "", user_experience_summary: str = "", user_skills: str = "",
+                                  chunked: Optional[bool] = None, engine: str = "llm") -> str:
+    """Async variant of `gemini_api.analyze_job_description`."""
+    return await _run_plan(_analyze_job_description_plan(jd_content, analysis_type, job_title_context, user_experience_summary,
+                                                         user_skills, chunked, engine))
+
+@instrumented
+async def generate_power_verbs(job_title: str) -> str:
+    """Async variant of `gemini_api.generate_power_verbs`."""
+    return await _safe_generate_content_async(_generate_power_verbs_prompt(job_title))
+
+@instrumented
+async def expand_resume_section(brief_text: str, section_type: str, job_title: str) -> str:
+    """Async variant of `gemini_api.expand_resume_section`."""
+    return await _safe_generate_content_async(_expand_resume_section_prompt(brief_text, section_type, job_title))
+
+@instrumented
+async def summarize_resume_section(detailed_text: str, section_type: str, target_length_sentences: int = 3) -> str:
+    """Async variant of `gemini_api.summarize_resume_section`."""
+    return await _safe_generate_content_async(_summarize_resume_section_prompt(detailed_text, section_type, target_length_sentences))
+
+@instrumented
+async def generate_thank_you_note(name: str, company: str, job_title: str, interview_date: str, key_discussion_points: str) -> str:
+    """Async variant of `gemini_api.generate_thank_you_note`."""
+    return await _safe_generate_content_async(_generate_thank_you_note_prompt(name, company, job_title, interview_date, key_discussion_points))
+
+@instrumented
+async def generate_networking_message(my_role: str, target_person_role: str, purpose: str, common_ground: str = "") -> str:
+    """Async variant of `gemini_api.generate_networking_message`."""
+    return await _safe_generate_content_async(_generate_networking_message_prompt(my_role, target_person_role, purpose, common_ground))
+
+@instrumented
+async def generate_career_path_suggestions(skills: str, experience: str, current_role: str = "") -> str:
+    """Async variant of `gemini_api.generate_career_path_suggestions`."""
+    return await _safe_generate_content_async(_generate_career_path_suggestions_prompt(skills, experience, current_role))
+
+@instrumented
+async def generate_learning_resources(skill_gap: str, current_role: str) -> str:
+    """Async variant of `gemini_api.generate_learning_resources`."""
+    return await _safe_generate_content_async(_generate_learning_resources_prompt(skill_gap, current_role))
+
+@instrumented
+async def generate_salary_negotiation_script(job_title: str, company: str, initial_offer: str, desired_range: str, key_achievements: str) -> str:
+    """Async variant of `gemini_api.generate_salary_negotiation_script`."""
+    return await _safe_generate_content_async(_generate_salary_negotiation_script_prompt(job_title, company, initial_offer, desired_range, key_achievements))
+
+@instrumented
+async def generate_interview_answer_critique(question: str, user_answer: str, job_title_context: str) -> str:
+    """Async variant of `gemini_api.generate_interview_answer_critique`."""
+    return await _safe_generate_content_async(_generate_interview_answer_critique_prompt(question, user_answer, job_title_context))
@@ -0,0 +1,360 @@
+"""
+LLM backends behind `gemini_api`.
+
+Every generator in the package talks to a `Backend`, selected with the VMD_LLM_BACKEND
+environment variable:
+
+* ``gemini`` (default) - Google Gemini through google-generativeai.
+* ``fake`` - deterministic offline backend with configurable latency and failure rates,
+  for perf tests and local development without network access or an API key.
+* ``http`` - client for an HTTP stand-in server (see `gemini_api.fake_server`), for load
+  tests that need real sockets between the app and the "model".
+
+The SDK, urllib and asyncio are imported on first use so `import gemini_api` stays cheap.
+"""
+import hashlib
+import json
+import math
+import os
+import random
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Iterator, Optional, Protocol
+
+FAKE_TRACKED_PROMPTS = 10_000
+
+
+@dataclass
+class LLMResponse:
+    """Text (or one streamed chunk of text) returned by a backend, with token usage when known."""
+    text: str
+    prompt_tokens: Optional[int] = None
+    output_tokens: Optional[int] = None
+
+    @property
+    def total_tokens(self) -> Optional[int]:
+        if self.prompt_tokens is None and self.output_tokens is None:
+            return None
+        return (self.prompt_tokens or 0) + (self.output_tokens or 0)
+
+
+class Backend(Protocol):
+    """Interface every LLM backend implements."""
+
+    #: Model identifier; part of the response-cache key.
+    name: str
+
+    def generate(self, prompt: str, timeout: float) -> LLMResponse:
+        """Generates a complete response within `timeout` seconds."""
+        ...
+
+    async def generate_async(self, prompt: str, timeout: float) -> LLMResponse:
+        """Async counterpart of `generate`."""
+        ...
+
+    def stream(self, prompt: str, timeout: float) -> Iterator[LLMResponse]:
+        """Yields the response in chunks; usage, if known, is attached to the last chunk."""
+        ...
+
+
+class BackendHTTPError(Exception):
+    """Non-2xx answer from an HTTP backend; `code` carries the status for error classification."""
+
+    def __init__(self, code: int, message: str):
+        super().__init__(f"HTTP {code}: {message}")
+        self.code = code
+
+
+class ResourceExhausted(Exception):
+    """Simulated quota error raised by `FakeBackend` (named like the google.api_core exception)."""
+
+    code = 429
+
+
+# --- Gemini ---
+
+def _gemini_text(response) -> str:
+    try:
+        return response.text or ""
+    except ValueError:
+        return ""  # No text parts, e.g. the candidate was blocked by safety filters
+
+
+def _gemini_usage(response) -> dict:
+    usage = getattr(response, "usage_metadata", None)
+    if usage is None:
+        return {}
+    return {
+        "prompt_tokens": getattr(usage, "prompt_token_count", None),
+        "output_tokens": getattr(usage, "candidates_token_count", None),
+    }
+
+
+class GeminiBackend:
+    """Google Gemini via the google-generativeai SDK."""
+
+    def __init__(self, model_name: str = "gemini-2.0-flash", api_key: Optional[str] = None,
+                 generation_config: Optional[dict] = None):
+        import google.generativeai as genai
+
+        genai.configure(api_key=api_key)
+        self.name = model_name
+        self.model = genai.GenerativeModel(model_name, generation_config=generation_config or None)
+
+    def generate(self, prompt: str, timeout: float) -> LLMResponse:
+        response = self.model.generate_content(prompt, request_options={"timeout": timeout})
+        return LLMResponse(_gemini_text(response), **_gemini_usage(response))
+
+    async def generate_async(self, prompt: str, timeout: float) -> LLMResponse:
+        response = await self.model.generate_content_async(prompt, request_options={"timeout": timeout})
+        return LLMResponse(_gemini_text(response), **_gemini_usage(response))
+
+    def stream(self, prompt: str, timeout: float) -> Iterator[LLMResponse]:
+        response = self.model.generate_content(prompt, stream=True, request_options={"timeout": timeout})
+        for chunk in response:
+            yield LLMResponse(_gemini_text(chunk))
+        yield LLMResponse("", **_gemini_usage(response))
+
+
+# --- Deterministic offline fake ---
+
+_FAKE_VOCABULARY = (
+    "results-driven professional with a proven track record of delivering scalable solutions "
+    "collaborated with cross-functional teams to improve performance and reduce costs "
+    "led initiatives that increased customer satisfaction and drove measurable growth "
+    "skilled in stakeholder communication agile delivery data analysis and mentoring "
+    "passionate about building reliable products and continuously learning new technologies"
+).split()
+
+
+def parse_distribution(spec: str):
+    """
+    Parses a latency distribution spec (milliseconds) into a sampler `f(rng) -> seconds`.
+
+    Supported specs: "constant:200", "uniform:100,300", "normal:200,50",
+    "lognormal:200,0.5" (median, sigma) and "exponential:200" (mean).
+    """
+    kind, _, params = spec.partition(":")
+    values = [float(v) for v in params.split(",") if v.strip()] if params else []
+    kind = kind.strip().lower()
+    if kind == "constant":
+        return lambda rng: values[0] / 1000.0
+    if kind == "uniform":
+        return lambda rng: rng.uniform(values[0], values[1]) / 1000.0
+    if kind == "normal":
+        return lambda rng: max(0.0, rng.gauss(values[0], values[1])) / 1000.0
+    if kind == "lognormal":
+        mu = math.log(values[0])
+        return lambda rng: rng.lognormvariate(mu, values[1]) / 1000.0
+    if kind == "exponential":
+        return lambda rng: rng.expovariate(1.0 / values[0]) / 1000.0
+    raise ValueError(f"Unknown latency distribution: {spec!r}")
+
+
+class FakeBackend:
+    """
+    Deterministic offline backend.
+
+    The response text is a pure function of the prompt, and the latency/failure draws come
+    from a RNG seeded by (seed, prompt, attempt number), so a run is reproducible regardless
+    of scheduling order. Failures are raised as the same exception types the real SDK raises
+    (connection errors, 429 quota errors, timeouts) so retry, breaker and limiter layers are
+    exercised for real. Attempt numbers are kept for the FAKE_TRACKED_PROMPTS most recently
+    used prompts; a prompt unused for longer starts again at attempt 0.
+    """
+
+    def __init__(self, latency: str = "lognormal:300,0.4", failure_rate: float = 0.0,
+                 failure_kinds: Optional[dict] = None, output_words: int = 120,
+                 stream_chunks: int = 8, seed: int = 0, name: str = "fake-llm",
+                 tracked_prompts: int = FAKE_TRACKED_PROMPTS):
+        """
+        Args:
+            latency (str): Latency distribution spec, see `parse_distribution`.
+            failure_rate (float): Probability (0-1) that a call fails.
+            failure_kinds (dict): Relative weights of "transient", "rate_limit" and "timeout" failures.
+            output_words (int): Number of words in each response.
+            stream_chunks (int): Number of chunks a streamed response is split into.
+            seed (int): Seed that makes latency and failure draws reproducible.
+            name (str): Model name reported to the cache.
+            tracked_prompts (int): Maximum number of prompts whose attempt count is remembered.
+        """
+        self.name = name
+        self.latency_spec = latency
+        self._sample_latency = parse_distribution(latency)
+        self.failure_rate = failure_rate
+        self.failure_kinds = failure_kinds or {"transient": 1.0, "rate_limit": 1.0, "timeout": 1.0}
+        self.output_words = output_words
+        self.stream_chunks = max(1, stream_chunks)
+        self.seed = seed
+        self.tracked_prompts = max(1, tracked_prompts)
+        self._attempts: "OrderedDict[str, int]" = OrderedDict()   # Prompt digest -> calls so far, LRU order
+        self._lock = threading.Lock()
+
+    def _plan(self, prompt: str) -> tuple[float, Optional[str]]:
+        """Returns (latency_seconds, failure_kind or None) for the next call with this prompt."""
+        digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        with self._lock:
+            attempt = self._attempts.pop(digest, 0)
+            self._attempts[digest] = attempt + 1
+            if len(self._attempts) > self.tracked_prompts:
+                self._attempts.popitem(last=False)
+        rng = random.Random(f"{self.seed}:{digest}:{attempt}")
+        latency = self._sample_latency(rng)
+        failure = None
+        if rng.random() < self.failure_rate:
+            kinds = list(self.failure_kinds)
+            failure = rng.choices(kinds, weights=[self.failure_kinds[k] for k in kinds])[0]
+        return latency, failure
+
+    def _text(self, prompt: str) -> str:
+        rng = random.Random(hashlib.sha256(prompt.encode("utf-8")).digest())
+        words = [rng.choice(_FAKE_VOCABULARY) for _ in range(self.output_words)]
+        sentences = [" ".join(words[i:i + 15]).capitalize() + "." for i in range(0, len(words), 15)]
+        return " ".join(sentences)
+
+    def _response(self, prompt: str) -> LLMResponse:
+        text = self._text(prompt)
+        return LLMResponse(text, prompt_tokens=max(1, len(prompt) // 4), output_tokens=max(1, len(text) // 4))
+
+    @staticmethod
+    def _failure(kind: str, timeout: float) -> Exception:
+        if kind == "rate_limit":
+            return ResourceExhausted("429 RESOURCE_EXHAUSTED: simulated quota exceeded")
+        if kind == "timeout":
+            return TimeoutError(f"simulated upstream timeout after {timeout:.1f}s")
+        return ConnectionError("simulated connection reset by upstream")
+
+    def generate(self, prompt: str, timeout: float) -> LLMResponse:
+        latency, failure = self._plan(prompt)
+        if failure == "timeout" or latency > timeout:
+            time.sleep(min(latency, timeout))
+            raise self._failure("timeout", timeout)
+        time.sleep(latency)
+        if failure:
+            raise self._failure(failure, timeout)
+        return self._response(prompt)
+
+    async def generate_async(self, prompt: str, timeout: float) -> LLMResponse:
+        import asyncio
+
+        latency, failure = self._plan(prompt)
+        if failure == "timeout" or latency > timeout:
+            await asyncio.sleep(min(latency, timeout))
+            raise self._failure("timeout", timeout)
+        await asyncio.sleep(latency)
+        if failure:
+            raise self._failure(failure, timeout)
+        return self._response(prompt)
+
+    def stream(self, prompt: str, timeout: float) -> Iterator[LLMResponse]:
+        latency, failure = self._plan(prompt)
+        if failure == "timeout" or latency > timeout:
+            time.sleep(min(latency, timeout))
+            raise self._failure("timeout", timeout)
+        response = self._response(prompt)
+        words = response.text.split(" ")
+        size = max(1, math.ceil(len(words) / self.stream_chunks))
+        # A third of the latency is time-to-first-token, the rest is spread over the chunks
+        time.sleep(latency / 3)
+        if failure:
+            raise self._failure(failure, timeout)
+        for i in range(0, len(words), size):
+            if i:
+                time.sleep(latency * 2 / 3 / self.stream_chunks)
+            yield LLMResponse(" ".join(words[i:i + size]) + (" " if i + size < len(words) else ""))
+        yield LLMResponse("", prompt_tokens=response.prompt_tokens, output_tokens=response.output_tokens)
+
+
+# --- HTTP stand-in ---
+
+class HTTPBackend:
+    """
+    Client for an HTTP backend speaking a minimal JSON protocol:
+
+    * ``POST /v1/generate`` ``{"prompt": ...}`` -> ``{"text": ..., "prompt_tokens": ..., "output_tokens": ...}``
+    * ``POST /v1/stream`` ``{"prompt": ...}`` -> newline-delimited objects of the same shape
+
+    Errors are signalled with HTTP status codes (429 quota, 5xx transient, 504 timeout).
+    """
+
+    def __init__(self, base_url: str = "http://127.0.0.1:8765", name: str = "http-llm"):
+        self.base_url = base_url.rstrip("/")
+        self.name = name
+
+    def _request(self, path: str, prompt: str, timeout: float):
+        import urllib.error
+        import urllib.request
+
+        request = urllib.request.Request(
+            self.base_url + path,
+            data=json.dumps({"prompt": prompt}).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        try:
+            return urllib.request.urlopen(request, timeout=timeout)
+        except urllib.error.HTTPError as e:
+            raise BackendHTTPError(e.code, e.read().decode("utf-8", "replace")) from e
+
+    def generate(self, prompt: str, timeout: float) -> LLMResponse:
+        with self._request("/v1/generate", prompt, timeout) as response:
+            return LLMResponse(**json.loads(response.read()))
+
+    async def generate_async(self, prompt: str, timeout: float) -> LLMResponse:
+        # Plain HTTP/1.1 over asyncio streams keeps this dependency-free and truly non-blocking
+        import asyncio
+        import urllib.parse
+
+        url = urllib.parse.urlsplit(self.base_url + "/v1/generate")
+        body = json.dumps({"prompt": prompt}).encode("utf-8")
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(url.hostname, url.port or 80), timeout
+        )
+        try:
+            writer.write(
+                f"POST {url.path} HTTP/1.1\r\nHost: {url.netloc}\r\nContent-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode("ascii") + body
+            )
+            await writer.drain()
+            raw = await asyncio.wait_for(reader.read(), timeout)
+        finally:
+            writer.close()
+        head, _, payload = raw.partition(b"\r\n\r\n")
+        status = int(head.split(b" ", 2)[1])
+        if status >= 400:
+            raise BackendHTTPError(status, payload.decode("utf-8", "replace"))
+        return LLMResponse(**json.loads(payload))
+
+    def stream(self, prompt: str, timeout: float) -> Iterator[LLMResponse]:
+        with self._request("/v1/stream", prompt, timeout) as response:
+            for line in response:
+                if line.strip():
+                    yield LLMResponse(**json.loads(line))
+
+
+def create_backend(kind: Optional[str] = None, generation_config: Optional[dict] = None) -> Backend:
+    """
+    Builds the backend selected by `kind` or the VMD_LLM_BACKEND environment variable.
+
+    Backend-specific settings are read from the environment:
+    GEMINI_API_KEY / VMD_MODEL_NAME (gemini), VMD_FAKE_LATENCY / VMD_FAKE_FAILURE_RATE /
+    VMD_FAKE_SEED (fake) and VMD_HTTP_BACKEND_URL (http).
+    """
+    kind = (kind or os.getenv("VMD_LLM_BACKEND", "gemini")).lower()
+    if kind == "gemini":
+        return GeminiBackend(
+            os.getenv("VMD_MODEL_NAME", "gemini-2.0-flash"),
+            api_key=os.getenv("GEMINI_API_KEY"),
+            generation_config=generation_config,
+        )
+    if kind == "fake":
+        return FakeBackend(
+            latency=os.getenv("VMD_FAKE_LATENCY", "lognormal:300,0.4"),
+            failure_rate=float(os.getenv("VMD_FAKE_FAILURE_RATE", "0")),
+            seed=int(os.getenv("VMD_FAKE_SEED", "0")),
+        )
+    if kind == "http":
+        return HTTPBackend(os.getenv("VMD_HTTP_BACKEND_URL", "http://127.0.0.1:8765"))
+    raise ValueError(f"Unknown VMD_LLM_BACKEND: {kind!r} (expected 'gemini', 'fake' or 'http')")
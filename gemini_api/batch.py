@@ -0,0 +1,194 @@
+"""
+Bulk generation of resume summaries and cover letters for a whole cohort of candidates.
+
+Usage:
+    python -m gemini_api.batch candidates.csv results.jsonl --doc-type both --concurrency 8
+
+Input rows are streamed from a CSV or JSONL file with the columns `name`, `title`,
+`company`, `skills`, `experience` and optionally `id`, `tone`, `language`, `length`.
+Results are appended to the JSONL output file as soon as each document finishes. The
+output file doubles as the checkpoint: re-running the same command skips every
+(id, doc_type) pair that already has a successful record, so a crashed run resumes
+where it stopped. Failed records are retried on the next run; the later record for a
+given pair supersedes earlier ones.
+"""
+import argparse
+import asyncio
+import csv
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Iterator
+
+from . import aio
+
+DOC_TYPES = ("resume", "cover_letter")
+
+
+@dataclass
+class BatchReport:
+    """Summary of a batch run."""
+    succeeded: int = 0
+    failed: int = 0
+    skipped: int = 0
+    elapsed_seconds: float = 0.0
+    failures: list = field(default_factory=list)
+
+    @property
+    def docs_per_second(self) -> float:
+        return self.succeeded / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+
+def iter_rows(path: str) -> Iterator[dict]:
+    """
+    Streams candidate rows from a CSV or JSONL file without loading it into memory.
+
+    Rows without an `id` column get their 1-based position in the file as id.
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.lower().endswith((".jsonl", ".ndjson")):
+            rows = (json.loads(line) for line in f if line.strip())
+        else:
+            rows = csv.DictReader(f)
+        for index, row in enumerate(rows, start=1):
+            row = {key.strip(): (value or "").strip() if isinstance(value, str) else value
+                   for key, value in row.items() if key}
+            row.setdefault("id", str(index))
+            row["id"] = str(row["id"] or index)
+            yield row
+
+
+def load_checkpoint(output_path: str) -> set:
+    """Returns the (id, doc_type) pairs that already have a successful record in the output file."""
+    done = set()
+    if not os.path.exists(output_path):
+        return done
+    with open(output_path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # Partially written last line from a crashed run
+            if record.get("ok"):
+                done.add((str(record["id"]), record["doc_type"]))
+    return done
+
+
+def _ends_without_newline(path: str) -> bool:
+    with open(path, "rb") as f:
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) != b"\n"
+
+
+async def _generate(row: dict, doc_type: str) -> str:
+    title = row.get("title") or row.get("job_title", "")
+    if doc_type == "resume":
+        return await aio.generate_resume_summary(
+            row.get("name", ""), title, row.get("skills", ""), row.get("experience", ""),
+            row.get("tone") or "Formal", row.get("language") or "English", row.get("length") or "Concise",
+        )
+    return await aio.generate_cover_letter(
+        row.get("name", ""), title, row.get("company", ""), row.get("skills", ""), row.get("experience", ""),
+        row.get("tone") or "Formal", row.get("language") or "English", row.get("length") or "Standard",
+    )
+
+
+async def run_batch(input_path: str, output_path: str, doc_types: list, concurrency: int = 4) -> BatchReport:
+    """
+    Generates documents for every row of `input_path`, appending results to `output_path`.
+
+    Args:
+        input_path (str): CSV or JSONL file with one candidate per row.
+        output_path (str): JSONL file results are appended to; also used as the checkpoint.
+        doc_types (list): Document types to generate per row ("resume", "cover_letter").
+        concurrency (int): Maximum number of model requests in flight.
+
+    Returns:
+        BatchReport: Counts, elapsed time and throughput of the run.
+    """
+    report = BatchReport()
+    done = load_checkpoint(output_path)
+    queue: asyncio.Queue = asyncio.Queue(maxsize=concurrency * 2)
+    started = time.perf_counter()
+
+    with open(output_path, "a", encoding="utf-8") as out:
+        if out.tell() and _ends_without_newline(output_path):
+            out.write("\n")  # Terminate a line cut short by a crash so the next record starts cleanly
+
+        async def worker():
+            while True:
+                job = await queue.get()
+                if job is None:
+                    queue.task_done()
+                    return
+                row, doc_type = job
+                try:
+                    call_started = time.perf_counter()
+                    try:
+                        text = await _generate(row, doc_type)
+                        ok, error = text.ok, None if text.ok else type(text.error).__name__
+                    except Exception as e:
+                        # A bad row or an unexpected error fails this job only; a dead worker would deadlock the queue
+                        text, ok, error = "", False, type(e).__name__
+                    record = {
+                        "id": row["id"],
+                        "doc_type": doc_type,
+                        "ok": ok,
+                        "error": error,
+                        "text": text,
+                        "elapsed_s": round(time.perf_counter() - call_started, 3),
+                    }
+                    out.write(json.dumps(record, ensure_ascii=False) + "\n")
+                    out.flush()  # Every finished document is durable before the next one is reported
+                    if ok:
+                        report.succeeded += 1
+                    else:
+                        report.failed += 1
+                        report.failures.append((row["id"], doc_type))
+                finally:
+                    queue.task_done()
+
+        workers = [asyncio.create_task(worker()) for _ in range(max(1, concurrency))]
+        for row in iter_rows(input_path):
+            for doc_type in doc_types:
+                if (row["id"], doc_type) in done:
+                    report.skipped += 1
+                    continue
+                await queue.put((row, doc_type))  # Blocks while the queue is full, bounding memory
+        for _ in workers:
+            await queue.put(None)
+        await asyncio.gather(*workers)
+
+    report.elapsed_seconds = time.perf_counter() - started
+    return report
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m gemini_api.batch",
+        description="Generate resume summaries and/or cover letters for every candidate in a CSV/JSONL file.",
+    )
+    parser.add_argument("input", help="CSV or JSONL file with one candidate per row.")
+    parser.add_argument("output", help="JSONL file to append results to (also used to resume).")
+    parser.add_argument("--doc-type", choices=["resume", "cover_letter", "both"], default="both",
+                        help="Which documents to generate for each row (default: both).")
+    parser.add_argument("--concurrency", type=int, default=4,
+                        help="Maximum number of concurrent model requests (default: 4).")
+    args = parser.parse_args(argv)
+
+    doc_types = list(DOC_TYPES) if args.doc_type == "both" else [args.doc_type]
+    report = asyncio.run(run_batch(args.input, args.output, doc_types, args.concurrency))
+
+    print(
+        f"Generated {report.succeeded} documents in {report.elapsed_seconds:.1f}s "
+        f"({report.docs_per_second:.2f} docs/sec); {report.failed} failed, "
+        f"{report.skipped} skipped from checkpoint.",
+        file=sys.stderr,
+    )
+    return 1 if report.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,283 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from typing import Optional
+
+DISK_RETRY_SECONDS = 60.0   # Memory-only period after a disk tier error, before the file is tried again
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def normalize_prompt(prompt: str) -> str:
+    """
+    Normalizes a prompt so that whitespace-only differences map to the same cache entry.
+
+    Trailing whitespace and common indentation are removed from every line, and runs of
+    blank lines are collapsed into a single blank line.
+    """
+    lines = [line.rstrip() for line in prompt.strip("\n").splitlines()]
+    indents = [len(line) - len(line.lstrip()) for line in lines if line.strip()]
+    margin = min(indents) if indents else 0
+    normalized = []
+    for line in lines:
+        line = line[margin:] if line[:margin].isspace() else line.lstrip()
+        if not line and normalized and not normalized[-1]:
+            continue  # Collapse consecutive blank lines
+        normalized.append(line)
+    return "\n".join(normalized).strip()
+
+
+def make_cache_key(model_name: str, prompt: str, generation_config: Optional[dict] = None) -> str:
+    """
+    Builds a content-addressed cache key from the model name, normalized prompt and generation config.
+
+    Args:
+        model_name (str): Name of the model that will serve the request.
+        prompt (str): The raw prompt string.
+        generation_config (dict): Generation parameters (temperature, max tokens, ...).
+
+    Returns:
+        str: A hex SHA-256 digest identifying the request.
+    """
+    payload = json.dumps(
+        {
+            "model": model_name,
+            "prompt": normalize_prompt(prompt),
+            "config": generation_config or {},
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """Counters describing cache effectiveness."""
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    stores: int = 0
+    disk_errors: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def as_dict(self) -> dict:
+        stats = asdict(self)
+        stats["hits"] = self.hits
+        stats["hit_ratio"] = round(self.hit_ratio, 4)
+        return stats
+
+
+class ResponseCache:
+    """
+    Two-tier response cache: an in-process LRU with TTL in front of an on-disk SQLite store.
+
+    The memory tier answers repeated requests within a process; the SQLite tier survives
+    restarts and is shared by every process pointing at the same file. Both tiers are
+    thread-safe so concurrent Streamlit sessions can share one instance.
+
+    The SQLite tier is capped by row count and by stored bytes; expired and excess rows
+    (oldest first) are pruned when the file is opened and every `prune_every` stores. A disk
+    error (read-only or full filesystem, locked or corrupt file) is logged and the cache runs
+    memory-only for DISK_RETRY_SECONDS; it never fails the request it was serving.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 3600.0,
+                 db_path: Optional[str] = None, disk_ttl_seconds: Optional[float] = None,
+                 max_disk_entries: int = 20000, max_disk_bytes: int = 64 * 1024 * 1024,
+                 prune_every: int = 256):
+        """
+        Args:
+            max_entries (int): Maximum number of responses kept in memory before LRU eviction.
+            ttl_seconds (float): Lifetime of an in-memory entry.
+            db_path (str): Path of the SQLite file for the disk tier, or None to disable it.
+            disk_ttl_seconds (float): Lifetime of an on-disk entry (defaults to 7 days).
+            max_disk_entries (int): Maximum number of responses kept on disk.
+            max_disk_bytes (int): Maximum total size of the responses kept on disk.
+            prune_every (int): Number of disk stores between two prunes.
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.disk_ttl_seconds = disk_ttl_seconds if disk_ttl_seconds is not None else 7 * 24 * 3600.0
+        self.max_disk_entries = max_disk_entries
+        self.max_disk_bytes = max_disk_bytes
+        self.prune_every = max(1, prune_every)
+        self.stats = CacheStats()
+        self._memory: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.db_path = db_path
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        self._disk_retry_at = 0.0
+        self._stores_since_prune = 0
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        # Caller must hold self._db_lock. The file is opened on first use, not at import time.
+        if self._db is None and self.db_path:
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            db = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+            try:
+                db.execute("PRAGMA journal_mode=WAL")
+                db.execute("PRAGMA synchronous=NORMAL")
+                db.execute(
+                    "CREATE TABLE IF NOT EXISTS responses ("
+                    " key TEXT PRIMARY KEY,"
+                    " value TEXT NOT NULL,"
+                    " created_at REAL NOT NULL)"
+                )
+                db.execute("CREATE INDEX IF NOT EXISTS responses_created_at ON responses (created_at)")
+                self._prune(db)
+            except BaseException:
+                db.close()
+                raise
+            self._db = db
+        return self._db
+
+    def _disk_available(self) -> bool:
+        # Caller must hold self._db_lock
+        return bool(self.db_path) and time.monotonic() >= self._disk_retry_at
+
+    def _disk_failed(self, action: str) -> None:
+        """Logs a disk tier error and switches to memory-only for a while. Caller must hold self._db_lock."""
+        _LOGGER.exception("Response cache could not %s %s; using memory only for %.0fs",
+                          action, self.db_path, DISK_RETRY_SECONDS)
+        with self._lock:
+            self.stats.disk_errors += 1
+        if self._db is not None:
+            try:
+                self._db.close()
+            except sqlite3.Error:
+                pass
+            self._db = None
+        self._disk_retry_at = time.monotonic() + DISK_RETRY_SECONDS
+
+    def _prune(self, db: sqlite3.Connection) -> None:
+        """Deletes expired rows, then the oldest rows beyond the row and byte caps. Caller must hold self._db_lock."""
+        expired = db.execute(
+            "DELETE FROM responses WHERE created_at < ?", (time.time() - self.disk_ttl_seconds,)
+        ).rowcount
+        evicted = db.execute(
+            "DELETE FROM responses WHERE key IN"
+            " (SELECT key FROM responses ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_disk_entries,),
+        ).rowcount
+        evicted += db.execute(
+            "DELETE FROM responses WHERE key IN (SELECT key FROM"
+            " (SELECT key, SUM(LENGTH(CAST(value AS BLOB))) OVER (ORDER BY created_at DESC) AS total FROM responses)"
+            " WHERE total > ?)",
+            (self.max_disk_bytes,),
+        ).rowcount
+        self._stores_since_prune = 0
+        with self._lock:
+            self.stats.expirations += max(0, expired)
+            self.stats.evictions += max(0, evicted)
+
+    def get(self, key: str) -> Optional[str]:
+        """Returns the cached response for a key, or None on a miss."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._memory.move_to_end(key)
+                    self.stats.memory_hits += 1
+                    return value
+                del self._memory[key]
+                self.stats.expirations += 1
+
+        value = self._disk_get(key)
+        with self._lock:
+            if value is None:
+                self.stats.misses += 1
+                return None
+            self.stats.disk_hits += 1
+            self._memory_put(key, value, now)
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        """Stores a successful response in both tiers."""
+        with self._lock:
+            self._memory_put(key, value, time.monotonic())
+            self.stats.stores += 1
+        self._disk_put(key, value)
+
+    def clear(self) -> None:
+        """Drops every entry from both tiers. Counters are left untouched."""
+        with self._lock:
+            self._memory.clear()
+        with self._db_lock:
+            if not self._disk_available():
+                return
+            try:
+                self._connection().execute("DELETE FROM responses")
+            except (sqlite3.Error, OSError):
+                self._disk_failed("clear")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._memory)
+
+    def _memory_put(self, key: str, value: str, now: float) -> None:
+        # Caller must hold self._lock
+        self._memory[key] = (now + self.ttl_seconds, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.stats.evictions += 1
+
+    def _disk_get(self, key: str) -> Optional[str]:
+        with self._db_lock:
+            if not self._disk_available():
+                return None
+            try:
+                db = self._connection()
+                row = db.execute(
+                    "SELECT value, created_at FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                value, created_at = row
+                if time.time() - created_at > self.disk_ttl_seconds:
+                    db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    with self._lock:
+                        self.stats.expirations += 1
+                    return None
+            except (sqlite3.Error, OSError):
+                self._disk_failed("read")
+                return None
+        return value
+
+    def _disk_put(self, key: str, value: str) -> None:
+        with self._db_lock:
+            if not self._disk_available():
+                return
+            try:
+                db = self._connection()
+                db.execute(
+                    "INSERT OR REPLACE INTO responses (key, value, created_at) VALUES (?, ?, ?)",
+                    (key, value, time.time()),
+                )
+                self._stores_since_prune += 1
+                if self._stores_since_prune >= self.prune_every:
+                    self._prune(db)
+            except (sqlite3.Error, OSError):
+                self._disk_failed("write")
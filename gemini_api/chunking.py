@@ -0,0 +1,174 @@
+"""
+Map-reduce helpers for inputs too long to send in a single prompt.
+
+A long job description is split on section and paragraph boundaries (`split_text`), each
+chunk is sent as its own prompt concurrently (`map_chunks` / `map_chunks_async`), and the
+partial answers are merged, either locally (`merge_keyword_lists`) or with one short reduce
+prompt built by the caller. Latency then grows with the number of chunks divided by the
+available concurrency instead of with the length of the document, and every chunk is cached
+on its own, so re-analyzing a posting that changed in one section only re-sends that section.
+"""
+import contextvars
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, Optional
+
+_BLANK_LINES = re.compile(r"\n\s*\n")
+_SENTENCE_END = re.compile(r"(?<=[.!?;])\s+")
+_BULLET = re.compile(r"^\s*(?:[-*•▪●]|\d+[.)])\s*")
+
+
+def _is_heading(block: str) -> bool:
+    """Heuristic for a section title: '## Requirements', 'RESPONSIBILITIES', 'What you'll do:'."""
+    first_line = block.lstrip().split("\n", 1)[0].strip()
+    if not first_line or len(first_line) > 80:
+        return False
+    return (first_line.startswith("#") or first_line.endswith(":")
+            or (first_line.isupper() and any(c.isalpha() for c in first_line)))
+
+
+def _merge_headings(blocks: list) -> list:
+    """Strips blocks, dropping empty ones and attaching a lone heading line to the block below it."""
+    merged, heading = [], ""
+    for block in blocks:
+        block = block.strip()
+        if not block:
+            continue
+        if heading:
+            block = f"{heading}\n{block}"
+            heading = ""
+        if "\n" not in block and _is_heading(block):
+            heading = block
+        else:
+            merged.append(block)
+    if heading:
+        merged.append(heading)
+    return merged
+
+
+def _units(block: str, max_chars: int) -> Iterator[tuple]:
+    """Breaks a block into (separator, text) units of at most `max_chars`: lines, then sentences, then words."""
+    for line in block.split("\n"):
+        separator = "\n"
+        for sentence in ([line] if len(line) <= max_chars else _SENTENCE_END.split(line)):
+            while len(sentence) > max_chars:
+                cut = sentence.rfind(" ", 0, max_chars)
+                cut = cut if cut > max_chars // 2 else max_chars
+                yield separator, sentence[:cut]
+                sentence, separator = sentence[cut:], " "
+            yield separator, sentence
+            separator = " "
+
+
+def _split_oversized(block: str, max_chars: int) -> list:
+    """Splits a paragraph longer than a chunk into pieces of at most `max_chars`, packing units greedily."""
+    pieces, current = [], ""
+    for separator, unit in _units(block, max_chars):
+        unit = unit.strip()
+        if not unit:
+            continue
+        candidate = f"{current}{separator}{unit}" if current else unit
+        if len(candidate) > max_chars:
+            pieces.append(current)
+            current = unit
+        else:
+            current = candidate
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def split_text(text: str, max_tokens: int) -> list:
+    """
+    Splits text into chunks of at most ~`max_tokens` tokens on natural boundaries.
+
+    Paragraphs (blank-line separated) are never split unless a single paragraph exceeds the
+    chunk size, and a new chunk is started at a section heading once the current chunk is
+    at least half full, so related requirements tend to stay together.
+
+    Args:
+        text (str): The document to split.
+        max_tokens (int): Chunk size, in tokens estimated at ~4 characters per token.
+
+    Returns:
+        list: The chunks, in document order; `[text]` if it already fits.
+    """
+    max_chars = max(200, max_tokens * 4)
+    text = text.strip()
+    if len(text) <= max_chars:
+        return [text] if text else []
+    chunks, current = [], ""
+    for block in _merge_headings(_BLANK_LINES.split(text)):
+        if len(block) > max_chars:
+            if current:
+                chunks.append(current)
+            pieces = _split_oversized(block, max_chars)
+            chunks.extend(pieces[:-1])
+            current = pieces[-1]  # The tail may still share a chunk with what follows
+            continue
+        section_break = _is_heading(block) and len(current) >= max_chars // 2
+        candidate = f"{current}\n\n{block}" if current else block
+        if current and (section_break or len(candidate) > max_chars):
+            chunks.append(current)
+            current = block
+        else:
+            current = candidate
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def map_chunks(prompts: list, generate: Callable, max_workers: int = 8) -> list:
+    """
+    Sends every prompt concurrently from a thread pool and returns the results in order.
+
+    Each task runs in a copy of the caller's context, so metrics stay attributed to the
+    generator that started the map step. The shared rate limiter still bounds how many
+    requests are actually in flight.
+    """
+    if len(prompts) == 1:
+        return [generate(prompts[0])]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(prompts)), thread_name_prefix="vmd-chunk") as pool:
+        futures = [pool.submit(contextvars.copy_context().run, generate, prompt) for prompt in prompts]
+        return [future.result() for future in futures]
+
+
+async def map_chunks_async(prompts: list, generate: Callable) -> list:
+    """Async counterpart of `map_chunks`; `generate` is a coroutine function."""
+    import asyncio
+
+    return list(await asyncio.gather(*(generate(prompt) for prompt in prompts)))
+
+
+def first_error(results: list) -> Optional[str]:
+    """Returns the first failed `GenerationResult` of a map step, or None if all succeeded."""
+    return next((result for result in results if not result.ok), None)
+
+
+def merge_keyword_lists(partials: list) -> str:
+    """
+    Reduces comma/line separated keyword lists into one de-duplicated list.
+
+    Keywords found in more chunks come first; ties keep their order of first appearance.
+    """
+    counts, display = {}, {}
+    for partial in partials:
+        seen = set()
+        for item in re.split(r"[,\n]", partial):
+            keyword = _BULLET.sub("", item).strip().strip(".;*").strip()
+            key = keyword.casefold()
+            if not keyword or key in seen or len(keyword) > 80:
+                continue
+            seen.add(key)
+            display.setdefault(key, keyword)
+            counts[key] = counts.get(key, 0) + 1
+    if not display:
+        return "\n\n".join(partial.strip() for partial in partials)  # Not keyword lists; keep them verbatim
+    order = {key: position for position, key in enumerate(display)}
+    ranked = sorted(display, key=lambda key: (-counts[key], order[key]))
+    return ", ".join(display[key] for key in ranked)
+
+
+def format_partials(partials: list) -> str:
+    """Lays out partial answers as numbered, delimited parts for a reduce prompt."""
+    return "\n\n".join(f"Part {number}:\n---\n{partial.strip()}\n---" for number, partial in enumerate(partials, start=1))
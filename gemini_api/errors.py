@@ -0,0 +1,77 @@
+from typing import Optional
+
+
+class GenerationError(Exception):
+    """Base class for every failure of a VMD AI generation call."""
+
+    #: Whether retrying the same request may succeed.
+    retryable = False
+
+    @property
+    def user_message(self) -> str:
+        """Message suitable for showing to the end user."""
+        return f"VMD AI encountered an error: {self}. Please try again or refine your input."
+
+
+class InvalidRequestError(GenerationError):
+    """The request itself is invalid (bad arguments, rejected prompt, auth/permission errors)."""
+
+
+class EmptyResponseError(GenerationError):
+    """The model returned no text, usually because the output was filtered."""
+
+    @property
+    def user_message(self) -> str:
+        return "VMD AI could not generate content for this request. Please try refining your input."
+
+
+class TransientGenerationError(GenerationError):
+    """A temporary upstream failure (5xx, connection reset); retrying may succeed."""
+
+    retryable = True
+
+
+class RateLimitedError(TransientGenerationError):
+    """The upstream quota was exhausted (HTTP 429 / RESOURCE_EXHAUSTED)."""
+
+
+class DeadlineExceededError(TransientGenerationError):
+    """The call did not finish within its deadline."""
+
+
+class CircuitOpenError(GenerationError):
+    """The circuit breaker is open; the call was rejected without contacting the backend."""
+
+    @property
+    def user_message(self) -> str:
+        return "VMD AI is temporarily unavailable. Please try again in a few seconds."
+
+
+class GenerationResult(str):
+    """
+    Text returned by the `generate_*` functions.
+
+    It behaves exactly like the string callers always received (generated text, or a
+    user-facing error message), and additionally carries the typed error so callers can
+    branch on `result.ok` instead of matching substrings.
+    """
+
+    error: Optional[GenerationError]
+
+    def __new__(cls, text: str, error: Optional[GenerationError] = None):
+        result = super().__new__(cls, text)
+        result.error = error
+        return result
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def raise_for_error(self) -> "GenerationResult":
+        """Raises the carried `GenerationError`, if any; otherwise returns self."""
+        if self.error is not None:
+            raise self.error
+        return self
+
+    def __reduce__(self):
+        return (GenerationResult, (str(self), self.error))
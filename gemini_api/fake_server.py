@@ -0,0 +1,113 @@
+"""
+HTTP stand-in for the model, backed by `FakeBackend`.
+
+Usage:
+    python -m gemini_api.fake_server --port 8765 --latency lognormal:300,0.4 --failure-rate 0.05
+
+Point the app at it with VMD_LLM_BACKEND=http VMD_HTTP_BACKEND_URL=http://127.0.0.1:8765.
+It implements the protocol described in `gemini_api.backends.HTTPBackend` and turns the
+fake's simulated failures into the matching status codes (429, 503, 504).
+"""
+import argparse
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+from .backends import FakeBackend, ResourceExhausted
+
+
+def _status_for(error: Exception) -> int:
+    if isinstance(error, ResourceExhausted):
+        return 429
+    if isinstance(error, TimeoutError):
+        return 504
+    return 503
+
+
+class _Handler(BaseHTTPRequestHandler):
+    backend: FakeBackend
+    timeout_seconds: float = 60.0
+    protocol_version = "HTTP/1.0"  # Close-delimited bodies make streaming trivial
+
+    def log_message(self, format, *args):
+        pass  # Keep load tests quiet
+
+    def _send_json(self, status: int, payload: dict) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_prompt(self) -> Optional[str]:
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            return json.loads(self.rfile.read(length))["prompt"]
+        except (ValueError, KeyError):
+            self._send_json(400, {"error": "expected a JSON body with a 'prompt' field"})
+            return None
+
+    def do_POST(self):
+        if self.path not in ("/v1/generate", "/v1/stream"):
+            self._send_json(404, {"error": f"unknown endpoint {self.path}"})
+            return
+        prompt = self._read_prompt()
+        if prompt is None:
+            return
+        if self.path == "/v1/generate":
+            try:
+                response = self.backend.generate(prompt, self.timeout_seconds)
+            except Exception as e:
+                self._send_json(_status_for(e), {"error": str(e)})
+                return
+            self._send_json(200, vars(response))
+            return
+
+        chunks = self.backend.stream(prompt, self.timeout_seconds)
+        try:
+            first = next(chunks)
+        except Exception as e:
+            self._send_json(_status_for(e), {"error": str(e)})
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.end_headers()
+        for chunk in [first, *chunks]:
+            self.wfile.write(json.dumps(vars(chunk)).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+
+def make_server(backend: FakeBackend, host: str = "127.0.0.1", port: int = 8765) -> ThreadingHTTPServer:
+    """Builds (without starting) a threaded HTTP server answering with `backend`."""
+    handler = type("FakeModelHandler", (_Handler,), {"backend": backend})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m gemini_api.fake_server",
+                                     description="Serve a deterministic fake LLM over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", default="lognormal:300,0.4",
+                        help="Latency distribution in ms, e.g. constant:200, uniform:100,300, lognormal:300,0.4.")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Probability (0-1) that a call fails.")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    backend = FakeBackend(latency=args.latency, failure_rate=args.failure_rate, seed=args.seed)
+    server = make_server(backend, args.host, args.port)
+    print(f"Fake LLM listening on http://{args.host}:{args.port} (latency {args.latency}, "
+          f"failure rate {args.failure_rate:.0%})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,339 @@
+"""
+Offline keyword extraction for job descriptions and resumes.
+
+Runs in a few milliseconds without a model call by combining three signals:
+
+* a skills lexicon that maps known skills and their aliases ("ML", "k8s", "Python 3")
+  to one canonical name,
+* RAKE-style phrase scoring (candidate phrases are the runs of words between stopwords
+  and punctuation; a word scores its co-occurrence degree over its frequency), and
+* TF-IDF, with the document's own sentences as the corpus unless background IDF weights
+  are supplied.
+
+Used as the "local" engine of `gemini_api.generate_keywords` and of
+`analyze_job_description(..., "Key Skills and Requirements")`.
+"""
+import math
+import re
+from dataclasses import dataclass
+from typing import Optional
+
+# Canonical skill -> aliases (matched case-insensitively, on whole tokens).
+# The canonical name itself is an alias too, except for AMBIGUOUS_NAMES. ats_scoring, jd_index
+# and screening match resumes through this table too, so an alias must not be an everyday
+# word or phrase ("coaching", "social media", "ai").
+SKILL_LEXICON = {
+    # Languages
+    "Python": ("python3", "python 3"),
+    "Java": ("java 8", "java 11", "java 17"),
+    "JavaScript": ("js", "ecmascript", "es6"),
+    "TypeScript": (),
+    "C++": ("cpp", "c plus plus"),
+    "C#": ("csharp", "c sharp"),
+    "Go": ("golang",),
+    "Rust": (),
+    "Ruby": (),
+    "PHP": (),
+    "Kotlin": (),
+    "Swift": (),
+    "Scala": (),
+    "SQL": ("structured query language",),
+    "Bash": ("shell scripting", "shell script"),
+    "HTML": ("html5",),
+    "CSS": ("css3",),
+    "MATLAB": (),
+    # Frameworks and libraries
+    "React": ("react.js", "reactjs"),
+    "Angular": ("angularjs", "angular.js"),
+    "Vue.js": ("vue", "vuejs"),
+    "Node.js": ("nodejs",),
+    "Express": ("express.js", "expressjs"),
+    "Django": (),
+    "Flask": (),
+    "FastAPI": (),
+    "Spring Boot": ("spring framework",),
+    ".NET": ("dotnet", "asp.net", ".net core"),
+    "Ruby on Rails": (),
+    "TensorFlow": ("tf2",),
+    "PyTorch": (),
+    "scikit-learn": ("sklearn", "scikit learn"),
+    "Pandas": (),
+    "NumPy": (),
+    "Spark": ("apache spark", "pyspark"),
+    "Hadoop": (),
+    "Kafka": ("apache kafka",),
+    "Airflow": ("apache airflow",),
+    "GraphQL": (),
+    "REST APIs": ("restful", "rest api", "restful api", "restful apis"),
+    "Microservices": ("microservice", "micro-services"),
+    # Data stores
+    "PostgreSQL": ("postgres", "psql"),
+    "MySQL": (),
+    "MongoDB": ("mongo",),
+    "Redis": (),
+    "Elasticsearch": ("elastic search", "elk"),
+    "Snowflake": (),
+    "BigQuery": ("big query",),
+    "DynamoDB": (),
+    "Oracle": ("oracle db",),
+    "NoSQL": (),
+    # Cloud and infrastructure
+    "AWS": ("amazon web services",),
+    "Azure": ("microsoft azure",),
+    "GCP": ("google cloud", "google cloud platform"),
+    "Docker": ("containerization",),
+    "Kubernetes": ("k8s",),
+    "Terraform": (),
+    "Ansible": (),
+    "CI/CD": ("ci cd", "continuous integration", "continuous delivery", "continuous deployment"),
+    "Jenkins": (),
+    "GitHub Actions": (),
+    "Git": ("github", "gitlab", "version control"),
+    "Linux": ("unix",),
+    "DevOps": (),
+    "Site Reliability Engineering": ("sre",),
+    "Serverless": ("aws lambda",),
+    # Data and AI
+    "Machine Learning": ("ml",),
+    "Deep Learning": (),
+    "Artificial Intelligence": (),
+    "Natural Language Processing": ("nlp",),
+    "Computer Vision": (),
+    "Large Language Models": ("llm", "llms"),
+    "Data Analysis": ("data analytics", "analytics"),
+    "Data Engineering": ("data pipelines", "etl", "elt"),
+    "Data Science": (),
+    "Data Visualization": ("dataviz",),
+    "Statistics": ("statistical analysis", "statistical modeling"),
+    "A/B Testing": ("ab testing", "a/b tests", "experimentation"),
+    "Tableau": (),
+    "Power BI": ("powerbi",),
+    "Excel": ("microsoft excel", "ms excel", "advanced excel", "spreadsheets"),
+    "Looker": (),
+    # Practices
+    "Agile": ("agile methodologies", "agile methodology"),
+    "Scrum": (),
+    "Kanban": (),
+    "Test-Driven Development": ("tdd",),
+    "Unit Testing": ("unit tests",),
+    "Automated Testing": ("test automation",),
+    "System Design": ("distributed systems", "software architecture"),
+    "Object-Oriented Programming": ("oop", "object oriented programming"),
+    "Security": ("cybersecurity", "information security", "infosec"),
+    "Performance Optimization": ("performance tuning",),
+    "Technical Writing": (),
+    # Business and product
+    "Project Management": ("program management",),
+    "Product Management": (),
+    "Stakeholder Management": ("stakeholder communication",),
+    "Jira": (),
+    "Confluence": (),
+    "Salesforce": ("sfdc",),
+    "CRM": ("customer relationship management",),
+    "SEO": ("search engine optimization",),
+    "SEM": ("search engine marketing",),
+    "Digital Marketing": ("online marketing",),
+    "Content Marketing": (),
+    "Social Media Marketing": ("smm",),
+    "Google Analytics": ("ga4",),
+    "Financial Modeling": ("financial modelling",),
+    "Budgeting": ("budget management",),
+    "Forecasting": (),
+    "Business Development": ("bizdev",),
+    "Sales": (),
+    "Customer Service": ("customer support",),
+    "Negotiation": (),
+    "Recruiting": ("recruitment", "talent acquisition"),
+    "UX Design": ("ux", "user experience"),
+    "UI Design": ("user interface design",),
+    "Figma": (),
+    "Adobe Creative Suite": ("adobe photoshop", "photoshop", "illustrator"),
+    # Soft skills
+    "Communication": ("communication skills", "written communication", "verbal communication"),
+    "Leadership": ("team leadership", "people management"),
+    "Mentoring": ("mentorship",),
+    "Problem Solving": ("problem-solving", "troubleshooting"),
+    "Collaboration": ("teamwork", "cross-functional collaboration"),
+    "Time Management": ("prioritization",),
+    "Critical Thinking": ("analytical skills", "analytical thinking"),
+}
+
+# Canonical names that are also common English words; only their aliases are matched
+AMBIGUOUS_NAMES = frozenset({"Go", "Excel"})
+
+STOPWORDS = frozenset("""
+a about above across after again against all almost also am among an and any are as at be because been
+before being below between both but by can could did do does doing down during each either else etc
+every few for from further had has have having he her here hers him his how i if in into is it its
+itself just least less let like may me might more most much must my no nor not of off often on once
+only or other our ours out over own per perhaps please rather same shall she should since so some
+such than that the their them then there these they this those though through thus to too under
+until up upon us very via was we well were what when where whether which while who whom whose why
+will with within without would yet you your yours yourself
+""".split())
+
+# Words that are frequent in job postings but never keywords by themselves
+FILLER_WORDS = frozenset("""
+ability able apply applicant applicants benefits best bonus candidate candidates company compensation
+day days degree demonstrated desired duties environment equal equivalent excellent experience
+experienced familiarity familiar good great help ideal including job join key knowledge looking
+new nice opportunity plus position preferred proficiency proficient proven related relevant required
+requirement requirements responsibilities responsible role salary seeking skill skilled skills
+solid strong successful team teams understanding using work working year years
+""".split())
+
+# Verbs that open duties in job postings; stripped from the start of candidate phrases, so
+# "build data pipelines" yields "data pipelines" and "need Python" never becomes a keyword
+COMMON_VERBS = frozenset("""
+achieve analyze analyse assist build builds coach collaborate communicate conduct contribute
+coordinate create creates define deliver delivers design designs develop develops drive drives
+enable ensure ensures establish evaluate execute grow guide helps hire hiring identify implement
+improve improves lead leads leverage maintain maintains manage manages mentor need needs own
+owns participate partner perform provide provides ship shape support supports translate want
+write writes
+""".split())
+
+_TOKEN = re.compile(r"\.?[A-Za-z0-9][A-Za-z0-9+#/.\-]*")
+_PHRASE_BREAK = re.compile(r"[,;:!?()\[\]{}\"'|•▪●\n\t]|\.(?:\s|$)|\s[-–—]\s")
+_SEGMENT = re.compile(r"(?:\n\s*|(?<=[.!?])\s+)")
+
+
+def tokenize(text: str) -> list:
+    """Lowercased word tokens; keeps '+', '#', '/', '.' and '-' inside tokens (c++, c#, ci/cd, node.js)."""
+    return [token.rstrip(".-/").lower() for token in _TOKEN.findall(text) if token.rstrip(".-/")]
+
+
+def _build_alias_index() -> tuple:
+    index = {}
+    for canonical, aliases in SKILL_LEXICON.items():
+        names = aliases if canonical in AMBIGUOUS_NAMES else (canonical, *aliases)
+        for alias in names:
+            index[tuple(tokenize(alias))] = canonical
+    return index, max(len(key) for key in index)
+
+
+ALIAS_INDEX, _MAX_ALIAS_TOKENS = _build_alias_index()
+
+
+@dataclass
+class Keyword:
+    """One extracted keyword with its combined score."""
+    term: str
+    score: float
+    count: int
+    is_skill: bool
+
+
+def match_skills(tokens: list) -> dict:
+    """
+    Finds lexicon skills in a token list, preferring the longest alias at each position.
+
+    Returns:
+        dict: canonical skill name -> (occurrences, position of the first occurrence).
+    """
+    found = {}
+    i = 0
+    while i < len(tokens):
+        for n in range(min(_MAX_ALIAS_TOKENS, len(tokens) - i), 0, -1):
+            canonical = ALIAS_INDEX.get(tuple(tokens[i:i + n]))
+            if canonical is not None:
+                count, first = found.get(canonical, (0, i))
+                found[canonical] = (count + 1, first)
+                i += n
+                break
+        else:
+            i += 1
+    return found
+
+
+def _candidate_phrases(text: str) -> list:
+    """RAKE candidates: runs of content words between stopwords/punctuation, without leading verbs, at most 4 words long."""
+    phrases = []
+    for fragment in _PHRASE_BREAK.split(text):
+        current = []
+        for token in _TOKEN.findall(fragment):
+            word = token.rstrip(".-/")
+            lowered = word.lower()
+            if not word or lowered in STOPWORDS or lowered in FILLER_WORDS or lowered.isdigit():
+                if current:
+                    phrases.append(current)
+                current = []
+            elif current or lowered not in COMMON_VERBS:
+                current.append(word)
+        if current:
+            phrases.append(current)
+    return [phrase for phrase in phrases if len(phrase) <= 4]
+
+
+def extract_keywords(text: str, top_k: int = 25, idf: Optional[dict] = None) -> list:
+    """
+    Extracts the most important keywords and key phrases from a text.
+
+    Args:
+        text (str): Job description, resume or any other free text.
+        top_k (int): Maximum number of keywords to return.
+        idf (dict): Optional background IDF weights (lowercased word -> idf), e.g. computed over
+            a corpus of job descriptions. By default the text's own sentences are the corpus.
+
+    Returns:
+        list: `Keyword`s, best first. Lexicon skills use their canonical name; other phrases
+        keep the casing of their first occurrence.
+    """
+    if not text.strip():
+        return []
+    tokens = tokenize(text)
+    skills = match_skills(tokens)
+
+    # RAKE word scores: degree (co-occurring words in candidate phrases) over frequency
+    phrases = _candidate_phrases(text)
+    frequency, degree = {}, {}
+    for phrase in phrases:
+        for word in phrase:
+            key = word.lower()
+            frequency[key] = frequency.get(key, 0) + 1
+            degree[key] = degree.get(key, 0) + len(phrase)
+
+    # IDF over the text's sentences/lines unless background weights were supplied
+    if idf is None:
+        segments = [set(tokenize(segment)) for segment in _SEGMENT.split(text) if segment.strip()]
+        document_frequency = {}
+        for segment in segments:
+            for word in segment:
+                document_frequency[word] = document_frequency.get(word, 0) + 1
+        idf = {word: math.log((1 + len(segments)) / (1 + df)) + 1.0 for word, df in document_frequency.items()}
+    default_idf = max(idf.values(), default=1.0)
+
+    candidates = {}  # lowercased phrase -> [display, count, first position, rake score, tf-idf]
+    for position, phrase in enumerate(phrases):
+        key = " ".join(word.lower() for word in phrase)
+        if tuple(tokenize(key)) in ALIAS_INDEX:
+            continue  # Counted as a lexicon skill below
+        if len(phrase) == 1 and (len(key) < 3 or key.endswith("ly")):
+            continue  # Too short to mean anything, or an adverb ("closely")
+        entry = candidates.get(key)
+        if entry is None:
+            words = key.split()
+            rake = sum(degree[w] / frequency[w] for w in words)
+            weight = sum(idf.get(w, default_idf) for w in words) / len(words)
+            candidates[key] = [" ".join(phrase), 1, position, rake, weight]
+        else:
+            entry[1] += 1
+
+    scored = []
+    max_rake = max((entry[3] for entry in candidates.values()), default=1.0) or 1.0
+    max_tfidf = max((entry[1] * entry[4] for entry in candidates.values()), default=1.0) or 1.0
+    for display, count, position, rake, weight in candidates.values():
+        score = 0.5 * rake / max_rake + 0.5 * count * weight / max_tfidf
+        scored.append((score, position, Keyword(display, round(score, 4), count, False)))
+    for canonical, (count, position) in skills.items():
+        # Known skills always outrank free phrases; repeated mentions rank higher
+        score = 1.0 + min(count, 5) * 0.1
+        scored.append((score, -1_000_000 + position, Keyword(canonical, round(score, 4), count, True)))
+
+    scored.sort(key=lambda item: (-item[0], item[1]))
+    return [keyword for _, _, keyword in scored[:top_k]]
+
+
+def format_keywords(keywords: list) -> str:
+    """Comma-separated list of terms, the same shape the LLM engine returns."""
+    return ", ".join(keyword.term for keyword in keywords)
@@ -0,0 +1,295 @@
+"""
+Per-call latency and token instrumentation for `gemini_api`.
+
+Every call that goes through `generate_content`, `generate_content_async` or a
+`GenerationStream` is recorded with its wall time, prompt/output token counts, cache status
+and outcome, labelled with the public generator that issued it. Calls are aggregated into
+per-function counters and latency histograms that can be exported in the Prometheus text
+format:
+
+    VMD_METRICS_PORT=9464   serve http://127.0.0.1:9464/metrics from a background thread
+    VMD_METRICS_FILE=path   rewrite a .prom file (at most every VMD_METRICS_FILE_INTERVAL s)
+
+or programmatically with `registry.render()` / `registry.write(path)`.
+"""
+import functools
+import inspect
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Optional
+
+from .ratelimit import estimate_tokens
+
+# Upper bounds (seconds) of the latency histogram buckets; +Inf is implicit
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+_function_label: ContextVar[str] = ContextVar("vmd_metrics_function", default="generate_content")
+
+
+@dataclass
+class CallRecord:
+    """Measurements for one logical model call (all retry attempts included)."""
+    function: str
+    cache: str = "disabled"          # "hit", "miss" or "disabled"
+    outcome: str = "ok"              # "ok" or the GenerationError subclass name
+    attempts: int = 0
+    prompt_tokens: int = 0
+    output_tokens: int = 0
+    elapsed: float = 0.0
+    started: float = field(default_factory=time.perf_counter)
+
+    def record_usage(self, response, prompt: str = "") -> None:
+        """
+        Adds the token usage reported by an `LLMResponse`.
+
+        Backends that report no usage are charged an estimate (~4 characters per token) so
+        cost rankings stay meaningful with the fake and HTTP backends.
+        """
+        self.prompt_tokens += response.prompt_tokens if response.prompt_tokens is not None else (
+            estimate_tokens(prompt) if prompt else 0)
+        self.output_tokens += response.output_tokens if response.output_tokens is not None else (
+            estimate_tokens(response.text) if response.text else 0)
+
+
+class Histogram:
+    """Fixed-bucket histogram with Prometheus (cumulative) semantics."""
+
+    def __init__(self, buckets: tuple = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # Last slot is the +Inf overflow bucket
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> list:
+        """Returns [(upper_bound, cumulative_count), ...] ending with ("+Inf", count)."""
+        total, rows = 0, []
+        for bound, count in zip(self.buckets + ("+Inf",), self.counts):
+            total += count
+            rows.append((bound, total))
+        return rows
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket containing quantile `q` (inf if it falls in the overflow bucket)."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        for bound, total in self.cumulative():
+            if total >= rank:
+                return float("inf") if bound == "+Inf" else bound
+        return float("inf")
+
+
+class MetricsRegistry:
+    """Thread-safe aggregation of `CallRecord`s into per-function counters and histograms."""
+
+    def __init__(self, dump_path: Optional[str] = None, dump_interval: float = 5.0):
+        """
+        Args:
+            dump_path (str): File rewritten with the Prometheus text after calls, or None.
+            dump_interval (float): Minimum number of seconds between two rewrites of `dump_path`.
+        """
+        self.dump_path = dump_path
+        self.dump_interval = dump_interval
+        self._lock = threading.Lock()
+        self._latency: dict = {}    # function -> Histogram
+        self._calls: dict = {}      # (function, cache, outcome) -> count
+        self._attempts: dict = {}   # function -> count
+        self._tokens: dict = {}     # (function, "prompt" | "output") -> count
+        self._last_dump = 0.0
+
+    def observe(self, record: CallRecord) -> None:
+        """Adds one finished call."""
+        with self._lock:
+            histogram = self._latency.get(record.function)
+            if histogram is None:
+                histogram = self._latency[record.function] = Histogram()
+            histogram.observe(record.elapsed)
+            key = (record.function, record.cache, record.outcome)
+            self._calls[key] = self._calls.get(key, 0) + 1
+            self._attempts[record.function] = self._attempts.get(record.function, 0) + record.attempts
+            for kind, tokens in (("prompt", record.prompt_tokens), ("output", record.output_tokens)):
+                self._tokens[(record.function, kind)] = self._tokens.get((record.function, kind), 0) + tokens
+            due = self.dump_path and time.monotonic() - self._last_dump >= self.dump_interval
+            if due:
+                self._last_dump = time.monotonic()
+        if due:
+            self.write(self.dump_path)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._latency.clear()
+            self._calls.clear()
+            self._attempts.clear()
+            self._tokens.clear()
+
+    def summary(self) -> list:
+        """
+        Per-function totals, most expensive (by total tokens) first.
+
+        Returns:
+            list: One dict per function with calls, errors, cache_hits, attempts, prompt_tokens,
+            output_tokens, total_seconds, mean_seconds and p95_seconds (bucket upper bound).
+        """
+        with self._lock:
+            rows = []
+            for function, histogram in self._latency.items():
+                calls = [(key, n) for key, n in self._calls.items() if key[0] == function]
+                prompt_tokens = self._tokens.get((function, "prompt"), 0)
+                output_tokens = self._tokens.get((function, "output"), 0)
+                rows.append({
+                    "function": function,
+                    "calls": histogram.count,
+                    "errors": sum(n for (_, _, outcome), n in calls if outcome != "ok"),
+                    "cache_hits": sum(n for (_, cache, _), n in calls if cache == "hit"),
+                    "attempts": self._attempts.get(function, 0),
+                    "prompt_tokens": prompt_tokens,
+                    "output_tokens": output_tokens,
+                    "total_seconds": round(histogram.sum, 4),
+                    "mean_seconds": round(histogram.sum / histogram.count, 4) if histogram.count else 0.0,
+                    "p95_seconds": histogram.quantile(0.95),
+                })
+        rows.sort(key=lambda row: (row["prompt_tokens"] + row["output_tokens"], row["total_seconds"]), reverse=True)
+        return rows
+
+    def render(self) -> str:
+        """Returns every metric in the Prometheus text exposition format (version 0.0.4)."""
+        lines = []
+        with self._lock:
+            lines += [
+                "# HELP vmd_llm_calls_total Model calls by generator function, cache status and outcome.",
+                "# TYPE vmd_llm_calls_total counter",
+            ]
+            for (function, cache, outcome), n in sorted(self._calls.items()):
+                lines.append(f'vmd_llm_calls_total{{function="{function}",cache="{cache}",outcome="{outcome}"}} {n}')
+            lines += [
+                "# HELP vmd_llm_attempts_total Backend attempts (including retries) by generator function.",
+                "# TYPE vmd_llm_attempts_total counter",
+            ]
+            for function, n in sorted(self._attempts.items()):
+                lines.append(f'vmd_llm_attempts_total{{function="{function}"}} {n}')
+            lines += [
+                "# HELP vmd_llm_tokens_total Tokens sent to and received from the model by generator function.",
+                "# TYPE vmd_llm_tokens_total counter",
+            ]
+            for (function, kind), n in sorted(self._tokens.items()):
+                lines.append(f'vmd_llm_tokens_total{{function="{function}",kind="{kind}"}} {n}')
+            lines += [
+                "# HELP vmd_llm_call_duration_seconds Wall time of a model call, retries and cache lookup included.",
+                "# TYPE vmd_llm_call_duration_seconds histogram",
+            ]
+            for function, histogram in sorted(self._latency.items()):
+                for bound, total in histogram.cumulative():
+                    lines.append(f'vmd_llm_call_duration_seconds_bucket{{function="{function}",le="{bound}"}} {total}')
+                lines.append(f'vmd_llm_call_duration_seconds_sum{{function="{function}"}} {histogram.sum:.6f}')
+                lines.append(f'vmd_llm_call_duration_seconds_count{{function="{function}"}} {histogram.count}')
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str) -> None:
+        """Atomically replaces `path` with the current metrics (node_exporter textfile style)."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(self.render())
+        os.replace(tmp_path, path)
+
+
+registry = MetricsRegistry(
+    dump_path=os.getenv("VMD_METRICS_FILE") or None,
+    dump_interval=float(os.getenv("VMD_METRICS_FILE_INTERVAL", "5")),
+)
+
+
+def instrumented(function):
+    """Labels every model call made inside `function` (sync or async) with its name."""
+    name = function.__name__
+    if inspect.iscoroutinefunction(function):
+        @functools.wraps(function)
+        async def async_wrapper(*args, **kwargs):
+            token = _function_label.set(name)
+            try:
+                return await function(*args, **kwargs)
+            finally:
+                _function_label.reset(token)
+        return async_wrapper
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        token = _function_label.set(name)
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _function_label.reset(token)
+    return wrapper
+
+
+def current_function() -> str:
+    """Name of the generator the current call is attributed to."""
+    return _function_label.get()
+
+
+@contextmanager
+def track_call(function: Optional[str] = None):
+    """
+    Times the enclosed model call and adds it to `registry` when it finishes.
+
+    Yields the `CallRecord` so the caller can fill in cache status and token usage. A
+    `GenerationError` escaping the block is recorded as the outcome and re-raised.
+    """
+    record = CallRecord(function or current_function())
+    try:
+        yield record
+    except BaseException as e:
+        record.outcome = type(e).__name__
+        raise
+    finally:
+        record.elapsed = time.perf_counter() - record.started
+        registry.observe(record)
+
+
+_server = None
+_server_lock = threading.Lock()
+
+
+def start_http_server(port: int, host: str = "127.0.0.1"):
+    """
+    Serves `registry` at http://host:port/metrics from a daemon thread.
+
+    Safe to call more than once (e.g. on every Streamlit rerun); only the first call binds.
+    """
+    global _server
+    with _server_lock:
+        if _server is not None:
+            return _server
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        class _MetricsHandler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/metrics", "/"):
+                    self.send_error(404)
+                    return
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        _server = ThreadingHTTPServer((host, port), _MetricsHandler)
+        _server.daemon_threads = True
+        threading.Thread(target=_server.serve_forever, name="vmd-metrics", daemon=True).start()
+        return _server
@@ -0,0 +1,415 @@
+"""
+Registry of every prompt template sent by `gemini_api`.
+
+Templates are compiled once at import: indentation, trailing whitespace and runs of blank
+lines are stripped (none of it carries meaning for the model, all of it is billed), and the
+`{field}` placeholders are pre-split so rendering is a single join. Each template declares
+an input budget in tokens; user-supplied values that would exceed it are trimmed, largest
+field first, before the prompt leaves the process.
+
+    python -m gemini_api.prompts    # token cost and budget of every template
+"""
+import string
+import threading
+
+from .cache import normalize_prompt
+from .ratelimit import estimate_tokens
+
+TRUNCATION_MARKER = " [...]"
+
+_lock = threading.Lock()
+
+
+class PromptTemplate:
+    """A whitespace-normalized prompt with named `{field}` placeholders and an input token budget."""
+
+    def __init__(self, name: str, source: str, max_input_tokens: int):
+        """
+        Args:
+            name (str): Registry key, usually the name of the generator that sends the prompt.
+            source (str): Template text using `{field}` placeholders (str.format syntax without specs).
+            max_input_tokens (int): Maximum estimated tokens of all field values combined.
+        """
+        self.name = name
+        self.source = source
+        self.text = normalize_prompt(source)
+        self.max_input_tokens = max_input_tokens
+        self._literals = []
+        self._fields = []
+        for literal, field, spec, conversion in string.Formatter().parse(self.text):
+            if spec or conversion:
+                raise ValueError(f"Template {name!r}: format specs are not supported ({{{field}}})")
+            self._literals.append(literal)
+            if field is not None:
+                if not field.isidentifier():
+                    raise ValueError(f"Template {name!r}: invalid placeholder {{{field}}}")
+                self._fields.append(field)
+        if len(self._literals) == len(self._fields):
+            self._literals.append("")
+        self.fields = tuple(dict.fromkeys(self._fields))
+        self.template_tokens = estimate_tokens("".join(self._literals))
+        self.truncations = 0
+
+    def render(self, **values) -> str:
+        """Fills in the placeholders, trimming values that exceed the input budget."""
+        missing = set(self.fields) - values.keys()
+        if missing:
+            raise TypeError(f"Template {self.name!r} is missing values for {sorted(missing)}")
+        values = {field: str(values[field]) for field in self.fields}
+        if sum(len(v) for v in values.values()) > self.max_input_tokens * 4:
+            values = self._fit_budget(values)
+        parts = []
+        for literal, field in zip(self._literals, self._fields):
+            parts.append(literal)
+            parts.append(values[field])
+        parts.append(self._literals[-1])
+        return "".join(parts)
+
+    def _fit_budget(self, values: dict) -> dict:
+        # Water-filling: short fields keep their full text; the remaining character budget is
+        # split evenly between the fields that are too long for their share.
+        remaining = self.max_input_tokens * 4  # estimate_tokens counts ~4 characters per token
+        allowance = {}
+        ordered = sorted(values, key=lambda field: len(values[field]))
+        for position, field in enumerate(ordered):
+            share = remaining // (len(ordered) - position)
+            allowance[field] = min(len(values[field]), share)
+            remaining -= allowance[field]
+        trimmed = {}
+        for field, value in values.items():
+            limit = allowance[field]
+            if len(value) <= limit:
+                trimmed[field] = value
+                continue
+            cut = value[:max(0, limit - len(TRUNCATION_MARKER))]
+            boundary = cut.rfind(" ")
+            if boundary > len(cut) // 2:
+                cut = cut[:boundary]  # Don't split a word if a boundary is close by
+            trimmed[field] = cut.rstrip() + TRUNCATION_MARKER
+        with _lock:
+            self.truncations += 1
+        return trimmed
+
+    def cost(self) -> dict:
+        """Estimated token cost of the template text, its input budget and how often it was hit."""
+        return {
+            "name": self.name,
+            "fields": list(self.fields),
+            "template_tokens": self.template_tokens,
+            "max_input_tokens": self.max_input_tokens,
+            "max_prompt_tokens": self.template_tokens + self.max_input_tokens,
+            "truncations": self.truncations,
+        }
+
+
+class PromptRegistry:
+    """Name -> `PromptTemplate` mapping shared by every generator."""
+
+    def __init__(self):
+        self._templates: dict = {}
+
+    def register(self, name: str, source: str, max_input_tokens: int) -> PromptTemplate:
+        if name in self._templates:
+            raise ValueError(f"Prompt template {name!r} is already registered")
+        template = self._templates[name] = PromptTemplate(name, source, max_input_tokens)
+        return template
+
+    def get(self, name: str) -> PromptTemplate:
+        return self._templates[name]
+
+    def render(self, template_name: str, /, **values) -> str:
+        return self._templates[template_name].render(**values)
+
+    def names(self) -> list:
+        return list(self._templates)
+
+    def report(self) -> list:
+        """Returns `PromptTemplate.cost()` for every template, in registration order."""
+        return [template.cost() for template in self._templates.values()]
+
+
+registry = PromptRegistry()
+render = registry.render
+
+# --- Documents ---
+
+registry.register("generate_resume_summary", """
+As an expert resume writer using VMD AI, generate a professional, {length} and ATS-optimized resume summary section.
+The summary should be written in a {tone} tone and in {language}.
+It should highlight the candidate's core competencies, achievements, and career goals relevant to the target job.
+
+Candidate Name: {name}
+Target Job Title: {title}
+Key Skills: {skills}
+Professional Experience Summary: {experience}
+
+Ensure the summary is impactful, uses strong action verbs, and is tailored to common resume best practices.
+Focus solely on the summary section{length_description}, avoid adding sections like "Education", "Work Experience", etc.
+""", max_input_tokens=2000)
+
+registry.register("generate_cover_letter", """
+As an expert professional writer using VMD AI, write a {tone} cover letter in {language}{length_description} for a job application.
+The cover letter should clearly state the applicant's interest in the position and the company, highlight relevant skills and experience,
+and explain how their qualifications align with the job requirements.
+
+Candidate Name: {name}
+Target Job Title: {title}
+Target Company: {company}
+Key Skills: {skills}
+Professional Experience Summary: {experience}
+
+Start with a formal salutation (e.g., "Dear Hiring Manager,").
+Conclude with a professional closing.
+Ensure the tone is persuasive and enthusiastic, tailored to attract the attention of the hiring committee.
+Focus only on the body of the cover letter, do not include placeholder for date or address.
+""", max_input_tokens=2000)
+
+registry.register("generate_keywords", """
+As an ATS (Applicant Tracking System) expert using VMD AI, extract and list the most important keywords from the following text,
+relevant to a {context}. Provide them as a comma-separated list.
+Text:
+---
+{text}
+---
+Keywords:
+""", max_input_tokens=8000)
+
+registry.register("refine_keywords", """
+As an ATS (Applicant Tracking System) expert using VMD AI, refine this draft list of keywords that was extracted automatically
+from the following text, relevant to a {context}.
+Remove terms that are not meaningful skills, tools, qualifications or responsibilities, merge duplicates,
+and add any important keyword the draft missed. Provide the final keywords as a comma-separated list.
+Draft Keywords: {draft}
+Text:
+---
+{text}
+---
+Keywords:
+""", max_input_tokens=4000)
+
+# --- Resume tools ---
+
+registry.register("critique_resume_section", """
+As a professional resume reviewer using VMD AI, provide a constructive critique of the following "{section_type}" section for a "{job_title}" role.
+Focus on clarity, impact, relevance, ATS-optimization, and overall effectiveness.
+Suggest specific improvements.
+
+Section Content:
+---
+{section_text}
+---
+Critique and Suggestions:
+""", max_input_tokens=3000)
+
+registry.register("generate_bullet_points_from_experience", """
+As an expert resume writer using VMD AI, transform the following experience description into {num_bullets} concise,
+action-oriented bullet points suitable for a resume for a '{job_title}' role.
+Each bullet point should start with a strong action verb and highlight quantifiable achievements where possible.
+
+Experience Description:
+---
+{experience_description}
+---
+Bullet Points:
+""", max_input_tokens=3000)
+
+registry.register("generate_achievement_statement", """
+As an expert resume writer using VMD AI, convert the following responsibility and its impact into a concise,
+action-oriented achievement statement (1-2 sentences). Start with a strong action verb and quantify results where possible.
+
+Responsibility: {responsibility}
+Impact/Result: {impact_details}
+
+Achievement Statement:
+""", max_input_tokens=1000)
+
+registry.register("generate_power_verbs", """
+As a resume expert using VMD AI, generate a list of 15-20 powerful action verbs (power verbs)
+that are highly relevant for a '{job_title}' role.
+List them as a comma-separated list or short bullet points.
+""", max_input_tokens=200)
+
+registry.register("expand_resume_section", """
+As an expert resume writer using VMD AI, expand the following brief description into a more detailed and impactful
+'{section_type}' section for a '{job_title}' resume. Aim for 3-5 sentences/bullet points,
+incorporating strong action verbs and quantifying achievements where possible.
+
+Brief Description:
+---
+{brief_text}
+---
+Expanded Section:
+""", max_input_tokens=1500)
+
+registry.register("summarize_resume_section", """
+As an expert resume writer using VMD AI, summarize the following detailed '{section_type}' section into approximately {target_length_sentences}
+concise and impactful sentences/bullet points suitable for a resume.
+
+Detailed Section:
+---
+{detailed_text}
+---
+Summarized Section:
+""", max_input_tokens=4000)
+
+# --- Interview ---
+
+registry.register("generate_interview_questions", """
+As an interview preparation expert using VMD AI, generate 5-7 potential {question_type} interview questions for a candidate with the following resume summary:
+"{resume_summary}"
+and applying for a role described by these keywords: "{job_description_keywords}".
+Focus on questions that bridge the candidate's experience with the job requirements.
+List them numerically.
+""", max_input_tokens=3000)
+
+registry.register("generate_thank_you_note", """
+As a professional career coach using VMD AI, draft a personalized thank-you email after an interview.
+It should be concise, reiterate interest, and reference specific discussion points.
+
+Candidate Name: {name}
+Company: {company}
+Job Title: {job_title}
+Interview Date: {interview_date}
+Key Discussion Points (comma-separated): {key_discussion_points}
+
+Thank You Note (Email Body Only):
+""", max_input_tokens=1000)
+
+registry.register("generate_interview_answer_critique", """
+As an expert interview coach using VMD AI, provide constructive feedback and suggest improvements for the following interview answer.
+Consider its relevance to a '{job_title_context}' role, clarity, completeness, and adherence to best practices (e.g., STAR method if applicable).
+
+Interview Question: "{question}"
+Candidate's Answer: "{user_answer}"
+
+Critique and Improvement Suggestions:
+""", max_input_tokens=2000)
+
+# --- Networking and career ---
+
+registry.register("generate_linkedin_summary", """
+As a LinkedIn profile expert using VMD AI, generate a compelling 3-5 sentence professional summary for a LinkedIn profile.
+Incorporate the following keywords and career overview. Focus on impact, professional brand, and future aspirations.
+
+Keywords: {keywords}
+Career Overview: {career_overview}
+
+LinkedIn Summary:
+""", max_input_tokens=1500)
+
+registry.register("generate_networking_message", """
+As a networking expert using VMD AI, draft a concise and professional networking message.
+
+Your Role/Background: {my_role}
+Target Person's Role/Background: {target_person_role}
+Purpose of message: {purpose}
+Common Ground/Specific Connection (optional): {common_ground}
+
+Networking Message:
+""", max_input_tokens=1000)
+
+registry.register("generate_career_path_suggestions", """
+As a career counselor using VMD AI, suggest 3-5 potential career paths for someone with the following profile.
+Focus on paths that leverage their existing skills and experience.
+
+Current Role (optional): {current_role}
+Skills: {skills}
+Experience Summary: {experience}
+
+Suggested Career Paths:
+""", max_input_tokens=2000)
+
+registry.register("generate_learning_resources", """
+As a learning and development expert using VMD AI, recommend 3-5 types of learning resources (e.g., online courses, books, certifications, projects)
+to acquire or strengthen the following skill, relevant for a '{current_role}' role.
+
+Skill to learn/improve: {skill_gap}
+
+Recommended Learning Resources:
+""", max_input_tokens=500)
+
+registry.register("generate_salary_negotiation_script", """
+As a salary negotiation coach using VMD AI, create a concise script for a candidate to negotiate a job offer.
+The script should be professional, confident, and highlight the candidate's value.
+
+Job Title: {job_title}
+Company: {company}
+Initial Offer: {initial_offer}
+Desired Salary Range: {desired_range}
+Key Achievements (to highlight value): {key_achievements}
+
+Salary Negotiation Script:
+""", max_input_tokens=1500)
+
+# --- Job description analysis (one template per analysis type) ---
+
+registry.register("analyze_job_description.key_skills", """
+As an ATS expert using VMD AI, extract and list the most important keywords and required skills from the following job description.
+These should be directly relevant to a '{job_title_context}' role. Provide them as a comma-separated list.
+
+Job Description:
+---
+{jd_content}
+---
+Extracted Keywords and Skills:
+""", max_input_tokens=8000)
+
+registry.register("analyze_job_description.interview_questions", """
+As an interview preparation expert using VMD AI, generate 5-7 potential interview questions based on the following job description
+and considering a candidate with this experience summary: "{user_experience_summary}".
+Focus on behavioral, technical, and situational questions that test alignment with the job requirements.
+List them numerically.
+
+Job Description:
+---
+{jd_content}
+---
+Potential Interview Questions:
+""", max_input_tokens=8000)
+
+registry.register("analyze_job_description.ats_advice", """
+As an ATS expert and career advisor using VMD AI, analyze the following job description and provide actionable advice on how to tailor a resume and cover letter for optimal ATS alignment.
+Focus on identifying critical keywords, recommended formatting, common pitfalls to avoid, and strategic content integration.
+
+Job Description:
+---
+{jd_content}
+---
+ATS Alignment Advice:
+""", max_input_tokens=8000)
+
+registry.register("analyze_job_description.skill_gap", """
+As a career development expert using VMD AI, compare the required skills in the job description below with the candidate's existing skills.
+Identify any significant skill gaps and suggest 3-5 relevant learning resources or areas of focus to bridge those gaps.
+
+Job Description Skills/Requirements:
+---
+{jd_content}
+---
+Candidate's Skills:
+---
+{user_skills}
+---
+Skill Gap Analysis and Learning Suggestions:
+""", max_input_tokens=8000)
+
+registry.register("analyze_job_description.reduce", """
+As an expert career advisor using VMD AI, a job description too long to analyze at once was analyzed in {num_parts} parts.
+Combine the partial results below into a single "{analysis_type}" answer{format_hint}.
+Remove duplicates, keep the most important points and follow the format of the partial results.
+
+{partials}
+
+Combined {analysis_type}:
+""", max_input_tokens=8000)
+
+
+def main() -> None:
+    rows = registry.report()
+    print(f"{'template':45s} {'tokens':>7s} {'budget':>7s} {'max prompt':>11s}")
+    for row in rows:
+        print(f"{row['name']:45s} {row['template_tokens']:7d} {row['max_input_tokens']:7d} {row['max_prompt_tokens']:11d}")
+
+
+if __name__ == "__main__":
+    main()
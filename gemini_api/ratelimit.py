@@ -0,0 +1,318 @@
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import TYPE_CHECKING, Optional
+
+from .errors import DeadlineExceededError, RateLimitedError
+
+if TYPE_CHECKING:
+    import asyncio
+
+# Outcomes of a call, fed back into the concurrency limit
+SUCCEEDED, THROTTLED, FAILED = "succeeded", "throttled", "failed"
+
+# google.api_core / HTTP client exception class names, matched by name so the SDK is not imported
+_RATE_LIMIT_ERROR_NAMES = {"ResourceExhausted", "TooManyRequests"}
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (~4 characters per token) used before the real count is known."""
+    return max(1, len(text) // 4)
+
+
+def is_rate_limit_error(e: BaseException) -> bool:
+    """
+    Returns True if an exception signals upstream throttling (HTTP 429 / RESOURCE_EXHAUSTED).
+
+    Decided by exception type and status code only, never by the message, which may quote
+    arbitrary prompt or response text.
+    """
+    if isinstance(e, RateLimitedError) or type(e).__name__ in _RATE_LIMIT_ERROR_NAMES:
+        return True
+    if getattr(e, "code", None) == 429 or getattr(e, "status_code", None) == 429:
+        return True
+    grpc_status = getattr(e, "grpc_status_code", None)
+    return getattr(grpc_status, "name", None) == "RESOURCE_EXHAUSTED"
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket refilled continuously at `rate_per_minute`.
+
+    `reserve` never blocks: it deducts the requested amount immediately (the balance may go
+    negative) and returns how long the caller has to wait before using it. Reservations are
+    therefore served in arrival order, and both threads and coroutines can share one bucket.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        self.rate_per_second = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else rate_per_minute
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate_per_second)
+        self._updated = now
+
+    def reserve(self, amount: float = 1.0) -> float:
+        """Reserves `amount` tokens and returns the number of seconds to wait before proceeding."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= min(amount, self.capacity)
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate_per_second
+
+    def adjust(self, delta: float) -> None:
+        """Returns (positive) or charges (negative) tokens once the true cost of a call is known."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self.capacity, self._tokens + delta)
+
+
+class AIMDConcurrencyLimiter:
+    """
+    Concurrency limit driven by additive-increase / multiplicative-decrease.
+
+    Every successful call grows the limit by roughly one slot per "window" of calls; a
+    throttled call multiplies it by `decrease_factor` (at most once per `cooldown` seconds so
+    a burst of 429s from the same window only counts once); any other failure leaves it as is. Callers beyond the limit wait for
+    a slot; both blocking threads and asyncio tasks are supported.
+    """
+
+    def __init__(self, initial: int = 4, minimum: int = 1, maximum: int = 32,
+                 decrease_factor: float = 0.5, cooldown: float = 1.0):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.decrease_factor = decrease_factor
+        self.cooldown = cooldown
+        self._limit = float(max(minimum, min(initial, maximum)))
+        self._in_flight = 0
+        self._last_decrease = 0.0
+        self._lock = threading.Lock()
+        self._cond = threading.Condition(self._lock)
+        self._async_waiters: deque = deque()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """Blocks the calling thread until a slot is free; returns False if `timeout` seconds pass first."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._in_flight >= int(self._limit):
+                remaining = 1.0 if deadline is None else deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(timeout=min(1.0, remaining))
+            self._in_flight += 1
+            return True
+
+    async def acquire_async(self, timeout: Optional[float] = None) -> bool:
+        """Waits (without blocking the event loop) until a slot is free; returns False on timeout."""
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while True:
+            with self._lock:
+                if self._in_flight < int(self._limit):
+                    self._in_flight += 1
+                    return True
+                if deadline is not None and loop.time() >= deadline:
+                    return False
+                waiter = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+            try:
+                if deadline is None:
+                    await waiter
+                else:
+                    await asyncio.wait_for(waiter, deadline - loop.time())
+            except asyncio.TimeoutError:
+                self._abandon((loop, waiter))
+                return False
+            except asyncio.CancelledError:
+                self._abandon((loop, waiter))
+                raise
+
+    def _abandon(self, entry: tuple) -> None:
+        """Forgets a waiter that stopped waiting; if `release` already woke it, the wakeup goes to the next one."""
+        with self._lock:
+            try:
+                self._async_waiters.remove(entry)
+            except ValueError:
+                self._wake_waiters()
+
+    def release(self, outcome: str = SUCCEEDED) -> None:
+        """Frees a slot and feeds the outcome of the call (SUCCEEDED, THROTTLED or FAILED) back into the limit."""
+        with self._lock:
+            self._in_flight -= 1
+            if outcome == THROTTLED:
+                now = time.monotonic()
+                if now - self._last_decrease >= self.cooldown:
+                    self._limit = max(self.minimum, self._limit * self.decrease_factor)
+                    self._last_decrease = now
+            elif outcome == SUCCEEDED:
+                self._limit = min(self.maximum, self._limit + 1.0 / self._limit)
+            self._wake_waiters()
+
+    def _wake_waiters(self) -> None:
+        # Caller must hold self._lock
+        free = int(self._limit) - self._in_flight
+        if free <= 0:
+            return
+        self._cond.notify(free)
+        while free > 0 and self._async_waiters:
+            loop, waiter = self._async_waiters.popleft()
+            loop.call_soon_threadsafe(_resolve, waiter)
+            free -= 1
+
+
+def _resolve(waiter: "asyncio.Future") -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class _Slot:
+    """Handle for one admitted call; lets the caller report throttling and real token usage."""
+
+    def __init__(self, limiter: "ModelRateLimiter", reserved_tokens: int, timeout: Optional[float]):
+        self._limiter = limiter
+        self._reserved_tokens = reserved_tokens
+        self._settled = False
+        self.throttled = False
+        self.timeout = timeout   # Time left for the call itself once the slot was granted, if bounded
+
+    def mark_throttled(self) -> None:
+        self.throttled = True
+
+    def record_usage(self, response) -> None:
+        """Settles the tokens/min bucket with the token count reported by an `LLMResponse`, if any."""
+        total = response.total_tokens
+        if total:
+            self._limiter.tokens.adjust(self._reserved_tokens - total)
+            self._reserved_tokens = total
+            self._settled = True
+
+    def _close(self, error: Optional[BaseException]) -> str:
+        """Returns the call's outcome; a failed call that reported no usage gets its token reservation back."""
+        if self.throttled or (error is not None and is_rate_limit_error(error)):
+            outcome = THROTTLED
+        elif error is not None:
+            outcome = FAILED
+        else:
+            return SUCCEEDED
+        if not self._settled:
+            self._limiter.tokens.adjust(self._reserved_tokens)
+        return outcome
+
+
+class ModelRateLimiter:
+    """
+    Client-side admission control in front of the model: a requests/min bucket, a tokens/min
+    bucket and an AIMD concurrency limit. Callers queue for a slot instead of failing, so
+    throughput stays at the quota ceiling without tripping it.
+    """
+
+    def __init__(self, requests_per_minute: float, tokens_per_minute: float,
+                 max_concurrency: int = 8, expected_output_tokens: int = 800):
+        """
+        Args:
+            requests_per_minute (float): Request quota of the model tier.
+            tokens_per_minute (float): Token quota (input + output) of the model tier.
+            max_concurrency (int): Upper bound for the adaptive concurrency limit.
+            expected_output_tokens (int): Output tokens reserved per call until the real usage is known.
+        """
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+        self.concurrency = AIMDConcurrencyLimiter(initial=min(4, max_concurrency), maximum=max_concurrency)
+        self.expected_output_tokens = expected_output_tokens
+
+    def _reserve(self, prompt: str, timeout: Optional[float]) -> tuple[int, float]:
+        """Reserves quota for one call; raises RateLimitedError (and gives it back) if the wait would outlast `timeout`."""
+        reserved = estimate_tokens(prompt) + self.expected_output_tokens
+        wait = max(self.requests.reserve(1), self.tokens.reserve(reserved))
+        if timeout is not None and wait >= timeout:
+            self._refund(reserved)
+            raise RateLimitedError(f"the quota frees up in {wait:.1f}s, after the call's deadline")
+        return reserved, wait
+
+    def _refund(self, reserved: int) -> None:
+        self.requests.adjust(1)
+        self.tokens.adjust(reserved)
+
+    @staticmethod
+    def _remaining(timeout: Optional[float], started: float) -> Optional[float]:
+        return None if timeout is None else timeout - (time.monotonic() - started)
+
+    def _admitted(self, reserved: int, timeout: Optional[float], started: float) -> _Slot:
+        return _Slot(self, reserved, self._remaining(timeout, started))
+
+    def _not_admitted(self, reserved: int) -> DeadlineExceededError:
+        self._refund(reserved)
+        return DeadlineExceededError("no concurrency slot freed up before the call's deadline")
+
+    @contextmanager
+    def slot(self, prompt: str, timeout: Optional[float] = None):
+        """
+        Blocks until the call fits both quotas and the concurrency limit, then yields a `_Slot`.
+
+        Args:
+            prompt (str): The prompt, to estimate the tokens to reserve.
+            timeout (float): Time left until the caller's deadline. Waiting never outlasts it;
+                `_Slot.timeout` is what remains for the call itself.
+
+        Raises:
+            RateLimitedError: The quota would only admit the call after `timeout`.
+            DeadlineExceededError: No concurrency slot freed up within `timeout`.
+        """
+        started = time.monotonic()
+        reserved, wait = self._reserve(prompt, timeout)
+        if wait:
+            time.sleep(wait)
+        if not self.concurrency.acquire(self._remaining(timeout, started)):
+            raise self._not_admitted(reserved)
+        handle = self._admitted(reserved, timeout, started)
+        error: Optional[BaseException] = None
+        try:
+            yield handle
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            self.concurrency.release(handle._close(error))
+
+    @asynccontextmanager
+    async def slot_async(self, prompt: str, timeout: Optional[float] = None):
+        """Async counterpart of `slot`."""
+        import asyncio
+
+        started = time.monotonic()
+        reserved, wait = self._reserve(prompt, timeout)
+        if wait:
+            await asyncio.sleep(wait)
+        if not await self.concurrency.acquire_async(self._remaining(timeout, started)):
+            raise self._not_admitted(reserved)
+        handle = self._admitted(reserved, timeout, started)
+        error: Optional[BaseException] = None
+        try:
+            yield handle
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            self.concurrency.release(handle._close(error))
+
+    def stats(self) -> dict:
+        return {
+            "concurrency_limit": self.concurrency.limit,
+            "in_flight": self.concurrency.in_flight,
+        }
@@ -0,0 +1,185 @@
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional, TypeVar
+
+from .errors import (
+    CircuitOpenError,
+    DeadlineExceededError,
+    GenerationError,
+    InvalidRequestError,
+    RateLimitedError,
+    TransientGenerationError,
+)
+from .ratelimit import is_rate_limit_error
+
+T = TypeVar("T")
+
+# google.api_core exception class names, matched by name so this module does not import the SDK
+_TRANSIENT_ERROR_NAMES = {
+    "ServiceUnavailable", "InternalServerError", "BadGateway", "GatewayTimeout",
+    "Aborted", "Unknown", "ConnectionError", "ConnectionResetError", "RemoteDisconnected",
+}
+_DEADLINE_ERROR_NAMES = {"DeadlineExceeded", "TimeoutError", "ReadTimeout", "ConnectTimeout"}
+
+
+def classify_exception(e: BaseException) -> GenerationError:
+    """Maps an arbitrary SDK/network exception onto the typed `GenerationError` hierarchy."""
+    if isinstance(e, GenerationError):
+        return e
+    name = type(e).__name__
+    code = getattr(e, "code", None)
+    # asyncio.TimeoutError is also named "TimeoutError", so asyncio need not be imported here
+    if isinstance(e, TimeoutError) or name in _DEADLINE_ERROR_NAMES or code in (408, 504):
+        return DeadlineExceededError(str(e) or "the request timed out")
+    if is_rate_limit_error(e):
+        return RateLimitedError(str(e))
+    if isinstance(e, ConnectionError) or name in _TRANSIENT_ERROR_NAMES:
+        return TransientGenerationError(str(e))
+    if isinstance(code, int) and code >= 500:
+        return TransientGenerationError(str(e))
+    return InvalidRequestError(str(e))
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Retry and deadline settings for one logical generation call.
+
+    Args:
+        max_attempts (int): Total number of attempts, including the first one.
+        base_delay (float): Backoff before the first retry, in seconds.
+        max_delay (float): Upper bound of a single backoff, in seconds.
+        deadline (float): Overall budget for the call including retries, in seconds.
+    """
+    max_attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 8.0
+    deadline: float = 30.0
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff for the given (0-based) failed attempt."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+
+class CircuitBreaker:
+    """
+    Fails fast while the backend is unhealthy.
+
+    After `failure_threshold` consecutive transient failures the circuit opens and every call
+    is rejected with `CircuitOpenError` for `reset_timeout` seconds. The next call is then let
+    through as a probe (half-open): success closes the circuit, failure re-opens it.
+    Rate-limit errors do not count as failures; they are the rate limiter's concern.
+    """
+
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def before_call(self) -> None:
+        """Raises `CircuitOpenError` if the call must be rejected."""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return
+            if self.state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                self._probe_in_flight = False
+            if self.state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return
+            raise CircuitOpenError("the AI backend is unhealthy; failing fast")
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = self.CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self, error: GenerationError) -> None:
+        with self._lock:
+            if not error.retryable or isinstance(error, RateLimitedError):
+                # Not a health signal; just let a pending probe go again
+                self._probe_in_flight = False
+                return
+            self._failures += 1
+            if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._probe_in_flight = False
+
+
+def call_with_retry(fn: Callable[[float], T], policy: RetryPolicy, breaker: Optional[CircuitBreaker] = None) -> T:
+    """
+    Calls `fn(timeout)` with a per-call deadline, jittered retries of transient errors and an
+    optional circuit breaker.
+
+    Args:
+        fn (Callable): Performs one attempt; receives the remaining time budget in seconds.
+        policy (RetryPolicy): Retry and deadline settings.
+        breaker (CircuitBreaker): Circuit breaker guarding the backend, if any.
+
+    Returns:
+        The value returned by the first successful attempt.
+
+    Raises:
+        GenerationError: The typed error of the last attempt.
+    """
+    deadline = time.monotonic() + policy.deadline
+    for attempt in range(policy.max_attempts):
+        if breaker is not None:
+            breaker.before_call()
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise DeadlineExceededError(f"no time left after {attempt} attempt(s)")
+        try:
+            result = fn(remaining)
+        except Exception as e:
+            error = classify_exception(e)
+            if breaker is not None:
+                breaker.record_failure(error)
+            delay = policy.backoff(attempt)
+            if not error.retryable or attempt + 1 >= policy.max_attempts or delay >= deadline - time.monotonic():
+                raise error from e
+            time.sleep(delay)
+            continue
+        if breaker is not None:
+            breaker.record_success()
+        return result
+    raise AssertionError("unreachable")
+
+
+async def call_with_retry_async(fn: Callable[[float], Awaitable[T]], policy: RetryPolicy,
+                                breaker: Optional[CircuitBreaker] = None) -> T:
+    """Async counterpart of `call_with_retry`; each attempt is additionally bounded by `asyncio.wait_for`."""
+    import asyncio
+
+    deadline = time.monotonic() + policy.deadline
+    for attempt in range(policy.max_attempts):
+        if breaker is not None:
+            breaker.before_call()
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise DeadlineExceededError(f"no time left after {attempt} attempt(s)")
+        try:
+            result = await asyncio.wait_for(fn(remaining), timeout=remaining)
+        except Exception as e:
+            error = classify_exception(e)
+            if breaker is not None:
+                breaker.record_failure(error)
+            delay = policy.backoff(attempt)
+            if not error.retryable or attempt + 1 >= policy.max_attempts or delay >= deadline - time.monotonic():
+                raise error from e
+            await asyncio.sleep(delay)
+            continue
+        if breaker is not None:
+            breaker.record_success()
+        return result
+    raise AssertionError("unreachable")
@@ -0,0 +1,141 @@
+"""
+Streaming variants of the long-form generators.
+
+Instead of waiting for the whole document, callers iterate over text chunks as the backend
+produces them (`generate_content(stream=True)` for Gemini) and can render them incrementally:
+
+    stream = stream_cover_letter(name, title, company, skills, experience)
+    for chunk in stream:
+        placeholder.markdown(stream.text)
+    print(f"first token after {stream.ttft:.2f}s")
+    result = stream.result  # GenerationResult, same as generate_cover_letter() would return
+"""
+import sys
+import time
+from contextlib import ExitStack
+from typing import Iterator, Optional
+
+from . import (
+    EmptyResponseError,
+    GenerationError,
+    GenerationResult,
+    _cache_lookup,
+    _cache_status,
+    _error_result,
+    _generate_cover_letter_prompt,
+    _generate_resume_summary_prompt,
+    circuit_breaker,
+    get_backend,
+    rate_limiter,
+    response_cache,
+    retry_policy,
+)
+from . import metrics
+from .backends import LLMResponse
+from .metrics import CallRecord
+from .resilience import call_with_retry, classify_exception
+
+
+def _open_stream(prompt: str, timeout: float, record: CallRecord):
+    """
+    Starts one streaming call and waits for its first chunk.
+
+    The rate-limiter slot stays held (inside the returned ExitStack) until the caller has
+    drained the stream. Failing before the first chunk releases it immediately, which lets
+    the retry policy try again.
+    """
+    record.attempts += 1
+    stack = ExitStack()
+    try:
+        slot = stack.enter_context(rate_limiter.slot(prompt, timeout))
+        chunks = iter(get_backend().stream(prompt, slot.timeout))
+        first = next(chunks, None)
+    except BaseException:
+        stack.__exit__(*sys.exc_info())
+        raise
+    return stack, slot, first, chunks
+
+
+def _iter_model_stream(prompt: str, record: CallRecord) -> Iterator[str]:
+    # Only opening the stream is retried: once text reached the caller it cannot be taken back.
+    stack, slot, first, chunks = call_with_retry(
+        lambda timeout: _open_stream(prompt, timeout, record), retry_policy, circuit_breaker
+    )
+    with stack:
+        chunk = first
+        while chunk is not None:
+            if chunk.text:
+                yield chunk.text
+            if chunk.total_tokens:
+                slot.record_usage(chunk)
+                record.record_usage(chunk, prompt)
+            try:
+                chunk = next(chunks, None)
+            except Exception as e:
+                raise classify_exception(e) from e
+
+
+class GenerationStream:
+    """
+    Iterable of text chunks for one generation, with timing of the first and last chunk.
+
+    Iterating never raises `GenerationError`; on failure iteration simply stops and
+    `result` carries the typed error, just like the non-streaming functions.
+    """
+
+    def __init__(self, prompt: str, function: Optional[str] = None):
+        self.prompt = prompt
+        self.function = function or metrics.current_function()  # Metrics label, fixed at creation
+        self.ttft: Optional[float] = None      # Seconds until the first chunk arrived
+        self.elapsed: Optional[float] = None   # Seconds until the stream finished
+        self.result: Optional[GenerationResult] = None
+        self._chunks: list = []
+
+    @property
+    def text(self) -> str:
+        """All text received so far."""
+        return "".join(self._chunks)
+
+    def __iter__(self) -> Iterator[str]:
+        started = time.perf_counter()
+        with metrics.track_call(self.function) as record:
+            try:
+                cache_key, cached = _cache_lookup(self.prompt)
+                record.cache = _cache_status(cache_key, cached)
+                if cached is not None:
+                    chunks = iter((cached,))
+                else:
+                    chunks = _iter_model_stream(self.prompt, record)
+                for chunk in chunks:
+                    if self.ttft is None:
+                        self.ttft = time.perf_counter() - started
+                    self._chunks.append(chunk)
+                    yield chunk
+                text = self.text
+                if not text:
+                    raise EmptyResponseError("the model returned an empty response")
+                if cached is None:
+                    if not (record.prompt_tokens or record.output_tokens):
+                        record.record_usage(LLMResponse(text), self.prompt)  # Backend reported no usage
+                    if cache_key is not None:
+                        response_cache.set(cache_key, text)
+                self.result = GenerationResult(text)
+            except GenerationError as e:
+                record.outcome = type(e).__name__
+                self.result = _error_result(e)
+            finally:
+                self.elapsed = time.perf_counter() - started
+
+
+def stream_resume_summary(name: str, title: str, skills: str, experience: str,
+                          tone: str = "Formal", language: str = "English", length: str = "Concise") -> GenerationStream:
+    """Streaming variant of `gemini_api.generate_resume_summary`."""
+    return GenerationStream(_generate_resume_summary_prompt(name, title, skills, experience, tone, language, length),
+                            function="stream_resume_summary")
+
+
+def stream_cover_letter(name: str, title: str, company: str, skills: str, experience: str,
+                        tone: str = "Formal", language: str = "English", length: str = "Standard") -> GenerationStream:
+    """Streaming variant of `gemini_api.generate_cover_letter`."""
+    return GenerationStream(_generate_cover_letter_prompt(name, title, company, skills, experience, tone, language, length),
+                            function="stream_cover_letter")
@@ -0,0 +1,306 @@
+"""
+Persistent generation history in SQLite.
+
+Every generated document is one row of `generations`, indexed for the two queries the app
+runs: a user's newest documents, optionally of one type. Pages are fetched with keyset
+pagination on (created_at, id), so every page costs the same index range scan no matter
+how deep the user has scrolled, and the session only ever holds one page of titles and
+snippets instead of the documents themselves.
+
+Writes never run on the request path: `add` only queues the row, and a background thread
+inserts whatever has accumulated in one transaction (up to `batch_size` rows, at least
+every `flush_interval` seconds). Reads flush the queue first, so a user always sees their
+own latest document.
+
+Titles and contents are also indexed with SQLite FTS5 (Porter-stemmed), updated by triggers
+in the same transaction as each insert, so `search` ranks a user's documents by BM25 and
+returns highlighted snippets without scanning them. SQLite builds without FTS5 fall back to
+an unranked LIKE scan.
+
+    store = HistoryStore(".vmd_cache/history.sqlite3")
+    store.add("vmduser", "Resume", "Resume Summary for Ada", text)
+    entries, cursor = store.page("vmduser")                  # newest 10
+    older, cursor = store.page("vmduser", before=cursor)     # next 10
+    store.get(entries[0].id).content
+    store.search("vmduser", "acme kubernetes")             # ranked full-text matches
+"""
+import atexit
+import logging
+import os
+import queue
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+PAGE_SIZE = 10
+SNIPPET_CHARS = 150
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS generations ("
+    " id INTEGER PRIMARY KEY,"
+    " user TEXT NOT NULL,"
+    " doc_type TEXT NOT NULL,"
+    " title TEXT NOT NULL,"
+    " content TEXT NOT NULL,"
+    " created_at REAL NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS generations_user_created ON generations (user, created_at DESC, id DESC)",
+    "CREATE INDEX IF NOT EXISTS generations_user_type_created ON generations (user, doc_type, created_at DESC, id DESC)",
+)
+
+# Full-text index kept in sync by triggers (external content: no text is stored twice). The owner
+# is indexed too, so a query only ranks that user's documents instead of everyone's.
+_FTS_SCHEMA = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS generations_fts USING fts5("
+    " user, title, content, content='generations', content_rowid='id', tokenize='porter unicode61')",
+    "CREATE TRIGGER IF NOT EXISTS generations_fts_insert AFTER INSERT ON generations BEGIN"
+    " INSERT INTO generations_fts (rowid, user, title, content) VALUES (new.id, new.user, new.title, new.content); END",
+    "CREATE TRIGGER IF NOT EXISTS generations_fts_delete AFTER DELETE ON generations BEGIN"
+    " INSERT INTO generations_fts (generations_fts, rowid, user, title, content) VALUES ('delete', old.id, old.user, old.title, old.content); END",
+    "CREATE TRIGGER IF NOT EXISTS generations_fts_update AFTER UPDATE ON generations BEGIN"
+    " INSERT INTO generations_fts (generations_fts, rowid, user, title, content) VALUES ('delete', old.id, old.user, old.title, old.content);"
+    " INSERT INTO generations_fts (rowid, user, title, content) VALUES (new.id, new.user, new.title, new.content); END",
+)
+TITLE_WEIGHT = 5.0   # bm25 weight of a title match relative to a content match
+SNIPPET_TOKENS = 16
+_SEARCH_TERM = re.compile(r"\w+")
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class HistoryEntry:
+    """One stored generation. `content` is only loaded by `HistoryStore.get`; pages carry a snippet."""
+    id: int
+    user: str
+    doc_type: str
+    title: str
+    snippet: str
+    created_at: float
+    content: Optional[str] = None
+
+    @property
+    def timestamp(self) -> str:
+        return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.created_at))
+
+
+class HistoryStore:
+    """SQLite-backed generation history with batched background writes."""
+
+    def __init__(self, db_path: str, batch_size: int = 64, flush_interval: float = 0.25):
+        """
+        Args:
+            db_path (str): SQLite file; created with its directory on first use.
+            batch_size (int): Maximum rows inserted per transaction.
+            flush_interval (float): Maximum time a queued row waits before it is written.
+        """
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._db: Optional[sqlite3.Connection] = None
+        self.full_text = False
+        self._db_lock = threading.Lock()
+        self._queue: "queue.Queue" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
+        self._unwritten = 0   # Rows added but not yet inserted, including a batch the writer is still collecting
+        atexit.register(self.flush)
+
+    def _connection(self) -> sqlite3.Connection:
+        # Caller must hold self._db_lock. The file is opened on first use, not at import time.
+        if self._db is None:
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            db = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            for statement in _SCHEMA:
+                db.execute(statement)
+            self.full_text = self._create_full_text_index(db)
+            self._db = db
+        return self._db
+
+    @staticmethod
+    def _create_full_text_index(db: sqlite3.Connection) -> bool:
+        """Creates the FTS5 index (backfilling existing rows once); False if SQLite lacks FTS5."""
+        existed = db.execute("SELECT 1 FROM sqlite_master WHERE name = 'generations_fts'").fetchone() is not None
+        try:
+            for statement in _FTS_SCHEMA:
+                db.execute(statement)
+        except sqlite3.OperationalError:
+            return False  # Built without FTS5; search falls back to a LIKE scan
+        if not existed:
+            db.execute("INSERT INTO generations_fts (generations_fts) VALUES ('rebuild')")
+        return True
+
+    # --- Writes ---
+
+    def add(self, user: str, doc_type: str, title: str, content: str, created_at: Optional[float] = None) -> None:
+        """Queues a generation for storage and returns immediately."""
+        with self._writer_lock:
+            self._unwritten += 1
+        self._queue.put((user, doc_type, title, content, created_at if created_at is not None else time.time()))
+        self._ensure_writer()
+
+    def _ensure_writer(self) -> None:
+        with self._writer_lock:
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(target=self._write_loop, name="vmd-history-writer", daemon=True)
+                self._writer.start()
+
+    def _write_loop(self) -> None:
+        while True:
+            item = self._queue.get()
+            batch, waiters = [], []
+            deadline = time.monotonic() + self.flush_interval
+            while True:
+                if isinstance(item, threading.Event):
+                    waiters.append(item)
+                    break  # Someone is waiting for everything queued so far
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+            try:
+                if batch:
+                    self._insert(batch)
+            finally:
+                with self._writer_lock:
+                    self._unwritten -= len(batch)
+                for waiter in waiters:
+                    waiter.set()
+
+    def _insert(self, batch: list) -> None:
+        """Writes one batch in one transaction; a failed batch is rolled back and logged, not raised."""
+        with self._db_lock:
+            try:
+                db = self._connection()
+                db.execute("BEGIN")
+                db.executemany(
+                    "INSERT INTO generations (user, doc_type, title, content, created_at) VALUES (?, ?, ?, ?, ?)", batch
+                )
+                db.execute("COMMIT")
+            except Exception:
+                # Keep the writer alive: a locked database, a full disk or a bad row must not stall later reads
+                _LOGGER.exception("Could not save %d history entries", len(batch))
+                if self._db is not None and self._db.in_transaction:
+                    try:
+                        self._db.execute("ROLLBACK")
+                    except sqlite3.Error:
+                        pass  # Already rolled back by SQLite
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Blocks until every queued row is written; returns False on timeout."""
+        if self._writer is None:
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        self._ensure_writer()
+        return done.wait(timeout)
+
+    def pending(self) -> int:
+        """Number of added rows not written yet."""
+        return self._unwritten
+
+    # --- Reads ---
+
+    def page(self, user: str, doc_type: Optional[str] = None, before: Optional[tuple] = None, limit: int = PAGE_SIZE) -> tuple:
+        """
+        Returns one page of a user's history, newest first.
+
+        Args:
+            user (str): Owner of the entries.
+            doc_type (str): Only entries of this type ("Resume", "Cover Letter"); None for all.
+            before (tuple): Cursor returned by the previous page; None for the newest page.
+            limit (int): Page size.
+
+        Returns:
+            tuple: (list of `HistoryEntry`, cursor for the next page or None if this was the last).
+        """
+        if self.pending():
+            self.flush()  # Read your own writes
+        clauses, params = ["user = ?"], [user]
+        if doc_type:
+            clauses.append("doc_type = ?")
+            params.append(doc_type)
+        if before is not None:
+            clauses.append("(created_at, id) < (?, ?)")
+            params.extend(before)
+        sql = (f"SELECT id, user, doc_type, title, substr(content, 1, {SNIPPET_CHARS}), created_at FROM generations"
+               f" WHERE {' AND '.join(clauses)} ORDER BY created_at DESC, id DESC LIMIT ?")
+        with self._db_lock:
+            rows = self._connection().execute(sql, (*params, limit + 1)).fetchall()
+        entries = [HistoryEntry(*row) for row in rows[:limit]]
+        cursor = (entries[-1].created_at, entries[-1].id) if len(rows) > limit else None
+        return entries, cursor
+
+    def get(self, entry_id: int) -> Optional[HistoryEntry]:
+        """Loads one entry with its full content."""
+        with self._db_lock:
+            row = self._connection().execute(
+                "SELECT id, user, doc_type, title, substr(content, 1, ?), created_at, content FROM generations WHERE id = ?",
+                (SNIPPET_CHARS, entry_id),
+            ).fetchone()
+        return HistoryEntry(*row) if row else None
+
+    def count(self, user: str, doc_type: Optional[str] = None) -> int:
+        if self.pending():
+            self.flush()
+        sql, params = "SELECT COUNT(*) FROM generations WHERE user = ?", [user]
+        if doc_type:
+            sql += " AND doc_type = ?"
+            params.append(doc_type)
+        with self._db_lock:
+            return self._connection().execute(sql, params).fetchone()[0]
+
+    def search(self, user: str, query: str, doc_type: Optional[str] = None, limit: int = PAGE_SIZE) -> list:
+        """
+        Full-text search over a user's history, best matches first.
+
+        Every word of the query must appear (stemmed, case-insensitive) in the title or the
+        content; the last word also matches as a prefix, so results update while typing.
+        Title matches rank above content matches.
+
+        Args:
+            user (str): Owner of the entries.
+            query (str): Free text, e.g. "acme kubernetes".
+            doc_type (str): Only entries of this type; None for all.
+            limit (int): Maximum number of results.
+
+        Returns:
+            list: `HistoryEntry`s whose `snippet` is the best matching passage, matches in **bold**.
+        """
+        terms = _SEARCH_TERM.findall(query)
+        if not terms:
+            return []
+        if self.pending():
+            self.flush()
+        with self._db_lock:
+            db = self._connection()
+            if self.full_text:
+                owner = " ".join(_SEARCH_TERM.findall(user)) or user
+                match = f'user:"{owner}" AND {{title content}}: (' + " ".join(f'"{term}"' for term in terms) + "*)"
+                # Ranked inside FTS5 ("ORDER BY rank"), so snippets are only built for the rows returned
+                sql = ("SELECT g.id, g.user, g.doc_type, g.title,"
+                       f" snippet(generations_fts, 2, '**', '**', ' ... ', {SNIPPET_TOKENS}), g.created_at"
+                       " FROM generations_fts JOIN generations g ON g.id = generations_fts.rowid"
+                       f" WHERE generations_fts MATCH ? AND rank MATCH 'bm25(0.0, {TITLE_WEIGHT}, 1.0)' AND g.user = ?" +
+                       (" AND g.doc_type = ?" if doc_type else "") + " ORDER BY rank LIMIT ?")
+                params = [match, user, *([doc_type] if doc_type else []), limit]
+            else:
+                sql = (f"SELECT id, user, doc_type, title, substr(content, 1, {SNIPPET_CHARS}), created_at FROM generations"
+                       " WHERE user = ?" + (" AND doc_type = ?" if doc_type else "") +
+                       "".join(" AND (title LIKE ? OR content LIKE ?)" for _ in terms) +
+                       " ORDER BY created_at DESC LIMIT ?")
+                params = [user, *([doc_type] if doc_type else [])]
+                for term in terms:
+                    params.extend([f"%{term}%"] * 2)
+                params.append(limit)
+            rows = db.execute(sql, params).fetchall()
+        return [HistoryEntry(*row) for row in rows]
@@ -0,0 +1,291 @@
+"""
+Streaming text extraction from uploaded PDF, DOCX and TXT files.
+
+`iter_pages` yields a document's text page by page, so nothing larger than one page of
+decoded text (plus the parser's own buffers) is held at a time:
+
+* TXT is decoded incrementally in 64 KiB blocks, in the encoding found by
+  `detect_encoding` (BOM, else UTF-8, else cp1252, else latin-1, which never fails).
+  Pages are ~PAGE_CHARS characters, cut at line ends.
+* DOCX is read straight from the zip with `xml.etree.ElementTree.iterparse`; pages end at
+  explicit or rendered page breaks (or every ~PAGE_CHARS characters).
+* PDF uses pypdf, one page at a time.
+
+Every upload is checked against a byte limit before parsing, and extraction stops after a
+page limit (the result is then flagged as truncated). `read_document` hashes the content
+first and memoizes the extracted text by that hash, so a Streamlit rerun never re-parses
+the same upload:
+
+    document = read_document(uploaded_file, uploaded_file.name)
+    document.text, document.pages, document.truncated
+"""
+import codecs
+import hashlib
+import io
+import os
+import threading
+import zipfile
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import BinaryIO, Iterator, Optional
+from xml.etree import ElementTree
+
+MAX_BYTES = int(os.getenv("VMD_INGEST_MAX_BYTES", str(10 * 1024 * 1024)))
+MAX_PAGES = int(os.getenv("VMD_INGEST_MAX_PAGES", "50"))
+PAGE_CHARS = 4000           # Page size for formats without real pages
+BLOCK_BYTES = 64 * 1024
+CACHE_ENTRIES = 64
+SUPPORTED_TYPES = ("txt", "pdf", "docx")
+
+_ZIP_ERRORS = (ValueError, EOFError, NotImplementedError, zlib.error)
+_WORD_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+
+class IngestionError(Exception):
+    """Raised when an upload cannot be read: unsupported type, too large, or corrupt."""
+
+
+@dataclass(frozen=True)
+class Document:
+    """Text extracted from one upload."""
+    name: str
+    sha256: str
+    text: str
+    pages: int
+    truncated: bool          # Stopped at the page limit
+    encoding: Optional[str]  # Detected encoding, for TXT files
+
+
+def file_type(name: str) -> str:
+    """Lowercase extension of a file name, validated against SUPPORTED_TYPES."""
+    extension = os.path.splitext(name)[1].lower().lstrip(".")
+    if extension not in SUPPORTED_TYPES:
+        raise IngestionError(f"Unsupported file type '.{extension}'. Please upload a {', '.join(SUPPORTED_TYPES).upper()} file.")
+    return extension
+
+
+def _size(source: BinaryIO) -> int:
+    position = source.tell()
+    source.seek(0, os.SEEK_END)
+    size = source.tell()
+    source.seek(position)
+    return size
+
+
+def _format_size(size: int) -> str:
+    return f"{size / 1024 / 1024:.1f} MB" if size >= 1024 * 1024 else f"{size / 1024:.0f} KB"
+
+
+def _check_size(source: BinaryIO, max_bytes: int) -> None:
+    size = _size(source)
+    if size > max_bytes:
+        raise IngestionError(f"The file is {_format_size(size)}; the limit is {_format_size(max_bytes)}.")
+
+
+# --- TXT ---
+
+def _detect_bom(head: bytes) -> Optional[str]:
+    if head.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    if head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return "utf-16"
+    return None
+
+
+def _decode_blocks(source: BinaryIO, encoding: str) -> Iterator[str]:
+    """Decodes a binary stream block by block; raises UnicodeDecodeError on invalid input."""
+    source.seek(0)
+    decoder = codecs.getincrementaldecoder(encoding)(errors="strict")
+    while True:
+        block = source.read(BLOCK_BYTES)
+        if not block:
+            tail = decoder.decode(b"", final=True)
+            if tail:
+                yield tail
+            return
+        text = decoder.decode(block)
+        if text:
+            yield text
+
+
+def _paginate(blocks: Iterator[str]) -> Iterator[str]:
+    """Regroups decoded text into ~PAGE_CHARS pages, cutting at the last line end when possible."""
+    buffer = ""
+    for block in blocks:
+        buffer += block
+        while len(buffer) >= PAGE_CHARS:
+            cut = buffer.rfind("\n", 0, PAGE_CHARS)
+            cut = cut + 1 if cut > PAGE_CHARS // 2 else PAGE_CHARS
+            yield buffer[:cut]
+            buffer = buffer[cut:]
+    if buffer:
+        yield buffer
+
+
+def detect_encoding(source: BinaryIO) -> str:
+    """
+    Picks the encoding of a text stream: its BOM if any, else UTF-8 if the whole stream
+    decodes as UTF-8 (validated block by block, without keeping the text), else cp1252,
+    else latin-1, which accepts any byte sequence.
+    """
+    source.seek(0)
+    bom = _detect_bom(source.read(4))
+    if bom:
+        return bom
+    for encoding in ("utf-8", "cp1252"):
+        try:
+            for _ in _decode_blocks(source, encoding):
+                pass
+            return encoding
+        except UnicodeDecodeError:
+            continue
+    return "latin-1"
+
+
+def _txt_pages(source: BinaryIO, encodings: list) -> Iterator[str]:
+    encoding = detect_encoding(source)
+    encodings.append(encoding)
+    yield from _paginate(_decode_blocks(source, encoding))
+
+
+# --- DOCX ---
+
+def _docx_pages(source: BinaryIO) -> Iterator[str]:
+    try:
+        archive = zipfile.ZipFile(source)
+        member = archive.open("word/document.xml")
+    except (zipfile.BadZipFile, KeyError, *_ZIP_ERRORS) as e:
+        raise IngestionError("The file is not a valid DOCX document.") from e
+    parts, length = [], 0
+    with archive, member:
+        try:
+            for event, element in ElementTree.iterparse(member, events=("start", "end")):
+                tag = element.tag
+                if event == "start":
+                    if tag == f"{_WORD_NS}lastRenderedPageBreak" or (tag == f"{_WORD_NS}br" and element.get(f"{_WORD_NS}type") == "page"):
+                        if length:
+                            yield "".join(parts)
+                            parts, length = [], 0
+                    continue
+                if tag == f"{_WORD_NS}t" and element.text:
+                    parts.append(element.text)
+                    length += len(element.text)
+                elif tag == f"{_WORD_NS}tab":
+                    parts.append("\t")
+                elif tag == f"{_WORD_NS}p":
+                    parts.append("\n")
+                    length += 1
+                    element.clear()  # Keeps memory flat on long documents
+                    if length >= PAGE_CHARS:
+                        yield "".join(parts)
+                        parts, length = [], 0
+        except (ElementTree.ParseError, zipfile.BadZipFile, *_ZIP_ERRORS) as e:
+            # A damaged archive fails while the member is read: bad CRC, bad offsets, truncated deflate data
+            raise IngestionError("The DOCX document is corrupt.") from e
+    if length:
+        yield "".join(parts)
+
+
+# --- PDF ---
+
+def _pdf_pages(source: BinaryIO) -> Iterator[str]:
+    try:
+        from pypdf import PdfReader
+    except ImportError as e:
+        raise IngestionError("PDF support requires the 'pypdf' package.") from e
+    try:
+        reader = PdfReader(source)
+        if reader.is_encrypted:
+            raise IngestionError("The PDF is password protected.")
+        for page in reader.pages:
+            yield page.extract_text() or ""
+    except IngestionError:
+        raise
+    except Exception as e:
+        # Malformed PDFs surface as PdfReadError but also KeyError, TypeError, AssertionError, struct.error...
+        raise IngestionError("The PDF document is corrupt.") from e
+
+
+def iter_pages(source: BinaryIO, name: str, max_bytes: int = MAX_BYTES, encodings: Optional[list] = None) -> Iterator[str]:
+    """
+    Yields the text of a document page by page.
+
+    Args:
+        source (BinaryIO): Seekable binary stream (a Streamlit `UploadedFile`, an open file, `io.BytesIO`).
+        name (str): File name; its extension selects the parser.
+        max_bytes (int): Reject files larger than this before parsing anything.
+        encodings (list): Optional list the detected TXT encoding is appended to.
+
+    Raises:
+        IngestionError: Unsupported type, file too large, or unreadable content.
+    """
+    kind = file_type(name)
+    _check_size(source, max_bytes)
+    source.seek(0)
+    if kind == "pdf":
+        yield from _pdf_pages(source)
+    elif kind == "docx":
+        yield from _docx_pages(source)
+    else:
+        yield from _txt_pages(source, encodings if encodings is not None else [])
+
+
+# --- Memoized extraction ---
+
+_cache: "OrderedDict[str, Document]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def content_hash(source: BinaryIO) -> str:
+    """SHA-256 of a stream's content, read in blocks; the stream is rewound afterwards."""
+    digest = hashlib.sha256()
+    source.seek(0)
+    for block in iter(lambda: source.read(BLOCK_BYTES), b""):
+        digest.update(block)
+    source.seek(0)
+    return digest.hexdigest()
+
+
+def read_document(source, name: str, max_bytes: int = MAX_BYTES, max_pages: int = MAX_PAGES) -> Document:
+    """
+    Extracts a document's text, at most once per distinct content.
+
+    Args:
+        source: Seekable binary stream, or bytes.
+        name (str): File name; its extension selects the parser.
+        max_bytes (int): Byte limit, checked before parsing.
+        max_pages (int): Extraction stops after this many pages (`Document.truncated` is then True).
+
+    Returns:
+        Document: The extracted text and page count. Results are cached by content hash
+        (and limits), so re-reading the same upload on a rerun is a dictionary lookup.
+
+    Raises:
+        IngestionError: Unsupported type, file too large, or unreadable content.
+    """
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+    file_type(name)
+    _check_size(source, max_bytes)
+    sha256 = content_hash(source)
+    key = f"{sha256}:{os.path.splitext(name)[1].lower()}:{max_pages}"
+    with _cache_lock:
+        if key in _cache:
+            _cache.move_to_end(key)
+            return replace(_cache[key], name=name)
+
+    pages, truncated, encodings = [], False, []
+    for page in iter_pages(source, name, max_bytes, encodings):
+        if len(pages) == max_pages:
+            truncated = True
+            break
+        pages.append(page)
+    # TXT pages are consecutive slices of the text; real pages are separated by a blank line
+    text = "".join(pages) if file_type(name) == "txt" else "\n\n".join(page.strip() for page in pages)
+    document = Document(name, sha256, text.strip(), len(pages), truncated, encodings[0] if encodings else None)
+    with _cache_lock:
+        _cache[key] = document
+        while len(_cache) > CACHE_ENTRIES:
+            _cache.popitem(last=False)
+    return document
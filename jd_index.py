@@ -0,0 +1,298 @@
+"""
+BM25 inverted index over a local corpus of job descriptions.
+
+Answers "which job descriptions best match this resume?" in milliseconds over thousands of
+postings. Text is tokenized with the ATS normalization pipeline (`ats_scoring`), so
+"APIs"/"API" and "k8s"/"Kubernetes" meet in the same postings list, and every known skill
+also contributes a canonical `skill:<name>` term.
+
+Documents can be added and removed at any time. Removal is a tombstone; the postings of
+removed documents are dropped by `compact()`, which also runs automatically once removed
+documents outnumber a quarter of the live ones, and before every save. On disk the index is
+one zlib-compressed file: a JSON header (vocabulary, documents, metadata) followed by
+delta-encoded uint32 document ids and uint16 term frequencies.
+
+    python jd_index.py build jds/ jd_index.bm25     # index every TXT/PDF/DOCX file in jds/
+    python jd_index.py search jd_index.bm25 "python aws kubernetes" -k 5
+"""
+import argparse
+import glob
+import heapq
+import itertools
+import json
+import math
+import os
+import struct
+import sys
+import threading
+import zlib
+from array import array
+from dataclasses import dataclass, field
+from typing import Optional
+
+import ats_scoring
+import ingestion
+from gemini_api.keywords import STOPWORDS
+
+_MAGIC = b"VMDBM25\x01"
+_STOP_TERMS = frozenset(ats_scoring.stem(word) for word in STOPWORDS)
+
+
+def index_terms(text: str) -> list:
+    """Terms a text is indexed (or queried) by: normalized, stemmed tokens plus canonical skills."""
+    tokens = ats_scoring.normalize_tokens(text)
+    terms = [token for token in tokens if token not in _STOP_TERMS and len(token) > 1]
+    terms.extend(f"skill:{skill}" for _, _, skill in ats_scoring.SKILL_AUTOMATON.iter_matches(tokens))
+    return terms
+
+
+@dataclass
+class SearchHit:
+    """One ranked job description."""
+    doc_id: str
+    score: float
+    metadata: dict = field(default_factory=dict)
+
+
+class JDIndex:
+    """In-process BM25 index with incremental add/remove and compact persistence."""
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        """
+        Args:
+            k1 (float): BM25 term-frequency saturation.
+            b (float): BM25 document-length normalization.
+        """
+        self.k1 = k1
+        self.b = b
+        self._postings: dict = {}     # term -> {internal id: term frequency}
+        self._lengths: dict = {}      # internal id -> number of terms (live documents only)
+        self._doc_ids: dict = {}      # internal id -> external doc id
+        self._internal: dict = {}     # external doc id -> internal id
+        self._metadata: dict = {}     # internal id -> metadata dict
+        self._dead: set = set()       # removed internal ids still present in postings
+        self._next_id = 0
+        self._total_length = 0
+        self._lock = threading.RLock()  # One index may be shared by every app session
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._internal
+
+    def doc_ids(self) -> list:
+        """External ids of the indexed documents."""
+        return list(self._internal)
+
+    def add(self, doc_id: str, text: str, metadata: Optional[dict] = None) -> None:
+        """Indexes a job description, replacing any previous document with the same id."""
+        frequencies = {}
+        for term in index_terms(text):
+            frequencies[term] = frequencies.get(term, 0) + 1
+        with self._lock:
+            if doc_id in self._internal:
+                self.remove(doc_id)
+            internal = self._next_id
+            self._next_id += 1
+            for term, tf in frequencies.items():
+                self._postings.setdefault(term, {})[internal] = min(tf, 0xFFFF)
+            length = sum(frequencies.values())
+            self._lengths[internal] = length
+            self._total_length += length
+            self._doc_ids[internal] = doc_id
+            self._internal[doc_id] = internal
+            if metadata is None:
+                first_line = next((line.strip() for line in text.splitlines() if line.strip()), "")
+                metadata = {"title": first_line[:120]}
+            self._metadata[internal] = metadata
+
+    def remove(self, doc_id: str) -> bool:
+        """Removes a document; returns False if it was not indexed."""
+        with self._lock:
+            internal = self._internal.pop(doc_id, None)
+            if internal is None:
+                return False
+            self._total_length -= self._lengths.pop(internal)
+            del self._doc_ids[internal]
+            del self._metadata[internal]
+            self._dead.add(internal)
+            if len(self._dead) > max(64, len(self._lengths) // 4):
+                self.compact()
+            return True
+
+    def compact(self) -> None:
+        """Drops removed documents from the postings lists."""
+        with self._lock:
+            if not self._dead:
+                return
+            dead = self._dead
+            for term in list(self._postings):
+                postings = self._postings[term]
+                if dead.isdisjoint(postings):
+                    continue
+                live = {doc: tf for doc, tf in postings.items() if doc not in dead}
+                if live:
+                    self._postings[term] = live
+                else:
+                    del self._postings[term]
+            self._dead = set()
+
+    def search(self, query: str, k: int = 10) -> list:
+        """
+        Ranks the indexed job descriptions against a query (e.g. a resume's skills and experience).
+
+        Args:
+            query (str): Free text; tokenized like the documents. Repeated query terms count once.
+            k (int): Number of results.
+
+        Returns:
+            list: Up to `k` `SearchHit`s, best first.
+        """
+        with self._lock:
+            live = len(self._lengths)
+            if not live:
+                return []
+            k1, b = self.k1, self.b
+            scale = b / (self._total_length / live)
+            norms = {doc: k1 * (1.0 - b + scale * length) for doc, length in self._lengths.items()}
+            scores = {}
+            for term in set(index_terms(query)):
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                df = len(postings)
+                if self._dead:
+                    df -= sum(1 for doc in self._dead if doc in postings)
+                    if not df:
+                        continue
+                weight = math.log(1.0 + (live - df + 0.5) / (df + 0.5)) * (k1 + 1.0)
+                for doc, tf in postings.items():
+                    norm = norms.get(doc)
+                    if norm is not None:  # None: removed, awaiting compaction
+                        scores[doc] = scores.get(doc, 0.0) + weight * tf / (tf + norm)
+            best = heapq.nlargest(k, scores.items(), key=lambda item: item[1])
+            return [SearchHit(self._doc_ids[doc], round(score, 4), self._metadata[doc]) for doc, score in best]
+
+    # --- Persistence ---
+
+    def save(self, path: str) -> None:
+        """Writes the index to `path` atomically, compacting it first."""
+        with self._lock:
+            self.compact()
+            # Renumber live documents densely so delta-encoded ids stay small
+            order = sorted(self._lengths)
+            dense = {internal: position for position, internal in enumerate(order)}
+            vocabulary = sorted(self._postings)
+            counts = array("I")
+            doc_deltas = array("I")
+            frequencies = array("H")
+            for term in vocabulary:
+                postings = sorted((dense[doc], tf) for doc, tf in self._postings[term].items())
+                counts.append(len(postings))
+                previous = 0
+                for doc, tf in postings:
+                    doc_deltas.append(doc - previous)
+                    frequencies.append(tf)
+                    previous = doc
+            header = json.dumps({
+                "k1": self.k1,
+                "b": self.b,
+                "vocabulary": vocabulary,
+                "doc_ids": [self._doc_ids[internal] for internal in order],
+                "lengths": [self._lengths[internal] for internal in order],
+                "metadata": [self._metadata[internal] for internal in order],
+            }, separators=(",", ":")).encode("utf-8")
+            if sys.byteorder != "little":
+                for values in (counts, doc_deltas, frequencies):
+                    values.byteswap()
+            payload = b"".join([struct.pack("<III", len(header), len(counts), len(doc_deltas)), header,
+                                counts.tobytes(), doc_deltas.tobytes(), frequencies.tobytes()])
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(_MAGIC)
+                f.write(zlib.compress(payload, 6))
+            os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "JDIndex":
+        """Reads an index written by `save`."""
+        with open(path, "rb") as f:
+            if f.read(len(_MAGIC)) != _MAGIC:
+                raise ValueError(f"{path} is not a VMD BM25 index")
+            payload = zlib.decompress(f.read())
+        header_length, term_count, posting_count = struct.unpack_from("<III", payload)
+        offset = 12
+        header = json.loads(payload[offset:offset + header_length])
+        offset += header_length
+        counts, doc_deltas, frequencies = array("I"), array("I"), array("H")
+        for values, count in ((counts, term_count), (doc_deltas, posting_count), (frequencies, posting_count)):
+            size = count * values.itemsize
+            values.frombytes(payload[offset:offset + size])
+            offset += size
+            if sys.byteorder != "little":
+                values.byteswap()
+
+        index = cls(k1=header["k1"], b=header["b"])
+        start = 0
+        for term, count in zip(header["vocabulary"], counts):
+            docs = itertools.accumulate(doc_deltas[start:start + count])
+            index._postings[term] = dict(zip(docs, frequencies[start:start + count]))
+            start += count
+        for internal, (doc_id, length, metadata) in enumerate(zip(header["doc_ids"], header["lengths"], header["metadata"])):
+            index._lengths[internal] = length
+            index._doc_ids[internal] = doc_id
+            index._internal[doc_id] = internal
+            index._metadata[internal] = metadata
+        index._next_id = len(header["doc_ids"])
+        index._total_length = sum(header["lengths"])
+        return index
+
+    @classmethod
+    def load_or_create(cls, path: str) -> "JDIndex":
+        return cls.load(path) if os.path.exists(path) else cls()
+
+
+def add_files(index: JDIndex, paths: list) -> int:
+    """Indexes TXT/PDF/DOCX files by path (the path is the document id); returns the number added."""
+    added = 0
+    for path in paths:
+        with open(path, "rb") as f:
+            text = ingestion.read_document(f, path).text
+        if text.strip():
+            first_line = next((line.strip() for line in text.splitlines() if line.strip()), "")
+            index.add(path, text, {"title": first_line[:120], "source": os.path.basename(path)})
+            added += 1
+    return added
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Build or query a BM25 index of job descriptions.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("build", help="Add every TXT/PDF/DOCX file of a directory to an index (created if missing).")
+    build.add_argument("directory")
+    build.add_argument("index")
+    search = commands.add_parser("search", help="Print the top-k job descriptions for a query.")
+    search.add_argument("index")
+    search.add_argument("query")
+    search.add_argument("-k", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        index = JDIndex.load_or_create(args.index)
+        paths = [path for extension in ingestion.SUPPORTED_TYPES
+                 for path in glob.glob(os.path.join(args.directory, "**", f"*.{extension}"), recursive=True)]
+        added = add_files(index, sorted(paths))
+        index.save(args.index)
+        print(f"Indexed {added} files; {len(index)} job descriptions, {os.path.getsize(args.index)} bytes on disk.")
+    else:
+        index = JDIndex.load(args.index)
+        for rank, hit in enumerate(index.search(args.query, args.k), start=1):
+            print(f"{rank:3d}. {hit.score:8.3f}  {hit.doc_id}  {hit.metadata.get('title', '')}")
+
+
+if __name__ == "__main__":
+    main()
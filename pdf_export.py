@@ -0,0 +1,237 @@
+"""
+PDF export of generated documents with pdfkit (wkhtmltopdf), off the script thread.
+
+Rendering runs in a small, bounded pool of background worker processes, so a slow
+wkhtmltopdf run never blocks a Streamlit rerun, and finished PDFs are cached on disk by a
+hash of their HTML and render options. The app submits the HTML when a document is first
+shown and picks the bytes up on a later rerun; a failed render stays failed until it is
+submitted again with `retry=True`:
+
+    key = submit(html)          # Starts rendering unless cached or already in flight
+    status(key)                 # "ready", "pending" or "failed"
+    pdf_bytes = result(key)     # Bytes once ready; None while pending
+
+Configuration (environment variables):
+    VMD_PDF_WORKERS       Worker processes (default 2).
+    VMD_PDF_CACHE_DIR     Directory of cached PDFs (default .vmd_cache/pdf).
+    VMD_PDF_CACHE_FILES   Maximum cached PDFs; the oldest are removed first (default 200).
+    VMD_WKHTMLTOPDF       Path to the wkhtmltopdf binary if it is not on PATH.
+"""
+import atexit
+import hashlib
+import json
+import multiprocessing
+import os
+import subprocess
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+WORKERS = int(os.getenv("VMD_PDF_WORKERS", "2"))
+CACHE_DIR = os.getenv("VMD_PDF_CACHE_DIR", os.path.join(".vmd_cache", "pdf"))
+CACHE_FILES = int(os.getenv("VMD_PDF_CACHE_FILES", "200"))
+RENDER_TIMEOUT = 60.0
+FAILED_KEYS = 256   # Failed renders remembered (so they are not retried on every rerun); oldest forgotten first
+
+# Generated text is untrusted: no scripts, no local files, no network
+PDF_OPTIONS = {
+    "page-size": "A4",
+    "encoding": "UTF-8",
+    "margin-top": "15mm",
+    "margin-bottom": "15mm",
+    "margin-left": "15mm",
+    "margin-right": "15mm",
+    "disable-javascript": None,
+    "disable-local-file-access": None,
+    "disable-external-links": None,
+    "quiet": None,
+}
+
+
+class PdfExportError(Exception):
+    """Raised when a PDF could not be rendered (pdfkit or wkhtmltopdf missing, render failure)."""
+
+
+def _render_pdf(html: str, options: dict, timeout: float = RENDER_TIMEOUT) -> bytes:
+    """Worker process entry point. wkhtmltopdf is killed after `timeout` seconds, freeing the worker."""
+    try:
+        import pdfkit
+    except ImportError:
+        raise PdfExportError("PDF export requires the 'pdfkit' package.") from None
+    try:
+        configuration = pdfkit.configuration(wkhtmltopdf=os.getenv("VMD_WKHTMLTOPDF", ""))
+        # pdfkit.from_string waits for wkhtmltopdf without a timeout, so run its command line here
+        kit = pdfkit.PDFKit(html, "string", options=options, configuration=configuration)
+        completed = subprocess.run(kit.command(), input=html.encode("utf-8"), capture_output=True,
+                                   env=kit.environ, timeout=timeout)
+        kit.handle_error(completed.returncode, (completed.stderr or b"").decode("utf-8", errors="replace"))
+        return completed.stdout
+    except subprocess.TimeoutExpired:
+        raise PdfExportError(f"wkhtmltopdf did not finish within {timeout:.0f} seconds.") from None
+    except OSError as e:
+        # pdfkit raises OSError both for a missing binary and for wkhtmltopdf failures
+        if "No wkhtmltopdf executable found" in str(e):
+            raise PdfExportError("PDF export requires wkhtmltopdf; install it or set VMD_WKHTMLTOPDF.") from None
+        raise PdfExportError(f"wkhtmltopdf failed: {str(e).strip()[:200]}") from None
+
+
+def cache_key(html: str, options: Optional[dict] = None) -> str:
+    """Content hash a rendered PDF is cached under."""
+    payload = json.dumps([html, options or PDF_OPTIONS], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _cache_path(key: str) -> str:
+    return os.path.join(CACHE_DIR, f"{key}.pdf")
+
+
+def _store(key: str, pdf: bytes) -> None:
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp_path = f"{_cache_path(key)}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(pdf)
+    os.replace(tmp_path, _cache_path(key))
+    cached = sorted((entry for entry in os.scandir(CACHE_DIR) if entry.name.endswith(".pdf")),
+                    key=lambda entry: entry.stat().st_mtime)
+    for entry in cached[:max(0, len(cached) - CACHE_FILES)]:
+        try:
+            os.remove(entry.path)
+        except OSError:
+            pass  # Already evicted by another process
+
+
+class _Renderer:
+    """Process pool plus the bookkeeping of in-flight and failed renders."""
+
+    def __init__(self, workers: int):
+        self.workers = workers
+        self._lock = threading.Lock()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pending: dict = {}    # key -> Future
+        self._failed: "OrderedDict[str, str]" = OrderedDict()   # key -> error message
+
+    def _executor(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # spawn: never fork a multi-threaded server process
+            self._pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"))
+        return self._pool
+
+    def _finished(self, key: str, future: Future) -> None:
+        with self._lock:
+            if self._pending.get(key) is not future:
+                return  # Already handled by `wait` or the done-callback
+            error = future.exception()
+            if error is None:
+                try:
+                    _store(key, future.result())
+                except OSError as e:
+                    error = e
+            del self._pending[key]
+            if error is not None:
+                self._failed[key] = str(error) or type(error).__name__
+                while len(self._failed) > FAILED_KEYS:
+                    self._failed.popitem(last=False)
+                if isinstance(error, BrokenProcessPool):
+                    self._pool = None  # A worker died; start a fresh pool on the next submit
+
+    def submit(self, html: str, options: Optional[dict] = None, retry: bool = False) -> str:
+        key = cache_key(html, options)
+        with self._lock:
+            if key in self._pending or os.path.exists(_cache_path(key)):
+                return key
+            if key in self._failed and not retry:
+                return key
+            self._failed.pop(key, None)
+            try:
+                future = self._executor().submit(_render_pdf, html, options or PDF_OPTIONS, RENDER_TIMEOUT)
+            except BrokenProcessPool:
+                self._pool = None
+                future = self._executor().submit(_render_pdf, html, options or PDF_OPTIONS, RENDER_TIMEOUT)
+            self._pending[key] = future
+        future.add_done_callback(lambda done: self._finished(key, done))
+        return key
+
+    def status(self, key: str) -> str:
+        with self._lock:
+            if key in self._pending:
+                return "pending"
+            if key in self._failed:
+                return "failed"
+        return "ready" if os.path.exists(_cache_path(key)) else "unknown"
+
+    def error(self, key: str) -> Optional[str]:
+        with self._lock:
+            return self._failed.get(key)
+
+    def wait(self, key: str, timeout: Optional[float]) -> None:
+        with self._lock:
+            future = self._pending.get(key)
+        if future is not None:
+            try:
+                future.exception(timeout=timeout)
+            except FutureTimeoutError:
+                return
+            self._finished(key, future)  # Make sure the file is written before returning
+
+    def shutdown(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+_renderer = _Renderer(WORKERS)
+atexit.register(_renderer.shutdown)
+
+
+def submit(html: str, options: Optional[dict] = None, retry: bool = False) -> str:
+    """
+    Queues an HTML document for rendering and returns its cache key immediately.
+
+    Args:
+        html (str): Full HTML document, e.g. from `generate_html_preview`.
+        options (dict): wkhtmltopdf options; defaults to PDF_OPTIONS.
+        retry (bool): Render again even if an earlier attempt for the same HTML failed.
+
+    Returns:
+        str: The cache key, for `status` and `result`.
+    """
+    return _renderer.submit(html, options, retry)
+
+
+def status(key: str) -> str:
+    """Render state of a key: "ready", "pending", "failed", or "unknown" (not submitted here and not cached)."""
+    return _renderer.status(key)
+
+
+def result(key: str, timeout: float = 0.0) -> Optional[bytes]:
+    """
+    Returns the rendered PDF, waiting up to `timeout` seconds if it is still being rendered.
+
+    Returns:
+        bytes: The PDF, or None if it is not ready yet.
+
+    Raises:
+        PdfExportError: The render failed.
+    """
+    if timeout:
+        _renderer.wait(key, timeout)
+    error = _renderer.error(key)
+    if error is not None:
+        raise PdfExportError(error)
+    try:
+        with open(_cache_path(key), "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def render(html: str, options: Optional[dict] = None, timeout: float = RENDER_TIMEOUT) -> bytes:
+    """Blocking convenience wrapper: submit, wait and return the PDF bytes."""
+    key = submit(html, options)
+    pdf = result(key, timeout)
+    if pdf is None:
+        raise PdfExportError(f"Rendering did not finish within {timeout:.0f} seconds.")
+    return pdf
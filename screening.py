@@ -0,0 +1,185 @@
+"""
+Batch screening: rank many candidate resumes against one job description in a single pass.
+
+Scoring follows the ATS estimator (`ats_scoring`): the same normalization, alias resolution
+and required/nice-to-have weights, so a candidate's score here equals the ATS Estimator's
+score for the same resume and keywords. Instead of one scan for skills and one for phrases
+per resume, all keywords (and every alias of the skills among them) are compiled into one
+Aho-Corasick automaton, each resume is scanned once, and the hits are collected into a sparse
+candidates x keywords matrix. Scores, required coverage and the TF-IDF cosine similarity of
+each resume to the job description (the tie-breaker) are then a few sparse matrix products:
+
+    result = screen({"alice.txt": text_a, "bob.txt": text_b}, required="Python, AWS", job_description=jd)
+    result.rows()                                       # ranked table for display
+    critique_top(result, resumes, "Data Engineer", 5)   # LLM deep dive for the top 5 only
+
+Requires NumPy and SciPy.
+"""
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Optional, Union
+
+import numpy as np
+from scipy import sparse
+
+import ats_scoring
+from gemini_api import chunking, critique_resume_section
+from gemini_api.keywords import extract_keywords
+
+CRITIQUE_CONCURRENCY = 4
+DERIVED_KEYWORDS = 15
+
+
+@dataclass
+class CandidateScore:
+    """One screened candidate."""
+    candidate_id: str
+    rank: int
+    score: float                      # Weighted keyword match, 0-100 (as in the ATS Estimator)
+    required_coverage: float          # Share of required keywords found, 0-100
+    similarity: float                 # TF-IDF cosine similarity to the job description, 0-1
+    matched: list = field(default_factory=list)
+    missing_required: list = field(default_factory=list)
+    missing_optional: list = field(default_factory=list)
+
+
+@dataclass
+class ScreeningResult:
+    """Candidates ranked best first, with the keyword set they were screened against."""
+    candidates: list
+    keyword_set: ats_scoring.KeywordSet
+    elapsed: float
+
+    def top(self, n: int) -> list:
+        return self.candidates[:n]
+
+    def rows(self) -> list:
+        """The ranking as a list of flat dicts, ready for `st.dataframe` or a CSV writer."""
+        return [{
+            "Rank": candidate.rank,
+            "Candidate": candidate.candidate_id,
+            "Score": candidate.score,
+            "Required %": candidate.required_coverage,
+            "Similarity": candidate.similarity,
+            "Matched": ", ".join(candidate.matched),
+            "Missing Required": ", ".join(candidate.missing_required),
+            "Missing Nice-to-have": ", ".join(candidate.missing_optional),
+        } for candidate in self.candidates]
+
+
+def _keyword_automaton(keyword_set: ats_scoring.KeywordSet) -> ats_scoring.AhoCorasick:
+    """Automaton whose payloads are keyword columns: skill terms match through all their aliases."""
+    columns = {term.key: column for column, term in enumerate(keyword_set.terms)}
+    patterns = [(term.key, column) for column, term in enumerate(keyword_set.terms) if isinstance(term.key, tuple)]
+    patterns.extend((alias, columns[skill]) for alias, skill in ats_scoring.ALIAS_TO_SKILL.items() if skill in columns)
+    return ats_scoring.AhoCorasick(patterns)
+
+
+def _tfidf_rows(counts: sparse.csr_matrix, idf: np.ndarray) -> sparse.csr_matrix:
+    """Sublinear TF-IDF weighting, L2-normalized per row."""
+    weighted = counts.astype(np.float64)
+    weighted.data = np.log1p(weighted.data)
+    weighted = sparse.csr_matrix(weighted.multiply(idf))
+    norms = np.sqrt(np.asarray(weighted.multiply(weighted).sum(axis=1)).ravel())
+    norms[norms == 0] = 1.0
+    return sparse.csr_matrix(sparse.diags(1.0 / norms) @ weighted)
+
+
+def screen(resumes: dict, required: Union[str, Iterable[str]], nice_to_have: Union[str, Iterable[str], None] = None,
+           job_description: str = "") -> ScreeningResult:
+    """
+    Scores and ranks every resume against one set of job keywords.
+
+    Args:
+        resumes (dict): Candidate id (e.g. file name) -> resume text.
+        required: Required keywords, as a comma/line separated string or an iterable. If empty,
+            the DERIVED_KEYWORDS top offline keywords of `job_description` are used.
+        nice_to_have: Optional keywords, same format.
+        job_description (str): Full job description. When given, the TF-IDF similarity of each
+            resume to it breaks ties between candidates with the same keyword scores.
+
+    Returns:
+        ScreeningResult: Every candidate, ranked by score, then required coverage, then similarity.
+    """
+    started = time.perf_counter()
+    if not ats_scoring.parse_terms(required) and job_description.strip():
+        required = [keyword.term for keyword in extract_keywords(job_description, top_k=DERIVED_KEYWORDS)]
+    keyword_set = ats_scoring.compile_keywords(required, nice_to_have)
+    automaton = _keyword_automaton(keyword_set)
+    ids = list(resumes)
+    n_candidates, n_keywords = len(ids), len(keyword_set.terms)
+
+    # One scan per resume fills both the keyword hit matrix and the term count matrix
+    hit_rows, hit_columns = [], []
+    count_rows, count_columns, count_values = [], [], []
+    vocabulary = {}
+    for row, candidate_id in enumerate(ids):
+        tokens = ats_scoring.normalize_tokens(resumes[candidate_id])
+        columns = {column for _, _, column in automaton.iter_matches(tokens)}
+        hit_rows.extend([row] * len(columns))
+        hit_columns.extend(columns)
+        for token, count in Counter(tokens).items():
+            count_rows.append(row)
+            count_columns.append(vocabulary.setdefault(token, len(vocabulary)))
+            count_values.append(count)
+    hits = sparse.csr_matrix((np.ones(len(hit_rows), dtype=np.float32), (hit_rows, hit_columns)),
+                             shape=(n_candidates, n_keywords))
+
+    weights = np.array([term.weight for term in keyword_set.terms], dtype=np.float64)
+    required_mask = np.array([term.required for term in keyword_set.terms], dtype=np.float64)
+    scores = np.zeros(n_candidates)
+    if keyword_set.total_weight:
+        scores = np.round(100.0 * (hits @ weights) / keyword_set.total_weight, 2)
+    coverage = np.zeros(n_candidates)
+    if required_mask.any():
+        coverage = np.round(100.0 * (hits @ required_mask) / required_mask.sum(), 2)
+
+    similarity = np.zeros(n_candidates)
+    if job_description.strip() and vocabulary:
+        query_counts = Counter(vocabulary.setdefault(token, len(vocabulary)) for token in ats_scoring.normalize_tokens(job_description))
+        counts = sparse.csr_matrix((count_values, (count_rows, count_columns)), shape=(n_candidates, len(vocabulary)))
+        document_frequency = np.bincount(counts.indices, minlength=len(vocabulary))
+        idf = np.log((1.0 + n_candidates) / (1.0 + document_frequency)) + 1.0
+        query = sparse.csr_matrix((list(query_counts.values()), ([0] * len(query_counts), list(query_counts.keys()))),
+                                  shape=(1, len(vocabulary)))
+        similarity = np.round((_tfidf_rows(counts, idf) @ _tfidf_rows(query, idf).T).toarray().ravel(), 4)
+
+    order = np.lexsort((-similarity, -coverage, -scores))  # Last key is the primary one
+    terms = keyword_set.terms
+    candidates = []
+    for rank, row in enumerate(order, start=1):
+        found = set(hits.indices[hits.indptr[row]:hits.indptr[row + 1]])
+        candidates.append(CandidateScore(
+            ids[row], rank, float(scores[row]), float(coverage[row]), float(similarity[row]),
+            matched=[term.display for column, term in enumerate(terms) if column in found],
+            missing_required=[term.display for column, term in enumerate(terms) if term.required and column not in found],
+            missing_optional=[term.display for column, term in enumerate(terms) if not term.required and column not in found],
+        ))
+    return ScreeningResult(candidates, keyword_set, time.perf_counter() - started)
+
+
+def critique_top(result: ScreeningResult, resumes: dict, job_title: str, n: int = 5,
+                 critique: Optional[Callable] = None, max_workers: int = CRITIQUE_CONCURRENCY) -> list:
+    """
+    Runs the LLM resume critique for the `n` best-ranked candidates only, concurrently.
+
+    Args:
+        result (ScreeningResult): Output of `screen`.
+        resumes (dict): The same candidate id -> resume text mapping passed to `screen`.
+        job_title (str): Target role, for the critique prompt.
+        n (int): Number of top candidates to critique.
+        critique (Callable): `(section_text, section_type, job_title) -> str`; defaults to
+            `gemini_api.critique_resume_section`.
+        max_workers (int): Maximum concurrent critiques (the shared rate limiter still applies).
+
+    Returns:
+        list: (CandidateScore, critique) pairs, in rank order.
+    """
+    critique = critique or critique_resume_section
+    top = result.top(n)
+    if not top:
+        return []
+    critiques = chunking.map_chunks([resumes[candidate.candidate_id] for candidate in top],
+                                    lambda text: critique(text, "Full Resume", job_title), max_workers)
+    return list(zip(top, critiques))
@@ -0,0 +1,89 @@
+"""
+Static page content: theme stylesheets, informational sections and the logo.
+
+The text the page renders on every run (theme CSS, Tips, FAQs, Contact Us, Upgrade,
+testimonials, Roadmap, Disclaimers) lives in versioned files under `assets/` instead of
+string literals in `app.py`. Each file is read once, and its version is the hash of its
+content:
+
+    tips = load("content/tips.md")
+    tips.text, tips.version
+    css = load("theme/dark.css")          # Stylesheets are minified on load
+    columns = tips.sections()             # Parts separated by SECTION_BREAK
+
+Files the browser fetches itself (the logo) live in `static/`, which Streamlit serves at
+`app/static/` when `server.enableStaticServing` is on (see `.streamlit/config.toml`).
+`static_url` adds the file's content hash to the URL, so a browser keeps its copy (Streamlit
+answers revalidations with 304 from the ETag/Last-Modified headers) until the file changes;
+a reverse proxy can mark `/app/static/` as `immutable` for the same reason.
+"""
+import hashlib
+import os
+import re
+from dataclasses import dataclass
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+STATIC_URL_PREFIX = "app/static"
+SECTION_BREAK = "<!-- column -->"
+VERSION_CHARS = 12
+
+_CSS_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_CSS_SPACE = re.compile(r"\s+")
+_CSS_PUNCTUATION_SPACE = re.compile(r"\s*([{};,>])\s*")
+
+
+@dataclass(frozen=True)
+class Asset:
+    """One static file, ready to render."""
+    name: str
+    text: str
+    version: str   # Hash of the file's content
+
+    def sections(self) -> list:
+        """The text split at SECTION_BREAK lines, e.g. one part per column."""
+        return [part.strip() for part in self.text.split(SECTION_BREAK)]
+
+
+def _version(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:VERSION_CHARS]
+
+
+def minify_css(css: str) -> str:
+    """Drops comments and whitespace that do not change a stylesheet's meaning."""
+    css = _CSS_SPACE.sub(" ", _CSS_COMMENT.sub("", css))
+    return _CSS_PUNCTUATION_SPACE.sub(r"\1", css).replace(";}", "}").strip()
+
+
+def load(name: str, assets_dir: str = ASSETS_DIR) -> Asset:
+    """
+    Reads an asset.
+
+    Args:
+        name (str): Path relative to `assets_dir`, e.g. "content/faq.md".
+        assets_dir (str): Root of the assets.
+
+    Returns:
+        Asset: The text (minified for `.css` files) and the content version.
+
+    Raises:
+        FileNotFoundError: The asset does not exist.
+    """
+    with open(os.path.join(assets_dir, name), "rb") as f:
+        data = f.read()
+    text = data.decode("utf-8")
+    if name.endswith(".css"):
+        text = minify_css(text)
+    return Asset(name, text, _version(data))
+
+
+def static_url(name: str, static_dir: str = STATIC_DIR) -> str:
+    """
+    URL of a file served from `static/`, versioned by its content.
+
+    Raises:
+        FileNotFoundError: The file does not exist.
+    """
+    with open(os.path.join(static_dir, name), "rb") as f:
+        version = _version(f.read())
+    return f"{STATIC_URL_PREFIX}/{name}?v={version}"
@@ -0,0 +1,21 @@
+"""
+Shared test setup.
+
+`gemini_api` reads its settings from the environment at import time, so the deterministic
+offline backend, a throwaway response cache and quotas that never throttle are configured
+here, before any test module imports it.
+"""
+import os
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+os.environ["VMD_LLM_BACKEND"] = "fake"
+os.environ["VMD_FAKE_LATENCY"] = "constant:0"
+os.environ["VMD_FAKE_FAILURE_RATE"] = "0"
+os.environ["VMD_CACHE_PATH"] = os.path.join(tempfile.mkdtemp(prefix="vmd_tests_"), "responses.sqlite3")
+os.environ["VMD_RATE_LIMIT_RPM"] = "1000000000"
+os.environ["VMD_RATE_LIMIT_TPM"] = "1000000000000"
+os.environ["VMD_MAX_CONCURRENCY"] = "64"
@@ -0,0 +1,40 @@
+import asyncio
+
+import pytest
+
+import gemini_api
+from gemini_api import aio
+
+JD = "We need a Python engineer to build data pipelines on AWS and Kubernetes. " * 400  # Long enough to chunk
+
+
+@pytest.mark.parametrize("engine", ["llm", "local", "refine", "unknown"])
+@pytest.mark.parametrize("chunked", [None, False, True])
+def test_generate_keywords_matches_the_sync_variant(engine, chunked):
+    expected = gemini_api.generate_keywords(JD, "job description", chunked=chunked, engine=engine)
+    result = asyncio.run(aio.generate_keywords(JD, "job description", chunked=chunked, engine=engine))
+    assert (result, result.ok) == (expected, expected.ok)
+
+
+@pytest.mark.parametrize("analysis_type", ["Key Skills and Requirements", "Skill Gap Analysis", "Unknown"])
+@pytest.mark.parametrize("engine", ["llm", "local"])
+def test_analyze_job_description_matches_the_sync_variant(analysis_type, engine):
+    expected = gemini_api.analyze_job_description(JD, analysis_type, "Data Engineer", engine=engine)
+    result = asyncio.run(aio.analyze_job_description(JD, analysis_type, "Data Engineer", engine=engine))
+    assert (result, result.ok) == (expected, expected.ok)
+
+
+def test_local_engine_rejects_free_form_analyses():
+    result = asyncio.run(aio.analyze_job_description(JD, "Skill Gap Analysis", engine="local"))
+    assert not result.ok
+    assert isinstance(result.error, gemini_api.InvalidRequestError)
+
+
+def test_async_generators_run_concurrently():
+    async def generate_all():
+        return await asyncio.gather(*(aio.generate_resume_summary(f"Candidate {i}", "Engineer", "Python", "5 years")
+                                      for i in range(8)))
+
+    results = asyncio.run(generate_all())
+    assert all(result.ok for result in results)
+    assert len(set(results)) == 8
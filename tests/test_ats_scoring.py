@@ -0,0 +1,63 @@
+import pytest
+
+from ats_scoring import AhoCorasick, analyze_resume, compile_keywords, normalize_tokens, parse_terms, score, score_text, stem
+
+RESUME = """Jane Doe — Data Engineer
+Built ETL pipelines in Python 3 and PostgreSQL on AWS; deployed services on k8s.
+Trained ML models and managed REST APIs. Familiar with Apache Kafka and CI/CD.
+"""
+
+
+@pytest.mark.parametrize("word, expected", [
+    ("apis", "api"), ("managing", "manag"), ("managed", "manag"), ("manage", "manag"),
+    ("databases", "databas"), ("database", "databas"), ("running", "run"), ("analysis", "analysis"),
+    ("c++", "c++"), ("sql", "sql"),
+])
+def test_stem(word, expected):
+    assert stem(word) == expected
+
+
+def test_normalize_tokens_drops_versions_and_accents():
+    assert normalize_tokens("Python 3, Java 17 and 5+ years") == ["python", "java", "and", "year"]
+    assert normalize_tokens("Résumé Node.js") == ["resum", "node.js"]
+
+
+def test_parse_terms_strips_bullets_and_separators():
+    assert parse_terms("- Python\n* AWS; Kafka | 1. SQL.\n\n") == ["Python", "AWS", "Kafka", "SQL"]
+    assert parse_terms(["  Go ", ""]) == ["Go"]
+    assert parse_terms(None) == []
+
+
+def test_aho_corasick_finds_overlapping_patterns():
+    automaton = AhoCorasick([(("a", "b"), "ab"), (("b", "c"), "bc"), (("a", "b", "c", "d"), "abcd")])
+    assert sorted(automaton.iter_matches(["x", "a", "b", "c", "d"])) == [(1, 2, "ab"), (1, 4, "abcd"), (2, 2, "bc")]
+
+
+def test_aliases_and_phrases_match():
+    result = score_text(RESUME, required="Python, Kubernetes, machine learning, REST API, ETL pipeline",
+                        nice_to_have="Kafka, Terraform")
+    assert result.missing_required == []
+    assert result.matched_optional == ["Kafka"]
+    assert result.missing_optional == ["Terraform"]
+    assert result.required_coverage == 100.0
+    assert result.score == pytest.approx(100.0 * (5 * 2 + 1) / (5 * 2 + 2 * 1), abs=0.01)
+
+
+def test_duplicate_terms_count_once_and_required_wins():
+    keyword_set = compile_keywords(required="ML, Python", nice_to_have="machine learning, python, Rust")
+    assert [(term.display, term.required) for term in keyword_set.terms] == [
+        ("ML", True), ("Python", True), ("Rust", False)]
+    assert keyword_set.total_weight == 5.0
+
+
+def test_a_phrase_needs_contiguous_tokens():
+    assert score_text("data and more pipelines", "data pipeline").score == 0.0
+    assert score_text("streaming data pipelines", "data pipeline").score == 100.0
+
+
+def test_one_profile_scores_against_many_keyword_sets():
+    profile = analyze_resume(RESUME)
+    assert "Python" in profile.skills and "Kubernetes" in profile.skills
+    assert score(profile, compile_keywords("Python")).score == 100.0
+    assert score(profile, compile_keywords("Rust")).missing_required == ["Rust"]
+    assert score(profile, compile_keywords("")).score == 0.0
@@ -0,0 +1,62 @@
+import random
+
+import pytest
+
+from gemini_api.backends import FakeBackend, ResourceExhausted, parse_distribution
+
+
+def _outcomes(backend, prompt, attempts):
+    results = []
+    for _ in range(attempts):
+        try:
+            results.append(backend.generate(prompt, timeout=1.0).text)
+        except (ConnectionError, ResourceExhausted, TimeoutError) as e:
+            results.append(type(e).__name__)
+    return results
+
+
+def test_response_text_is_a_function_of_the_prompt():
+    backend = FakeBackend(latency="constant:0")
+    first = backend.generate("Write a summary", timeout=1.0)
+    assert FakeBackend(latency="constant:0", seed=7).generate("Write a summary", timeout=1.0).text == first.text
+    assert backend.generate("Write a cover letter", timeout=1.0).text != first.text
+    assert first.total_tokens == first.prompt_tokens + first.output_tokens
+
+
+def test_failures_are_reproducible_per_attempt():
+    prompts = [f"prompt {i}" for i in range(20)]
+    runs = [[_outcomes(FakeBackend(latency="constant:0", failure_rate=0.5, seed=3), p, 3) for p in prompts]
+            for _ in range(2)]
+    assert runs[0] == runs[1]
+    assert any(len(set(outcomes)) > 1 for outcomes in runs[0])  # Retries can succeed
+
+
+def test_latency_past_the_timeout_raises_timeout():
+    with pytest.raises(TimeoutError):
+        FakeBackend(latency="constant:50").generate("prompt", timeout=0.01)
+
+
+def test_attempt_counts_are_bounded():
+    backend = FakeBackend(latency="constant:0", tracked_prompts=3)
+    for i in range(10):
+        backend.generate(f"prompt {i}", timeout=1.0)
+    assert len(backend._attempts) == 3
+
+
+def test_stream_chunks_join_to_the_full_response():
+    backend = FakeBackend(latency="constant:0", stream_chunks=4)
+    chunks = list(backend.stream("Write a summary", timeout=1.0))
+    assert "".join(chunk.text for chunk in chunks) == backend.generate("Write a summary", timeout=1.0).text
+    assert chunks[-1].total_tokens and not chunks[-1].text
+
+
+@pytest.mark.parametrize("spec", ["constant:200", "uniform:100,300", "normal:200,50",
+                                  "lognormal:200,0.5", "exponential:200"])
+def test_parse_distribution(spec):
+    sample = parse_distribution(spec)
+    assert all(value >= 0 for value in (sample(random.Random(i)) for i in range(100)))
+
+
+def test_parse_distribution_rejects_unknown_kinds():
+    with pytest.raises(ValueError):
+        parse_distribution("pareto:1")
@@ -0,0 +1,82 @@
+import asyncio
+import csv
+import json
+
+from gemini_api import batch
+
+ROWS = [
+    {"id": str(i), "name": f"Candidate {i}", "title": "Data Engineer", "company": "Acme",
+     "skills": "Python, SQL", "experience": f"{i} years building pipelines"}
+    for i in range(1, 4)
+]
+
+
+def _write_csv(path, rows=ROWS):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def _records(path) -> list:
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def _records_lenient(path) -> list:
+    records = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                pass
+    return records
+
+
+def _run(input_path, output_path, doc_types=batch.DOC_TYPES, concurrency=2):
+    return asyncio.run(asyncio.wait_for(batch.run_batch(str(input_path), str(output_path), list(doc_types), concurrency), 30))
+
+
+def test_iter_rows_reads_csv_and_jsonl(tmp_path):
+    _write_csv(tmp_path / "rows.csv")
+    (tmp_path / "rows.jsonl").write_text('{"name": "A"}\n\n{"name": "B", "id": "b"}\n', encoding="utf-8")
+    assert [row["id"] for row in batch.iter_rows(str(tmp_path / "rows.csv"))] == ["1", "2", "3"]
+    assert [row["id"] for row in batch.iter_rows(str(tmp_path / "rows.jsonl"))] == ["1", "b"]
+
+
+def test_run_batch_writes_one_record_per_document(tmp_path):
+    _write_csv(tmp_path / "rows.csv")
+    report = _run(tmp_path / "rows.csv", tmp_path / "out.jsonl")
+    records = _records(tmp_path / "out.jsonl")
+    assert (report.succeeded, report.failed, report.skipped) == (6, 0, 0)
+    assert {(record["id"], record["doc_type"]) for record in records} == {
+        (row["id"], doc_type) for row in ROWS for doc_type in batch.DOC_TYPES}
+    assert all(record["ok"] and record["text"] for record in records)
+
+
+def test_rerun_resumes_from_the_checkpoint(tmp_path):
+    _write_csv(tmp_path / "rows.csv")
+    _run(tmp_path / "rows.csv", tmp_path / "out.jsonl", doc_types=["resume"])
+    with open(tmp_path / "out.jsonl", "a", encoding="utf-8") as f:
+        f.write('{"id": "9", "doc_type": "res')  # Line cut short by a crash
+    report = _run(tmp_path / "rows.csv", tmp_path / "out.jsonl")
+    assert (report.succeeded, report.skipped) == (3, 3)
+    assert len(_records_lenient(tmp_path / "out.jsonl")) == 6
+
+
+def test_a_failing_job_does_not_stop_the_batch(tmp_path, monkeypatch):
+    generate = batch._generate
+
+    async def flaky(row, doc_type):
+        if row["id"] == "2" and doc_type == "resume":
+            raise KeyError("name")
+        return await generate(row, doc_type)
+
+    monkeypatch.setattr(batch, "_generate", flaky)
+    _write_csv(tmp_path / "rows.csv")
+    report = _run(tmp_path / "rows.csv", tmp_path / "out.jsonl", concurrency=1)
+    assert (report.succeeded, report.failed) == (5, 1)
+    assert report.failures == [("2", "resume")]
+    failed = [record for record in _records(tmp_path / "out.jsonl") if not record["ok"]]
+    assert [(record["id"], record["error"]) for record in failed] == [("2", "KeyError")]
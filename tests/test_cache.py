@@ -0,0 +1,91 @@
+import sqlite3
+
+from gemini_api.cache import ResponseCache, make_cache_key, normalize_prompt
+
+
+def _disk_rows(path) -> int:
+    with sqlite3.connect(path) as db:
+        return db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+
+def test_normalize_prompt_ignores_whitespace_only_differences():
+    a = "\n    Write a summary.\n\n\n    Tone: formal   \n"
+    b = "Write a summary.\n\nTone: formal"
+    assert normalize_prompt(a) == normalize_prompt(b) == b
+
+
+def test_cache_key_depends_on_model_and_config():
+    key = make_cache_key("model-a", "prompt", {"temperature": 0.2})
+    assert key == make_cache_key("model-a", "  prompt\n", {"temperature": 0.2})
+    assert key != make_cache_key("model-b", "prompt", {"temperature": 0.2})
+    assert key != make_cache_key("model-a", "prompt", {"temperature": 0.9})
+
+
+def test_memory_tier_evicts_least_recently_used():
+    cache = ResponseCache(max_entries=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    assert cache.get("a") == "1"  # "b" is now the least recently used
+    cache.set("c", "3")
+    assert cache.get("b") is None
+    assert cache.get("a") == "1" and cache.get("c") == "3"
+    assert cache.stats.evictions == 1
+
+
+def test_memory_entries_expire():
+    cache = ResponseCache(ttl_seconds=0)
+    cache.set("a", "1")
+    assert cache.get("a") is None
+    assert cache.stats.expirations == 1
+
+
+def test_disk_tier_survives_a_new_instance(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    ResponseCache(db_path=path).set("key", "value")
+    cache = ResponseCache(db_path=path)
+    assert cache.get("key") == "value"
+    assert cache.stats.disk_hits == 1
+    assert cache.get("key") == "value"
+    assert cache.stats.memory_hits == 1
+
+
+def test_expired_disk_rows_are_pruned_on_open(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    ResponseCache(db_path=path).set("key", "value")
+    cache = ResponseCache(db_path=path, disk_ttl_seconds=0)
+    assert cache.get("key") is None
+    assert _disk_rows(path) == 0
+
+
+def test_disk_tier_is_capped_by_rows_and_bytes(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    cache = ResponseCache(db_path=path, max_disk_entries=3, prune_every=1)
+    for i in range(10):
+        cache.set(f"k{i}", "x" * 10)
+    assert _disk_rows(path) == 3
+    assert ResponseCache(db_path=path).get("k9") == "x" * 10
+
+    ResponseCache(db_path=path, max_disk_bytes=25).get("k9")  # Pruned on open: only two 10-byte values fit
+    assert _disk_rows(path) == 2
+
+
+def test_broken_cache_file_falls_back_to_memory(tmp_path):
+    path = tmp_path / "cache.sqlite3"
+    path.write_bytes(b"not a database" * 100)
+    cache = ResponseCache(db_path=str(path))
+    assert cache.get("key") is None
+    cache.set("key", "value")
+    assert cache.get("key") == "value"
+    assert cache.stats.disk_errors == 1
+
+
+def test_generate_content_serves_repeated_prompts_from_the_cache():
+    import gemini_api
+
+    before = gemini_api.get_cache_stats()
+    first = gemini_api.generate_content("Test prompt for the response cache")
+    second = gemini_api.generate_content("  Test prompt for the response cache\n")
+    after = gemini_api.get_cache_stats()
+    assert first == second
+    assert after["misses"] - before["misses"] == 1
+    assert after["hits"] - before["hits"] == 1
@@ -0,0 +1,121 @@
+import logging
+
+import pytest
+
+from history_store import PAGE_SIZE, SNIPPET_CHARS, HistoryStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = HistoryStore(str(tmp_path / "history" / "history.sqlite3"), flush_interval=0.01)
+    yield store
+    store.flush()
+
+
+def _fill(store, user="ada", count=25):
+    for i in range(count):
+        doc_type = "Resume" if i % 2 else "Cover Letter"
+        store.add(user, doc_type, f"{doc_type} {i}", f"Body of document {i}. " * 20, created_at=1000.0 + i)
+
+
+def test_pages_walk_the_whole_history_newest_first(store):
+    _fill(store)
+    _fill(store, user="bob", count=3)
+    seen, cursor = [], None
+    while True:
+        entries, cursor = store.page("ada", before=cursor)
+        assert len(entries) <= PAGE_SIZE
+        seen.extend(entries)
+        if cursor is None:
+            break
+    assert [entry.title for entry in seen] == [f"{'Resume' if i % 2 else 'Cover Letter'} {i}" for i in range(24, -1, -1)]
+    assert {entry.user for entry in seen} == {"ada"}
+    assert all(entry.content is None and len(entry.snippet) <= SNIPPET_CHARS for entry in seen)
+
+
+def test_ties_on_created_at_are_not_skipped(store):
+    for i in range(7):
+        store.add("ada", "Resume", f"Resume {i}", "text", created_at=1000.0)
+    first, cursor = store.page("ada", limit=4)
+    second, cursor = store.page("ada", before=cursor, limit=4)
+    assert cursor is None
+    assert sorted(entry.id for entry in first + second) == sorted({entry.id for entry in first + second})
+    assert len(first + second) == 7
+
+
+def test_filter_by_type_count_and_get(store):
+    _fill(store)
+    entries, _ = store.page("ada", doc_type="Resume", limit=100)
+    assert len(entries) == 12 and {entry.doc_type for entry in entries} == {"Resume"}
+    assert store.count("ada") == 25 and store.count("ada", "Cover Letter") == 13 and store.count("bob") == 0
+    full = store.get(entries[0].id)
+    assert full.content == "Body of document 23. " * 20 and full.snippet == entries[0].snippet
+    assert store.get(10_000) is None
+
+
+def test_reads_see_queued_writes_and_survive_reopening(store):
+    store.add("ada", "Resume", "Fresh", "just written")
+    assert store.page("ada")[0][0].title == "Fresh"  # No explicit flush
+    reopened = HistoryStore(store.db_path)
+    assert reopened.count("ada") == 1
+
+
+def test_a_failed_batch_is_logged_and_the_writer_keeps_going(store, caplog):
+    with caplog.at_level(logging.ERROR, logger="history_store"):
+        store.add("ada", "Resume", None, "title violates NOT NULL")
+        assert store.flush()
+    assert "Could not save 1 history entries" in caplog.text
+    store.add("ada", "Resume", "After the failure", "still saved")
+    assert store.flush()
+    assert [entry.title for entry in store.page("ada")[0]] == ["After the failure"]
+
+
+def _add_documents(store):
+    store.add("ada", "Cover Letter", "Cover Letter for Acme", "I am excited to join Acme as a platform engineer.", created_at=1.0)
+    store.add("ada", "Resume", "Resume Summary", "Engineer who managed Kubernetes clusters at Acme and Initech.", created_at=2.0)
+    store.add("ada", "Resume", "Resume Skills", "Python, Go and Terraform.", created_at=3.0)
+    store.add("bob", "Resume", "Acme Kubernetes", "Bob's Kubernetes work at Acme.", created_at=4.0)
+
+
+def test_search_ranks_title_matches_first_and_stays_per_user(store):
+    _add_documents(store)
+    results = store.search("ada", "acme")
+    assert store.full_text  # Set once the database is open
+    assert [entry.title for entry in results] == ["Cover Letter for Acme", "Resume Summary"]
+    assert {entry.user for entry in results} == {"ada"}
+    assert "**Acme**" in results[1].snippet
+
+
+def test_search_requires_every_term_stems_and_matches_prefixes(store):
+    _add_documents(store)
+    assert [entry.title for entry in store.search("ada", "managing kubernetes")] == ["Resume Summary"]
+    assert [entry.title for entry in store.search("ada", "terra")] == ["Resume Skills"]
+    assert store.search("ada", "kubernetes python") == []
+    assert store.search("ada", "acme", doc_type="Resume")[0].title == "Resume Summary"
+
+
+def test_search_treats_fts_syntax_as_text(store):
+    _add_documents(store)
+    assert store.search("ada", '" OR * NEAR(') == []
+    assert store.search("ada", "   ") == []
+    assert [entry.title for entry in store.search("ada", "go,")] == ["Resume Skills"]
+
+
+def test_search_indexes_rows_written_before_the_fts_table_existed(store):
+    _add_documents(store)
+    assert store.flush()
+    with store._db_lock:
+        db = store._connection()
+        db.execute("DROP TABLE generations_fts")
+        for trigger in ("insert", "delete", "update"):
+            db.execute(f"DROP TRIGGER generations_fts_{trigger}")
+    reopened = HistoryStore(store.db_path)
+    assert [entry.title for entry in reopened.search("ada", "initech")] == ["Resume Summary"]
+
+
+def test_search_falls_back_to_like_without_fts5(store):
+    _add_documents(store)
+    store.page("ada")
+    store.full_text = False
+    assert [entry.title for entry in store.search("ada", "acme kubernetes")] == ["Resume Summary"]
+    assert store.search("ada", "kubernetes python") == []
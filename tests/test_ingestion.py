@@ -0,0 +1,107 @@
+import io
+import zipfile
+
+import pytest
+
+import ingestion
+from ingestion import IngestionError, content_hash, detect_encoding, iter_pages, read_document
+
+
+def _pdf(pages: list) -> bytes:
+    """Minimal PDF with one line of Helvetica text per page."""
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for text in pages:
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode("latin-1")
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        objects.append(b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents %d 0 R "
+                       b"/Resources << /Font << /F1 3 0 R >> >> >>" % len(objects))
+        kids.append(b"%d 0 R" % len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(kids), len(kids))
+    out, offsets = io.BytesIO(), []
+    out.write(b"%PDF-1.4\n")
+    for number, body in enumerate(objects, start=1):
+        offsets.append(out.tell())
+        out.write(b"%d 0 obj\n%s\nendobj\n" % (number, body))
+    xref = out.tell()
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    out.writelines(b"%010d 00000 n \n" % offset for offset in offsets)
+    out.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref))
+    return out.getvalue()
+
+
+def _docx(paragraphs: list, page_break_after: int = -1, body_end: str = "</w:body>") -> bytes:
+    ns = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+    body = []
+    for i, text in enumerate(paragraphs):
+        body.append(f"<w:p><w:r><w:t>{text}</w:t></w:r></w:p>")
+        if i == page_break_after:
+            body.append('<w:p><w:r><w:br w:type="page"/></w:r></w:p>')
+    out = io.BytesIO()
+    with zipfile.ZipFile(out, "w") as archive:
+        archive.writestr("word/document.xml", f'<w:document xmlns:w="{ns}"><w:body>{"".join(body)}{body_end}</w:document>')
+    return out.getvalue()
+
+
+def test_txt_encodings_are_detected():
+    assert detect_encoding(io.BytesIO("naïve café".encode("utf-8"))) == "utf-8"
+    assert detect_encoding(io.BytesIO("naïve – café".encode("cp1252"))) == "cp1252"
+    assert detect_encoding(io.BytesIO("﻿hello".encode("utf-8"))) == "utf-8-sig"
+    assert detect_encoding(io.BytesIO("hello".encode("utf-16"))) == "utf-16"
+    assert detect_encoding(io.BytesIO(b"\x81\x8d\x8f")) == "latin-1"
+    document = read_document("Résumé – Jane".encode("cp1252"), "resume.txt")
+    assert (document.text, document.encoding) == ("Résumé – Jane", "cp1252")
+
+
+def test_utf8_sequences_split_across_blocks_decode(monkeypatch):
+    monkeypatch.setattr(ingestion, "BLOCK_BYTES", 3)
+    assert "".join(iter_pages(io.BytesIO("ééé€".encode("utf-8")), "a.txt")) == "ééé€"
+
+
+def test_txt_pages_cut_at_line_ends(monkeypatch):
+    monkeypatch.setattr(ingestion, "PAGE_CHARS", 20)
+    text = "".join(f"line {i:02d}\n" for i in range(10))
+    pages = list(iter_pages(io.BytesIO(text.encode()), "a.txt"))
+    assert "".join(pages) == text
+    assert all(page.endswith("\n") for page in pages) and len(pages) > 1
+
+
+def test_pdf_pages_and_page_limit():
+    data = _pdf(["Python developer", "AWS and Kubernetes", "References"])
+    assert list(iter_pages(io.BytesIO(data), "cv.PDF")) == ["Python developer", "AWS and Kubernetes", "References"]
+    document = read_document(data, "cv.pdf", max_pages=2)
+    assert (document.pages, document.truncated) == (2, True)
+    assert document.text == "Python developer\n\nAWS and Kubernetes"
+
+
+def test_docx_paragraphs_and_page_breaks():
+    pages = list(iter_pages(io.BytesIO(_docx(["Jane Doe", "Python", "Page two"], page_break_after=1)), "cv.docx"))
+    assert pages == ["Jane Doe\nPython\n", "\nPage two\n"]
+    assert read_document(_docx(["Jane Doe", "Python"]), "cv.docx").text == "Jane Doe\nPython"
+
+
+@pytest.mark.parametrize("data, name", [
+    (b"%PDF-1.4\nnot really a pdf", "broken.pdf"),
+    (_pdf(["text"])[:60], "truncated.pdf"),
+    (b"PK not a zip", "broken.docx"),
+    (_docx(["x"], body_end="</w:bod>"), "malformed.docx"),
+    (_docx(["x"]).replace(b"<w:t>x", b"<w:t>y"), "bad_crc.docx"),
+    (_docx(["x"])[:-30], "truncated.docx"),
+    (b"hello", "notes.exe"),
+], ids=lambda value: value if isinstance(value, str) else "")
+def test_unreadable_uploads_raise_ingestion_error(data, name):
+    with pytest.raises(IngestionError):
+        read_document(data, name)
+
+
+def test_size_limit_is_checked_before_parsing():
+    with pytest.raises(IngestionError, match="limit"):
+        read_document(b"x" * 2048, "big.txt", max_bytes=1024)
+
+
+def test_read_document_is_memoized_by_content():
+    source = io.BytesIO(b"same content")
+    first = read_document(source, "a.txt")
+    second = read_document(b"same content", "b.txt")
+    assert second.name == "b.txt" and second.sha256 == first.sha256 == content_hash(source)
+    assert source.tell() == 0
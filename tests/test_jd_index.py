@@ -0,0 +1,72 @@
+import pytest
+
+from jd_index import JDIndex, index_terms
+
+JDS = {
+    "backend": "Backend Engineer\nPython, Django and PostgreSQL APIs on AWS. Kubernetes a plus.",
+    "frontend": "Frontend Engineer\nReact, TypeScript and CSS. Build accessible user interfaces.",
+    "data": "Data Engineer\nSpark and Python pipelines, Airflow, SQL warehouses on AWS.",
+    "ml": "Machine Learning Engineer\nTrain ML models in Python with PyTorch; deploy on k8s.",
+}
+
+
+@pytest.fixture
+def index():
+    index = JDIndex()
+    for doc_id, text in JDS.items():
+        index.add(doc_id, text)
+    return index
+
+
+def _ids(hits):
+    return [hit.doc_id for hit in hits]
+
+
+def test_index_terms_add_canonical_skills():
+    terms = index_terms("Deploying services to k8s and the APIs")
+    assert "skill:Kubernetes" in terms and "api" in terms
+    assert "the" not in terms and "and" not in terms
+
+
+def test_search_ranks_by_relevance(index):
+    assert _ids(index.search("react typescript css"))[0] == "frontend"
+    assert _ids(index.search("kubernetes machine learning pytorch", k=2))[0] == "ml"
+    assert index.search("python", k=1)[0].metadata == {"title": "Backend Engineer"}
+    assert index.search("cobol mainframe") == []
+
+
+def test_add_replaces_and_remove_hides(index):
+    index.add("frontend", "Frontend Engineer\nVue and Svelte.")
+    assert "frontend" not in _ids(index.search("react typescript"))
+    assert index.remove("data") and not index.remove("data")
+    assert "data" not in _ids(index.search("spark airflow"))
+    assert len(index) == 3 and "data" not in index
+
+
+def test_compact_keeps_results(index):
+    index.remove("ml")
+    before = index.search("python aws", k=10)
+    index.compact()
+    assert index.search("python aws", k=10) == before
+    assert not any(index._dead & set(postings) for postings in index._postings.values())
+
+
+def test_save_load_round_trip(index, tmp_path):
+    index.remove("frontend")
+    index.add("extra", "Site Reliability Engineer\nTerraform, AWS and Kubernetes.", {"title": "SRE", "source": "x.txt"})
+    path = tmp_path / "nested" / "jd_index.bm25"
+    index.save(str(path))
+    loaded = JDIndex.load(str(path))
+    assert sorted(loaded.doc_ids()) == sorted(index.doc_ids())
+    for query in ("python aws", "kubernetes terraform", "spark sql", "react"):
+        assert loaded.search(query, k=5) == index.search(query, k=5)
+    loaded.add("new", "Python Engineer")  # Ids keep counting after the loaded documents
+    assert "new" in _ids(loaded.search("python", k=10)) and len(loaded) == 5
+
+
+def test_load_rejects_other_files(tmp_path):
+    path = tmp_path / "not_an_index"
+    path.write_bytes(b"hello")
+    with pytest.raises(ValueError):
+        JDIndex.load(str(path))
+    assert len(JDIndex.load_or_create(str(tmp_path / "missing.bm25"))) == 0
@@ -0,0 +1,41 @@
+from gemini_api.keywords import extract_keywords, format_keywords, match_skills, tokenize
+
+JD = """Senior Data Engineer
+
+We are looking for an engineer to design and build data pipelines in Python and SQL.
+You will work closely with analysts and lead the migration to AWS and Kubernetes.
+Experience with Apache Spark, CI/CD and Node.js is nice to have.
+Strong graphic design and stakeholder communication skills.
+"""
+
+
+def test_tokenize_keeps_symbols_inside_tokens():
+    assert tokenize("C++, C# and CI/CD with Node.js.") == ["c++", "c#", "and", "ci/cd", "with", "node.js"]
+
+
+def test_match_skills_prefers_the_longest_alias():
+    found = match_skills(tokenize("Apache Spark and Spark; also Go and golang"))
+    assert found["Spark"][0] == 2
+    assert found["Go"] == (1, 7)  # "Go" itself is ambiguous; only "golang" counts
+
+
+def test_skills_outrank_free_phrases():
+    terms = [keyword.term for keyword in extract_keywords(JD)]
+    skills = [keyword.term for keyword in extract_keywords(JD) if keyword.is_skill]
+    assert {"Data Engineering", "Python", "SQL", "AWS", "Kubernetes", "Spark", "CI/CD", "Node.js"} <= set(skills)
+    assert terms[:len(skills)] == skills
+
+
+def test_leading_verbs_and_filler_words_are_dropped():
+    terms = {keyword.term.lower() for keyword in extract_keywords(JD, top_k=100)}
+    assert {"senior data engineer", "migration"} <= terms
+    assert "graphic design" in terms  # A verb inside a phrase stays
+    assert not any(term.split()[0] in {"design", "build", "lead"} for term in terms)
+    assert not {"closely", "nice"} & terms
+
+
+def test_extraction_is_deterministic_and_bounded():
+    assert extract_keywords(JD, top_k=5) == extract_keywords(JD, top_k=5)
+    assert len(extract_keywords(JD, top_k=5)) == 5
+    assert extract_keywords("   ") == []
+    assert format_keywords(extract_keywords("Python and SQL")) == "Python, SQL"
@@ -0,0 +1,124 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from gemini_api.errors import DeadlineExceededError, RateLimitedError
+from gemini_api.ratelimit import (
+    FAILED, SUCCEEDED, THROTTLED, AIMDConcurrencyLimiter, ModelRateLimiter, TokenBucket, is_rate_limit_error,
+)
+
+
+class ResourceExhausted(Exception):
+    pass
+
+
+class HTTPError(Exception):
+    def __init__(self, code):
+        super().__init__(f"HTTP {code}")
+        self.code = code
+
+
+def test_is_rate_limit_error_ignores_the_message():
+    assert is_rate_limit_error(ResourceExhausted())
+    assert is_rate_limit_error(HTTPError(429))
+    assert is_rate_limit_error(RateLimitedError("slow down"))
+    assert not is_rate_limit_error(HTTPError(500))
+    assert not is_rate_limit_error(ValueError("429 RESOURCE_EXHAUSTED quota"))
+
+
+def test_token_bucket_reserves_in_arrival_order():
+    bucket = TokenBucket(rate_per_minute=60)  # One token per second, capacity 60
+    assert bucket.reserve(60) == 0.0
+    assert bucket.reserve(1) == pytest.approx(1.0, abs=0.05)
+    assert bucket.reserve(1) == pytest.approx(2.0, abs=0.05)
+    bucket.adjust(2)
+    assert bucket.reserve(1) == pytest.approx(1.0, abs=0.05)
+
+
+def test_aimd_limit_grows_on_success_and_halves_on_throttling():
+    limiter = AIMDConcurrencyLimiter(initial=4, maximum=8, cooldown=60)
+    for _ in range(8):
+        assert limiter.acquire()
+        limiter.release(SUCCEEDED)
+    assert limiter.limit == 5
+    for outcome in (THROTTLED, THROTTLED):  # The second 429 falls inside the cooldown
+        limiter.acquire()
+        limiter.release(outcome)
+    assert limiter.limit == 2
+    limiter.acquire()
+    limiter.release(FAILED)
+    assert limiter.limit == 2 and limiter.in_flight == 0
+
+
+def test_acquire_times_out_when_no_slot_frees_up():
+    limiter = AIMDConcurrencyLimiter(initial=1)
+    assert limiter.acquire()
+    started = time.monotonic()
+    assert not limiter.acquire(timeout=0.1)
+    assert 0.1 <= time.monotonic() - started < 1.0
+    threading.Timer(0.05, limiter.release).start()
+    assert limiter.acquire(timeout=1.0)
+
+
+def test_a_cancelled_async_waiter_passes_its_wakeup_on():
+    limiter = AIMDConcurrencyLimiter(initial=1)
+
+    async def scenario():
+        assert await limiter.acquire_async()
+        first = asyncio.ensure_future(limiter.acquire_async())
+        second = asyncio.ensure_future(limiter.acquire_async())
+        await asyncio.sleep(0)
+        limiter.release(FAILED)  # Wakes `first`...
+        first.cancel()           # ...which is cancelled before it runs
+        return await asyncio.wait_for(second, 1.0)
+
+    assert asyncio.run(scenario())
+    assert limiter.in_flight == 1
+
+
+def test_async_acquire_times_out():
+    limiter = AIMDConcurrencyLimiter(initial=1)
+
+    async def scenario():
+        await limiter.acquire_async()
+        return await limiter.acquire_async(timeout=0.05)
+
+    assert asyncio.run(scenario()) is False
+    assert not limiter._async_waiters
+
+
+def test_slot_refuses_a_quota_wait_past_the_deadline():
+    limiter = ModelRateLimiter(requests_per_minute=1, tokens_per_minute=1_000_000)
+    with limiter.slot("first", timeout=1.0):
+        pass
+    with pytest.raises(RateLimitedError):
+        with limiter.slot("second", timeout=1.0):
+            pass
+    # The refused call gave its reservation back, so the next wait is still ~60s, not ~120s
+    assert limiter.requests.reserve(1) == pytest.approx(60.0, abs=1.0)
+
+
+def test_slot_timeout_reports_the_time_left_for_the_call():
+    limiter = ModelRateLimiter(requests_per_minute=1_000, tokens_per_minute=1_000_000, max_concurrency=1)
+    with limiter.slot("prompt", timeout=5.0) as slot:
+        assert 4.5 < slot.timeout <= 5.0
+        with pytest.raises(DeadlineExceededError):
+            with limiter.slot("prompt", timeout=0.05):
+                pass
+    assert limiter.concurrency.in_flight == 0
+
+
+def test_slot_settles_tokens_and_feeds_throttling_back():
+    class Response:
+        total_tokens = 10
+
+    limiter = ModelRateLimiter(requests_per_minute=1_000, tokens_per_minute=10_000, expected_output_tokens=800)
+    with limiter.slot("x" * 400) as slot:
+        slot.record_usage(Response())
+    assert limiter.tokens._tokens == pytest.approx(10_000 - 10, abs=5)
+    with pytest.raises(ResourceExhausted):
+        with limiter.slot("prompt"):
+            raise ResourceExhausted()
+    assert limiter.concurrency.limit == 2
@@ -0,0 +1,140 @@
+import asyncio
+import time
+
+import pytest
+
+from gemini_api.errors import (
+    CircuitOpenError, DeadlineExceededError, InvalidRequestError, RateLimitedError, TransientGenerationError,
+)
+from gemini_api.resilience import CircuitBreaker, RetryPolicy, call_with_retry, call_with_retry_async, classify_exception
+
+FAST = RetryPolicy(max_attempts=3, base_delay=0.001, max_delay=0.001, deadline=5.0)
+
+
+class ServiceUnavailable(Exception):
+    pass
+
+
+class HTTPError(Exception):
+    def __init__(self, code):
+        super().__init__(f"HTTP {code}")
+        self.code = code
+
+
+class Flaky:
+    """Fails with the given exceptions in turn, then returns "ok"; records the timeouts it was given."""
+
+    def __init__(self, *errors):
+        self.errors = list(errors)
+        self.timeouts = []
+
+    def __call__(self, timeout):
+        self.timeouts.append(timeout)
+        if self.errors:
+            raise self.errors.pop(0)
+        return "ok"
+
+
+@pytest.mark.parametrize("exception, expected", [
+    (TimeoutError(), DeadlineExceededError),
+    (asyncio.TimeoutError(), DeadlineExceededError),
+    (HTTPError(504), DeadlineExceededError),
+    (HTTPError(429), RateLimitedError),
+    (ServiceUnavailable(), TransientGenerationError),
+    (ConnectionResetError(), TransientGenerationError),
+    (HTTPError(503), TransientGenerationError),
+    (HTTPError(400), InvalidRequestError),
+    (ValueError("bad prompt"), InvalidRequestError),
+])
+def test_classify_exception(exception, expected):
+    assert type(classify_exception(exception)) is expected
+
+
+def test_transient_errors_are_retried():
+    fn = Flaky(ServiceUnavailable(), HTTPError(429))
+    assert call_with_retry(fn, FAST) == "ok"
+    assert len(fn.timeouts) == 3
+    assert all(0 < timeout <= FAST.deadline for timeout in fn.timeouts)
+    assert fn.timeouts == sorted(fn.timeouts, reverse=True)
+
+
+def test_invalid_requests_are_not_retried():
+    fn = Flaky(ValueError("bad prompt"))
+    with pytest.raises(InvalidRequestError):
+        call_with_retry(fn, FAST)
+    assert len(fn.timeouts) == 1
+
+
+def test_gives_up_after_max_attempts():
+    fn = Flaky(*[ServiceUnavailable()] * 5)
+    with pytest.raises(TransientGenerationError) as excinfo:
+        call_with_retry(fn, FAST)
+    assert len(fn.timeouts) == 3
+    assert isinstance(excinfo.value.__cause__, ServiceUnavailable)
+
+
+def test_does_not_sleep_past_the_deadline():
+    policy = RetryPolicy(max_attempts=5, base_delay=10.0, max_delay=10.0, deadline=0.5)
+    fn = Flaky(*[ServiceUnavailable()] * 5)
+    started = time.monotonic()
+    with pytest.raises(TransientGenerationError):
+        call_with_retry(fn, policy)
+    assert time.monotonic() - started < 0.5
+
+
+def test_breaker_opens_after_consecutive_failures_and_probes_after_reset():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+    for _ in range(2):
+        with pytest.raises(TransientGenerationError):
+            call_with_retry(Flaky(ServiceUnavailable()), RetryPolicy(max_attempts=1), breaker)
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        call_with_retry(Flaky(), FAST, breaker)
+    time.sleep(0.06)
+    breaker.before_call()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    with pytest.raises(CircuitOpenError):  # Only one probe at a time
+        breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_a_failed_probe_reopens_the_circuit():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.01)
+    breaker.record_failure(TransientGenerationError("down"))
+    time.sleep(0.02)
+    breaker.before_call()
+    breaker.record_failure(TransientGenerationError("still down"))
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def test_rate_limits_and_invalid_requests_do_not_trip_the_breaker():
+    breaker = CircuitBreaker(failure_threshold=1)
+    breaker.record_failure(RateLimitedError("429"))
+    breaker.record_failure(InvalidRequestError("400"))
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_async_attempts_are_bounded_by_the_deadline():
+    calls = []
+
+    async def hang(timeout):
+        calls.append(timeout)
+        await asyncio.sleep(10)
+
+    policy = RetryPolicy(max_attempts=3, base_delay=0.001, max_delay=0.001, deadline=0.2)
+    started = time.monotonic()
+    with pytest.raises(DeadlineExceededError):
+        asyncio.run(call_with_retry_async(hang, policy))
+    assert time.monotonic() - started < 1.0
+    assert calls
+
+
+def test_async_retries_transient_errors():
+    fn = Flaky(ServiceUnavailable())
+
+    async def attempt(timeout):
+        return fn(timeout)
+
+    assert asyncio.run(call_with_retry_async(attempt, FAST)) == "ok"
+    assert len(fn.timeouts) == 2
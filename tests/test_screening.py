@@ -0,0 +1,61 @@
+import ats_scoring
+from screening import critique_top, screen
+
+JD = "Data Engineer building Spark and Python pipelines on AWS with Airflow and SQL."
+RESUMES = {
+    "alice.txt": "Data engineer. Python, Spark, Airflow and SQL on AWS; built ETL pipelines.",
+    "bob.txt": "Frontend developer. React, TypeScript and CSS.",
+    "carol.txt": "Backend developer. Python and PostgreSQL on AWS, deployed with k8s.",
+    "dave.txt": "Backend developer. Python and SQL on AWS. Spark.",
+    "erin.txt": "",
+}
+REQUIRED = "Python, Spark, AWS, SQL"
+NICE = "Airflow, Kubernetes, data pipelines"
+
+
+def test_scores_equal_the_ats_estimator():
+    result = screen(RESUMES, REQUIRED, NICE, job_description=JD)
+    for candidate in result.candidates:
+        expected = ats_scoring.score_text(RESUMES[candidate.candidate_id], REQUIRED, NICE)
+        assert candidate.score == expected.score
+        assert candidate.required_coverage == expected.required_coverage
+        assert candidate.missing_required == expected.missing_required
+        assert candidate.missing_optional == expected.missing_optional
+
+
+def test_candidates_are_ranked_by_score_then_coverage_then_similarity():
+    result = screen(RESUMES, REQUIRED, NICE, job_description=JD)
+    keys = [(-c.score, -c.required_coverage, -c.similarity) for c in result.candidates]
+    assert keys == sorted(keys)
+    assert [c.rank for c in result.candidates] == [1, 2, 3, 4, 5]
+    assert result.candidates[0].candidate_id == "alice.txt"
+    assert result.candidates[-1].candidate_id in {"bob.txt", "erin.txt"}
+    assert all(0.0 <= c.similarity <= 1.0 for c in result.candidates)
+    assert len(result.rows()) == 5 and result.rows()[0]["Candidate"] == "alice.txt"
+
+
+def test_similarity_breaks_ties():
+    resumes = {"short": "Python", "close": "Python Spark pipelines on AWS with Airflow"}
+    result = screen(resumes, "Python", job_description=JD)
+    assert [c.score for c in result.candidates] == [100.0, 100.0]
+    assert result.candidates[0].candidate_id == "close"
+
+
+def test_keywords_are_derived_from_the_job_description_when_none_are_given():
+    result = screen(RESUMES, "", job_description=JD)
+    assert {"Python", "Spark", "AWS"} <= {term.display for term in result.keyword_set.terms}
+    assert result.candidates[0].candidate_id == "alice.txt"
+
+
+def test_critique_top_only_critiques_the_top_candidates():
+    result = screen(RESUMES, REQUIRED, NICE, job_description=JD)
+    seen = []
+
+    def critique(text, section_type, job_title):
+        seen.append(text)
+        return f"{section_type} for {job_title}"
+
+    pairs = critique_top(result, RESUMES, "Data Engineer", n=2, critique=critique)
+    assert [candidate.rank for candidate, _ in pairs] == [1, 2]
+    assert pairs[0][1] == "Full Resume for Data Engineer"
+    assert sorted(seen) == sorted(RESUMES[c.candidate_id] for c in result.top(2))
@@ -0,0 +1,109 @@
+import random
+
+from undo_history import UndoHistory
+
+DEFAULTS = {"name": "", "title": "", "experience": ""}
+
+
+def _state(**values):
+    return {**DEFAULTS, **values}
+
+
+def test_undo_and_redo_walk_the_pushed_states():
+    history = UndoHistory(DEFAULTS)
+    states = [_state(), _state(name="Ada"), _state(name="Ada", title="Engineer"), _state(title="Engineer")]
+    for state in states:
+        assert history.push(state)
+    assert not history.push(states[-1])
+    assert [history.undo() for _ in range(4)] == [states[2], states[1], states[0], None]
+    assert not history.can_undo() and history.can_redo()
+    assert [history.redo() for _ in range(4)] == [states[1], states[2], states[3], None]
+    assert len(history) == 4 and history.position == 3
+
+
+def test_missing_fields_take_their_defaults():
+    history = UndoHistory(DEFAULTS)
+    history.push({"name": "Ada", "unrelated": 1})
+    history.push(_state(name="Grace"))
+    assert history.undo() == _state(name="Ada")
+
+
+def test_unsaved_edits_are_pushed_before_undo_so_redo_returns_to_them():
+    history = UndoHistory(DEFAULTS)
+    history.push(_state())
+    edited = _state(experience="10 years")
+    assert history.can_undo(edited)
+    assert history.undo(edited) == _state()
+    assert history.redo(_state()) == edited
+
+
+def test_an_edit_after_undo_discards_the_redo_branch():
+    history = UndoHistory(DEFAULTS)
+    for name in ("A", "B", "C"):
+        history.push(_state(name=name))
+    history.undo()
+    history.undo()
+    assert history.redo(_state(name="D")) is None  # The edit is recorded instead
+    assert not history.can_redo()
+    assert history.undo() == _state(name="A")
+
+
+def test_the_buffer_is_bounded_by_bytes_and_drops_the_oldest_steps():
+    history = UndoHistory(DEFAULTS, capacity_bytes=20_000)
+    for i in range(50):
+        history.push(_state(experience=f"{i} " + "x" * 1000))
+    assert history.nbytes <= 20_000 and 1 < len(history) < 50
+    while history.can_undo():
+        oldest = history.undo()
+    assert oldest == _state(experience=f"{50 - len(history)} " + "x" * 1000)
+
+
+def test_a_single_oversized_step_is_still_kept():
+    history = UndoHistory(DEFAULTS, capacity_bytes=100)
+    history.push(_state())
+    history.push(_state(experience="x" * 10_000))
+    assert history.undo() == _state()
+
+
+def test_matches_a_list_of_full_snapshots():
+    rng = random.Random(7)
+    history = UndoHistory(DEFAULTS)
+    states, position = [], -1  # Reference model: every state, and the index of the current one
+    current = _state()
+    for _ in range(500):
+        action = rng.choice(["edit", "push", "undo", "redo"])
+        if action == "edit":
+            current = {**current, rng.choice(list(DEFAULTS)): rng.choice(["", "a", "b", "c"])}
+        elif action == "push":
+            if history.push(current):
+                del states[position + 1:]
+                states.append(dict(current))
+                position += 1
+            else:
+                assert states[position] == current
+        elif action == "undo":
+            if position >= 0 and current != states[position]:
+                del states[position + 1:]
+                states.append(dict(current))
+                position += 1
+            restored = history.undo(current)
+            if position > 0:
+                position -= 1
+                assert restored == states[position]
+                current = restored
+            else:
+                assert restored is None
+        else:
+            restored = history.redo(current)
+            if position >= 0 and current != states[position]:
+                del states[position + 1:]
+                states.append(dict(current))
+                position += 1
+                assert restored is None
+            elif position + 1 < len(states):
+                position += 1
+                assert restored == states[position]
+                current = restored
+            else:
+                assert restored is None
+        assert history.position == max(position, 0) and len(history) == len(states)
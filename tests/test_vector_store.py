@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+import vector_store
+from vector_store import VectorStore, embed, similarity
+
+DOCS = {
+    "py": "Senior Python developer building Django REST APIs on AWS",
+    "js": "Frontend engineer writing React and TypeScript user interfaces",
+    "ml": "Machine learning engineer training PyTorch models in Python",
+    "chef": "Head chef running a busy Italian restaurant kitchen",
+}
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = VectorStore(str(tmp_path / "vectors" / "store"))
+    for doc_id, text in DOCS.items():
+        store.add(doc_id, text, {"user": "alice" if doc_id != "chef" else "bob"})
+    return store
+
+
+def test_embed_is_unit_length_and_deterministic():
+    vector = embed("Python developer")
+    assert vector.dtype == np.float32 and vector.shape == (vector_store.DIMENSIONS,)
+    assert np.linalg.norm(vector) == pytest.approx(1.0, abs=1e-5)
+    assert np.array_equal(vector, embed("python developers"))
+    assert not embed("").any()
+
+
+def test_similarity_is_clamped_to_unit_range():
+    assert similarity("Python developer", "Python developer") == pytest.approx(1.0, abs=1e-4)
+    assert 0.0 <= similarity("Python developer", "Italian restaurant kitchen") < 0.2
+    assert similarity("", "anything") == 0.0
+
+
+def test_search_ranks_by_cosine_similarity(store):
+    hits = store.search("Python Django developer", k=2)
+    assert [doc_id for doc_id, _, _ in hits] == ["py", "ml"]
+    assert hits[0][1] >= hits[1][1] and hits[0][2] == {"user": "alice"}
+    assert len(store.search("anything at all", k=10)) == 4
+    assert store.search("") == []
+
+
+def test_where_and_exclude_filter_results(store):
+    assert [doc_id for doc_id, _, _ in store.search("python", k=5, where=lambda m: m["user"] == "bob")] == ["chef"]
+    assert "py" not in [doc_id for doc_id, _, _ in store.search("Python Django", k=5, exclude="py")]
+
+
+def test_re_adding_replaces_and_remove_hides(store):
+    store.add("js", "Italian pastry chef")
+    assert len(store) == 4
+    assert {doc_id for doc_id, _, _ in store.search("Italian kitchen chef", k=2)} == {"js", "chef"}
+    store.remove("chef")
+    assert "chef" not in store and len(store) == 3
+    assert "chef" not in [doc_id for doc_id, _, _ in store.search("Italian restaurant kitchen", k=5)]
+
+
+def test_reopening_and_other_instances_see_writes(store, tmp_path):
+    other = VectorStore(store.path)
+    assert len(other) == 4
+    store.add("go", "Go microservices engineer")
+    store.remove("js")
+    other.refresh()
+    assert "go" in other and "js" not in other
+    assert other.search("Go microservices", k=1)[0][0] == "go"
+
+
+def test_compaction_keeps_results_and_is_picked_up_by_readers(store, monkeypatch):
+    monkeypatch.setattr(vector_store, "COMPACT_MIN_DEAD", 4)
+    reader = VectorStore(store.path)
+    before = store.search("Python engineer", k=4)
+    for _ in range(4):
+        store.add("js", DOCS["js"], {"user": "alice"})  # Each re-add leaves a dead row behind
+    assert len(store._matrix) == 4 and store._generation == 1
+    assert store.search("Python engineer", k=4) == before
+    assert reader.search("Python engineer", k=4) == before
+    assert reader._generation == 1
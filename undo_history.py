@@ -0,0 +1,147 @@
+"""
+Compact undo/redo history of form inputs.
+
+Instead of a full copy of every field per saved state, the history keeps one snapshot (the
+state at the current position) and a ring buffer of field-level deltas: for each step, only
+the fields that changed, with their values before and after. Undo applies a delta backwards,
+redo applies it forwards, and both are O(changed fields). Pushing a state is O(fields) to
+diff and O(1) to append; the buffer is bounded by the bytes its deltas hold rather than by a
+number of states, so many small edits are kept while a few large text areas cannot exhaust
+a session's memory. The oldest deltas are dropped first.
+
+    history = UndoHistory({"name_input": "", "experience_input": ""})
+    history.push(form_values)            # e.g. before Generate or Clear
+    form_values = history.undo(form_values)
+    form_values = history.redo(form_values)
+"""
+import sys
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional
+
+CAPACITY_BYTES = 256 * 1024
+
+
+@dataclass(frozen=True)
+class Delta:
+    """The fields changed by one step: field -> (value before, value after)."""
+    changes: dict
+    size: int
+
+
+def _delta_size(changes: dict) -> int:
+    # Counts both sides, although consecutive deltas usually share the same string objects
+    return sys.getsizeof(changes) + sum(sys.getsizeof(old) + sys.getsizeof(new) for old, new in changes.values())
+
+
+class UndoHistory:
+    """Undo/redo over snapshots of a fixed set of fields, stored as deltas in a byte-bounded ring buffer."""
+
+    def __init__(self, defaults: dict, capacity_bytes: int = CAPACITY_BYTES):
+        """
+        Args:
+            defaults (dict): The tracked fields and the value used when a state lacks one.
+            capacity_bytes (int): Maximum bytes held by the deltas.
+        """
+        self.defaults = dict(defaults)
+        self.capacity_bytes = capacity_bytes
+        self._snapshot: Optional[dict] = None   # State at the current position
+        self._deltas: deque = deque()
+        self._position = 0                      # Deltas before this index are applied; the rest can be redone
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        """Number of states that can be reached."""
+        return 0 if self._snapshot is None else len(self._deltas) + 1
+
+    @property
+    def position(self) -> int:
+        """Index of the current state, 0 being the oldest one kept."""
+        return self._position
+
+    @property
+    def nbytes(self) -> int:
+        return self._bytes
+
+    def _normalize(self, state: dict) -> dict:
+        return {field: state.get(field, default) for field, default in self.defaults.items()}
+
+    def _diff(self, state: dict) -> dict:
+        return {field: (self._snapshot[field], value) for field, value in self._normalize(state).items()
+                if value != self._snapshot[field]}
+
+    def push(self, state: dict) -> bool:
+        """
+        Records a state as the newest one, discarding anything that could be redone.
+
+        Returns:
+            bool: False if the state equals the current one (nothing is recorded).
+        """
+        if self._snapshot is None:
+            self._snapshot = self._normalize(state)
+            return True
+        changes = self._diff(state)
+        if not changes:
+            return False
+        while len(self._deltas) > self._position:
+            self._bytes -= self._deltas.pop().size   # A new edit invalidates the redo branch
+        delta = Delta(changes, _delta_size(changes))
+        self._deltas.append(delta)
+        self._bytes += delta.size
+        self._position += 1
+        for field, (_, new) in changes.items():
+            self._snapshot[field] = new
+        while self._bytes > self.capacity_bytes and len(self._deltas) > 1:
+            self._bytes -= self._deltas.popleft().size
+            self._position -= 1
+        return True
+
+    def can_undo(self, state: Optional[dict] = None) -> bool:
+        """True if `undo` would change the form (`state` being its current values)."""
+        if self._snapshot is None:
+            return False
+        return self._position > 0 or (state is not None and bool(self._diff(state)))
+
+    def can_redo(self) -> bool:
+        return self._position < len(self._deltas)
+
+    def undo(self, state: Optional[dict] = None) -> Optional[dict]:
+        """
+        Steps back one state.
+
+        Args:
+            state (dict): The form's current values. Unsaved edits are pushed first, so redo
+                can return to them.
+
+        Returns:
+            dict: The state to restore, or None if there is nothing to undo.
+        """
+        if state is not None and self._snapshot is not None:
+            self.push(state)
+        if self._position == 0:
+            return None
+        self._position -= 1
+        for field, (old, _) in self._deltas[self._position].changes.items():
+            self._snapshot[field] = old
+        return dict(self._snapshot)
+
+    def redo(self, state: Optional[dict] = None) -> Optional[dict]:
+        """
+        Steps forward one state.
+
+        Args:
+            state (dict): The form's current values. If they were edited since the last undo,
+                the edit is recorded and replaces the redo branch.
+
+        Returns:
+            dict: The state to restore, or None if there is nothing to redo.
+        """
+        if state is not None and self._snapshot is not None and self._diff(state):
+            self.push(state)
+            return None
+        if self._position == len(self._deltas):
+            return None
+        for field, (_, new) in self._deltas[self._position].changes.items():
+            self._snapshot[field] = new
+        self._position += 1
+        return dict(self._snapshot)
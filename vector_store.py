@@ -0,0 +1,312 @@
+"""
+Offline text similarity: hashed n-gram vectors and a memory-mapped vector store.
+
+`embed` turns any text into a fixed-size, L2-normalized float32 vector without a model or
+an external service: character n-grams (3-5, within word boundaries) capture spelling
+variants and shared stems, word uni/bi-grams capture terms and short phrases, and every
+feature is hashed (CRC-32, stable across processes) into DIMENSIONS signed buckets. The
+cosine of two vectors is then a cheap "how alike are these texts" score for resumes, job
+descriptions and stored generations.
+
+`VectorStore` keeps vectors in one append-only file of raw float32 rows behind a small
+header, and ids/metadata in a JSON-lines sidecar. The matrix is mapped with `numpy.memmap`
+instead of read, so its pages are loaded only when searched and are shared by every
+Streamlit worker on the host through the OS page cache. The sidecar is read once when the
+store is opened; after that only the lines appended since the last refresh are parsed.
+Replaced and removed vectors are dropped by `compact`, which runs on its own once they make
+up COMPACT_DEAD_SHARE of the file:
+
+    store = VectorStore(".vmd_cache/vectors/history")
+    store.add("doc-1", "Senior data engineer ...", {"title": "Resume Summary"})
+    store.search("python data pipelines", k=5)   # -> [(doc_id, cosine, metadata), ...]
+
+Requires NumPy.
+"""
+import json
+import os
+import struct
+import threading
+import zlib
+from collections import Counter
+from contextlib import contextmanager
+from typing import Callable, Optional
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: appends are still serialized within one process
+    fcntl = None
+
+import ats_scoring
+
+DIMENSIONS = 2048
+CHAR_NGRAMS = (3, 4, 5)
+WORD_NGRAMS = (1, 2)
+CHAR_WEIGHT = 0.5       # Share of the vector norm given to character n-grams (the rest goes to words)
+SEARCH_BLOCK_ROWS = 65536
+COMPACT_DEAD_SHARE = 0.5   # Compact once replaced/removed rows are this share of the file...
+COMPACT_MIN_DEAD = 256     # ...and at least this many
+
+_MAGIC = b"VMDVEC\x00\x01"
+_HEADER = struct.Struct("<8sIII")  # magic, dimensions, rows, generation (bumped by every compaction)
+_HEADER_SIZE = 64                  # Header is padded so rows stay 64-byte aligned
+
+
+# --- Vectorizer ---
+
+def _features(tokens: list) -> tuple:
+    """Character n-grams (per word, with boundary markers) and word n-grams of a token list."""
+    chars = []
+    for token in tokens:
+        padded = f"<{token}>"
+        for n in CHAR_NGRAMS:
+            chars.extend(padded[i:i + n] for i in range(len(padded) - n + 1))
+    words = []
+    for n in WORD_NGRAMS:
+        words.extend(" ".join(tokens[i:i + n]) for i in range(len(tokens) - n + 1))
+    return chars, words
+
+
+def _hashed(features: list, prefix: bytes) -> np.ndarray:
+    """Sublinear-tf signed feature hashing into a unit-length vector."""
+    vector = np.zeros(DIMENSIONS, dtype=np.float32)
+    if not features:
+        return vector
+    counts = Counter(features)
+    hashes = np.fromiter((zlib.crc32(prefix + feature.encode("utf-8")) for feature in counts), dtype=np.uint32, count=len(counts))
+    weights = np.log1p(np.fromiter(counts.values(), dtype=np.float32, count=len(counts)))
+    signs = np.where(hashes & 0x80000000, -1.0, 1.0).astype(np.float32)
+    vector += np.bincount(hashes % DIMENSIONS, weights=weights * signs, minlength=DIMENSIONS).astype(np.float32)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+def embed(text: str) -> np.ndarray:
+    """
+    Hashed n-gram vector of a text.
+
+    Args:
+        text (str): Any text; normalized like the ATS estimator (case, accents, plurals, versions).
+
+    Returns:
+        np.ndarray: float32 vector of DIMENSIONS values with unit L2 norm (all zeros for empty text).
+    """
+    chars, words = _features(ats_scoring.normalize_tokens(text))
+    vector = np.sqrt(CHAR_WEIGHT) * _hashed(chars, b"c") + np.sqrt(1.0 - CHAR_WEIGHT) * _hashed(words, b"w")
+    norm = np.linalg.norm(vector)
+    return (vector / norm if norm else vector).astype(np.float32)
+
+
+def similarity(text_a: str, text_b: str) -> float:
+    """Cosine similarity of two texts' hashed n-gram vectors, clamped to 0-1 (hash collisions can make it negative)."""
+    return round(min(1.0, max(0.0, float(embed(text_a) @ embed(text_b)))), 4)
+
+
+# --- Memory-mapped store ---
+
+class VectorStore:
+    """Append-only, memory-mapped store of text vectors with cosine top-k search."""
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): Base path; the store is `<path>.f32` (vectors) plus `<path>.jsonl` (ids and
+                metadata) and `<path>.lock`, which serializes writers across processes.
+        """
+        self.path = path
+        self._data_path = f"{path}.f32"
+        self._meta_path = f"{path}.jsonl"
+        self._lock_path = f"{path}.lock"
+        self._lock = threading.Lock()
+        self._reset(0)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._file_lock(exclusive=True):
+            if not os.path.exists(self._data_path):
+                with open(self._data_path, "wb") as f:
+                    f.write(_HEADER.pack(_MAGIC, DIMENSIONS, 0, 0).ljust(_HEADER_SIZE, b"\0"))
+        self.refresh()
+
+    def __len__(self) -> int:
+        return len(self._live)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._live
+
+    def _reset(self, generation: int) -> None:
+        self._generation = generation
+        self._matrix = np.zeros((0, DIMENSIONS), dtype=np.float32)
+        self._live: dict = {}       # doc id -> row of its newest vector
+        self._entries: dict = {}    # live row -> (doc id, metadata)
+        self._alive = np.zeros(0, dtype=bool)
+        self._meta_offset = 0
+
+    @contextmanager
+    def _file_lock(self, exclusive: bool):
+        """Shared (readers) or exclusive (writers, compaction) lock on the store's files."""
+        if fcntl is None:  # Windows: writers are still serialized within one process
+            yield
+            return
+        with open(self._lock_path, "a+b") as f:
+            fcntl.flock(f, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            yield
+
+    def _read_header(self) -> tuple:
+        with open(self._data_path, "rb") as f:
+            magic, dimensions, rows, generation = _HEADER.unpack(f.read(_HEADER.size))
+        if magic != _MAGIC:
+            raise ValueError(f"{self._data_path} is not a VMD vector store")
+        if dimensions != DIMENSIONS:
+            raise ValueError(f"{self._data_path} holds {dimensions}-d vectors, expected {DIMENSIONS}")
+        return rows, generation
+
+    def _set_alive(self, row: int, alive: bool) -> None:
+        if row >= len(self._alive):
+            grown = np.zeros(max(row + 1, 2 * len(self._alive), 1024), dtype=bool)
+            grown[:len(self._alive)] = self._alive
+            self._alive = grown
+        self._alive[row] = alive
+
+    def _apply(self, entry: dict) -> None:
+        """Applies one sidecar line to the in-memory index."""
+        doc_id = entry.get("deleted", entry.get("id"))
+        old_row = self._live.pop(doc_id, None)
+        if old_row is not None:
+            del self._entries[old_row]
+            self._set_alive(old_row, False)
+        if "deleted" not in entry:
+            row = entry["row"]
+            self._live[doc_id] = row
+            self._entries[row] = (doc_id, entry.get("metadata", {}))
+            self._set_alive(row, True)
+
+    def _sync(self) -> None:
+        """Catches up with the files. Caller holds `_lock` and a file lock."""
+        rows, generation = self._read_header()
+        if generation != self._generation:
+            self._reset(generation)  # Compacted by another process: rows were renumbered
+        if os.path.exists(self._meta_path) and os.path.getsize(self._meta_path) > self._meta_offset:
+            with open(self._meta_path, "rb") as f:
+                f.seek(self._meta_offset)
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break  # Still being written; read it next time
+                    self._meta_offset += len(line)
+                    self._apply(json.loads(line))
+        if rows != len(self._matrix):
+            # Zero-copy: pages are read (and shared between processes) only when searched
+            self._matrix = np.memmap(self._data_path, dtype=np.float32, mode="r", offset=_HEADER_SIZE,
+                                     shape=(rows, DIMENSIONS)) if rows else np.zeros((0, DIMENSIONS), dtype=np.float32)
+
+    def refresh(self) -> None:
+        """Picks up vectors appended since the last refresh (e.g. by another worker process)."""
+        with self._lock, self._file_lock(exclusive=False):
+            self._sync()
+
+    def _append_meta(self, entry: dict) -> None:
+        with open(self._meta_path, "a", encoding="utf-8") as meta:
+            meta.write(json.dumps(entry) + "\n")
+
+    def _compact_if_due(self) -> None:
+        rows = len(self._matrix)
+        dead = rows - len(self._live)
+        if dead >= COMPACT_MIN_DEAD and dead >= COMPACT_DEAD_SHARE * rows:
+            self._compact()
+
+    def add(self, doc_id: str, text: str, metadata: Optional[dict] = None) -> None:
+        """Embeds a text and appends it. Re-adding an id replaces its vector."""
+        vector = embed(text)
+        with self._lock, self._file_lock(exclusive=True):
+            self._sync()
+            with open(self._data_path, "r+b") as f:
+                rows, generation = _HEADER.unpack(f.read(_HEADER.size))[2:]
+                f.seek(_HEADER_SIZE + rows * DIMENSIONS * 4)
+                f.write(vector.tobytes())
+                f.flush()
+                f.seek(0)
+                f.write(_HEADER.pack(_MAGIC, DIMENSIONS, rows + 1, generation))
+            self._append_meta({"id": doc_id, "row": rows, "metadata": metadata or {}})
+            self._sync()
+            self._compact_if_due()
+
+    def remove(self, doc_id: str) -> None:
+        """Hides `doc_id` from searches; its vector is dropped by the next compaction."""
+        with self._lock, self._file_lock(exclusive=True):
+            self._append_meta({"deleted": doc_id})
+            self._sync()
+            self._compact_if_due()
+
+    def compact(self) -> None:
+        """Rewrites the store with only the newest vector of every live id."""
+        with self._lock, self._file_lock(exclusive=True):
+            self._sync()
+            self._compact()
+
+    def _compact(self) -> None:
+        # Caller holds `_lock` and the exclusive file lock; readers never see a half-written store
+        live = sorted(self._entries.items())
+        generation = self._generation + 1
+        tmp_data, tmp_meta = f"{self._data_path}.tmp", f"{self._meta_path}.tmp"
+        with open(tmp_data, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, DIMENSIONS, len(live), generation).ljust(_HEADER_SIZE, b"\0"))
+            for start in range(0, len(live), SEARCH_BLOCK_ROWS):
+                block = [row for row, _ in live[start:start + SEARCH_BLOCK_ROWS]]
+                f.write(np.ascontiguousarray(self._matrix[block]).tobytes())
+        with open(tmp_meta, "w", encoding="utf-8") as meta:
+            for new_row, (_, (doc_id, metadata)) in enumerate(live):
+                meta.write(json.dumps({"id": doc_id, "row": new_row, "metadata": metadata}) + "\n")
+        os.replace(tmp_meta, self._meta_path)
+        os.replace(tmp_data, self._data_path)
+        self._sync()
+
+    def search(self, query: str, k: int = 5, where: Optional[Callable] = None, exclude: Optional[str] = None) -> list:
+        """
+        Finds the stored texts most similar to a query.
+
+        Args:
+            query (str): Query text.
+            k (int): Number of results.
+            where (Callable): Optional `metadata -> bool` filter (e.g. only the current user's items).
+            exclude (str): Optional id to leave out (e.g. the item the query was taken from).
+
+        Returns:
+            list: (doc_id, cosine similarity, metadata) tuples, most similar first.
+        """
+        self.refresh()
+        vector = embed(query)
+        with self._lock:
+            # Snapshot: another session's add() may refresh the index while this one scores
+            matrix = self._matrix
+            rows = len(matrix)
+            alive = self._alive[:rows].copy()
+            excluded = self._live.get(exclude)
+            generation = self._generation
+        if excluded is not None and excluded < rows:
+            alive[excluded] = False
+        if not vector.any() or not alive.any():
+            return []
+        scores = np.empty(rows, dtype=np.float32)
+        for start in range(0, rows, SEARCH_BLOCK_ROWS):
+            scores[start:start + SEARCH_BLOCK_ROWS] = matrix[start:start + SEARCH_BLOCK_ROWS] @ vector
+        scores[~alive] = -np.inf
+        if where is None:
+            top = np.argpartition(-scores, min(k, rows) - 1)[:k]
+            order = top[np.argsort(-scores[top])]
+        else:
+            order = np.argsort(-scores)  # The filter is applied lazily, best candidates first
+        results = []
+        with self._lock:
+            if self._generation != generation:
+                results = None  # A compaction renumbered the rows while this query was scoring
+            else:
+                for row in order.tolist():
+                    if len(results) >= k or scores[row] == -np.inf:
+                        break
+                    entry = self._entries.get(row)
+                    if entry is None:
+                        continue  # Replaced or removed meanwhile
+                    if where is None or where(entry[1]):
+                        results.append((entry[0], round(float(scores[row]), 4), entry[1]))
+        return self.search(query, k, where, exclude) if results is None else results